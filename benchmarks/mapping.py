@@ -0,0 +1,140 @@
+"""Micro-benchmark of building DTOs from database rows.
+
+Measures DTOs per second for every entity, comparing validated
+construction (the previous `from_record` code, kept here) with the
+compiled mappers now behind `from_record`. Rows are plain mappings
+shaped like the repository query results, so no database is needed.
+With `--from-db` the rows are real `databases` records read from the
+configured database instead, which includes the cheaper column access.
+
+Usage:
+    python -m benchmarks.mapping [--rows 20000] [--repeat 5] [--from-db]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import timeit
+import uuid
+from datetime import datetime
+
+from src.db import comment_table, database, game_table, ranking_table, user_table
+from src.infrastructure.dto.commentdto import CommentDTO
+from src.infrastructure.dto.gamedto import GameDTO
+from src.infrastructure.dto.rankingdto import RankingDTO
+from src.infrastructure.dto.sessiondto import SessionDTO
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.repositories.sessiondb import _sessions_with_scores
+
+
+def make_rows(rows: int) -> dict:
+    """Build rows of every entity together with the previous `from_record` code."""
+    now = datetime.now()
+    game = {
+        "id": 1, "title": "Catan", "description": "A board game", "min_players": 3,
+        "max_players": 4, "rules_url": "http://example.com", "admin_id": uuid.uuid4(),
+    }
+    session = {
+        "id": 1, "game_id": 1, "created_by": uuid.uuid4(), "date": now,
+        "session_date": now, "note": None, "winner_id": None,
+        "scores": json.dumps({str(uuid.uuid4()): score for score in range(4)}),
+    }
+    ranking = {
+        "id": 1, "user_id": uuid.uuid4(), "game_id": 1, "games_played": 40, "wins": 12,
+        "total_score": 3200, "average_score": 80.0, "best_score": 120,
+    }
+    comment = {"id": 1, "content": "Nice game", "session_id": 1, "user_id": uuid.uuid4()}
+    user = {
+        "id": uuid.uuid4(), "email": "user@example.com", "nick": "user",
+        "password": "hash", "is_admin": False, "registration_date": now,
+    }
+    return {
+        GameDTO: ([game] * rows, _validated_game),
+        SessionDTO: ([session] * rows, _validated_session),
+        RankingDTO: ([ranking] * rows, _validated_ranking),
+        CommentDTO: ([comment] * rows, _validated_comment),
+        UserDTO: ([user] * rows, _validated_user),
+    }
+
+
+def _validated_game(record) -> GameDTO:
+    r = dict(record)
+    return GameDTO(
+        id=r.get("id"), title=r.get("title"), description=r.get("description"),
+        min_players=r.get("min_players"), max_players=r.get("max_players"),
+        rules_url=r.get("rules_url"), admin_id=r.get("admin_id"),
+    )
+
+
+def _validated_session(record) -> SessionDTO:
+    scores = record["scores"] or {}
+    if isinstance(scores, str):
+        scores = json.loads(scores)
+    return SessionDTO(
+        id=record["id"], game_id=record["game_id"], user_id=record["created_by"],
+        date=record["date"], date_added=record["session_date"], note=record["note"],
+        winner_id=record["winner_id"], scores=scores,
+    )
+
+
+def _validated_ranking(record) -> RankingDTO:
+    r = dict(record)
+    return RankingDTO(
+        user_id=r.get("user_id"), games_played=r.get("games_played"), wins=r.get("wins"),
+        best_score=r.get("best_score"), average_score=r.get("average_score"),
+    )
+
+
+def _validated_comment(record) -> CommentDTO:
+    r = dict(record)
+    return CommentDTO(id=r.get("id"), content=r.get("content"), session_id=r.get("session_id"))
+
+
+def _validated_user(record) -> UserDTO:
+    return UserDTO(
+        id=record["id"], email=record["email"], nick=record["nick"],
+        is_admin=record["is_admin"], registration_date=record["registration_date"],
+    )
+
+
+async def fetch_rows(rows: int) -> dict:
+    """Read records of every entity from the database, repeated up to `rows`."""
+    queries = {
+        GameDTO: game_table.select(),
+        SessionDTO: _sessions_with_scores(),
+        RankingDTO: ranking_table.select(),
+        CommentDTO: comment_table.select(),
+        UserDTO: user_table.select(),
+    }
+    synthetic = make_rows(0)
+    fetched = {}
+    await database.connect()
+    try:
+        for model, query in queries.items():
+            if records := await database.fetch_all(query.limit(rows)):
+                repeated = records * (rows // len(records) + 1)
+                fetched[model] = (repeated[:rows], synthetic[model][1])
+    finally:
+        await database.disconnect()
+    return fetched
+
+
+def main(rows: int, repeat: int, from_db: bool) -> None:
+    """Run the benchmark for every entity."""
+    entities = asyncio.run(fetch_rows(rows)) if from_db else make_rows(rows)
+    print(f"{'dto':<12}{'validated/s':>14}{'mapped/s':>14}{'speedup':>9}")
+    for model, (records, validated) in entities.items():
+        assert validated(records[0]) == model.from_record(records[0])
+        old = min(timeit.repeat(lambda: [validated(r) for r in records], number=1, repeat=repeat, timer=time.perf_counter))
+        new = min(timeit.repeat(lambda: [model.from_record(r) for r in records], number=1, repeat=repeat, timer=time.perf_counter))
+        print(f"{model.__name__:<12}{rows / old:>14.0f}{rows / new:>14.0f}{old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000, help="rows mapped per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement, the best is kept")
+    parser.add_argument("--from-db", action="store_true", help="map records read from the database")
+    args = parser.parse_args()
+    main(args.rows, args.repeat, args.from_db)
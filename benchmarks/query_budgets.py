@@ -0,0 +1,188 @@
+"""Check of the query budgets of all API endpoints.
+
+Drives every route of the API through an ASGI client against the local
+database configured for the app, seeded by `python -m src.cli seed`.
+Fixtures are added so that listings return full pages and sessions have
+many players; a statement per row or per player then shows up as a budget overrun.
+Caches are cleared before every request, so budgets are checked cold.
+
+The statement counts come from the query instrumentation. The report shows
+the count the middleware checks against the budget once a response is
+complete, streamed body included; overruns are the `query_budget_exceeded`
+events it logs. A streamed route must send exactly its budget, so a count
+lost with the stream fails too. Exits with status 1 when a request exceeds
+the budget of its route in `src.api.budgets`, when a streamed route misses
+it or when a route is missing from the budgets or was not exercised.
+
+Usage:
+    python -m benchmarks.query_budgets [--players 8] [--sessions 60]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+
+import httpx
+
+from src.api import middleware
+from src.api.budgets import QUERY_BUDGETS
+from src.infrastructure.utils.instrumentation import slow_query_log
+from src.main import app
+
+STREAMED_ROUTES = ("GET /sessions/export",)
+
+
+class BudgetEvents(logging.Handler):
+    """A handler collecting the budget overruns logged by the middleware."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.overruns: list[dict] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        event = json.loads(record.getMessage())
+        if event.get("event") == "query_budget_exceeded":
+            self.overruns.append(event)
+
+
+@contextmanager
+def completed_requests() -> Iterator[list[int]]:
+    """Record the statement count of every request the middleware completes."""
+    queries: list[int] = []
+    check_query_budget = middleware.check_query_budget
+
+    def record(method: str, route: str, count: int) -> bool:
+        queries.append(count)
+        return check_query_budget(method, route, count)
+
+    middleware.check_query_budget = record
+    try:
+        yield queries
+    finally:
+        middleware.check_query_budget = check_query_budget
+
+
+def api_routes() -> set[str]:
+    """Return the method and path template of every documented route."""
+    return {
+        f"{method.upper()} {path}"
+        for path, operations in app.openapi()["paths"].items()
+        for method in operations
+    }
+
+
+async def main(players: int, sessions: int) -> int:
+    """Exercise every route and report its statement counts against the budgets."""
+    handler = BudgetEvents()
+    slow_query_log.addHandler(handler)
+    counts: dict[str, int] = defaultdict(int)
+
+    async with app.router.lifespan_context(app):
+        container = app.state.container
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://budgets") as client:
+
+            async def call(method: str, template: str, expected: int, **kwargs) -> httpx.Response:
+                container.game_cache().clear()
+                container.token_version_cache().clear()
+                params = kwargs.pop("path", {})
+                with completed_requests() as queries:
+                    response = await client.request(method, template.format(**params), **kwargs)
+                    await response.aread()
+                if response.status_code != expected:
+                    raise RuntimeError(
+                        f"{method} {template} returned {response.status_code}: {response.text}"
+                    )
+                key = f"{method} {template}"
+                counts[key] = max(counts[key], *queries)
+                return response
+
+            run = uuid.uuid4().hex[:8]
+            login = await call(
+                "POST", "/auth/login", 200,
+                data={"username": "admin@test.com", "password": "admin"},
+            )
+            tokens = login.json()
+            admin = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+            player_ids = []
+            for index in range(players):
+                user = {"email": f"budget-{run}-{index}@test.com", "password": "budget", "nick": f"budget-{run}-{index}"}
+                route = "/auth/register" if index % 2 else "/users/register"
+                player_ids.append((await call("POST", route, 201, json=user)).json()["id"])
+            await call("POST", "/users/token", 200, json=user)
+
+            game = {"title": f"Budget {run}", "min_players": 1, "max_players": players}
+            game_id = (await call("POST", "/games/create", 201, json=game, headers=admin)).json()["id"]
+            await call("PUT", "/games/update/{game_id}", 200, path={"game_id": game_id}, json=game, headers=admin)
+
+            session_ids = []
+            for index in range(sessions):
+                session = {
+                    "game_id": game_id,
+                    "date": f"2024-01-01T{index // 60:02d}:{index % 60:02d}:00",
+                    "participants": player_ids,
+                    "winner_id": None,
+                    "scores": {player_id: (index + score) % players for score, player_id in enumerate(player_ids)},
+                }
+                created = await call("POST", "/sessions/add", 201, json=session, headers=admin)
+                session_ids.append(created.json()["id"])
+            for index in range(sessions):
+                await call(
+                    "POST", "/comments/add", 201,
+                    json={"session_id": session_ids[0], "content": f"comment {index}"}, headers=admin,
+                )
+
+            page = {"limit": sessions // 2}
+            await call("GET", "/games/all", 200, params=page)
+            await call("GET", "/games/random", 200, params={"players": 2, "exclude_recent": 1})
+            await call("GET", "/games/{game_id}", 200, path={"game_id": game_id})
+            await call("GET", "/sessions/all", 200, params=page)
+            await call("GET", "/sessions/export", 200)
+            await call("GET", "/sessions/export", 200, params={"format": "csv"})
+            await call("GET", "/rankings/game/{game_id}", 200, path={"game_id": game_id}, params=page)
+            await call("GET", "/rankings/user/{user_id}", 200, path={"user_id": player_ids[0]}, headers=admin)
+            await call("GET", "/comments/session/{session_id}", 200, path={"session_id": session_ids[0]}, params=page)
+            await call("GET", "/users/all", 200, params=page, headers=admin)
+            await call("POST", "/rankings/rebuild", 200, headers=admin)
+            await call("DELETE", "/sessions/delete/{session_id}", 204, path={"session_id": session_ids[0]}, headers=admin)
+            spare = {**game, "title": f"Budget {run} spare"}
+            spare_id = (await call("POST", "/games/create", 201, json=spare, headers=admin)).json()["id"]
+            await call("DELETE", "/games/{game_id}", 204, path={"game_id": spare_id}, headers=admin)
+
+            refreshed = await call("POST", "/auth/refresh", 200, json={"refresh_token": tokens["refresh_token"]})
+            admin = {"Authorization": f"Bearer {refreshed.json()['access_token']}"}
+            await call("POST", "/auth/revoke", 204, headers=admin)
+
+    slow_query_log.removeHandler(handler)
+
+    print(f"{'route':<42}{'queries':>8}{'budget':>8}")
+    for key in sorted(counts):
+        budget = QUERY_BUDGETS.get(key, "-")
+        print(f"{key:<42}{counts[key]:>8}{'none' if budget is None else budget:>8}")
+
+    failures = [f"{event['route']}: {event['queries']} queries, budget {event['budget']}" for event in handler.overruns]
+    failures += [
+        f"{route}: {counts[route]} queries, expected exactly {QUERY_BUDGETS[route]}"
+        for route in STREAMED_ROUTES
+        if route in counts and counts[route] != QUERY_BUDGETS[route]
+    ]
+    failures += [f"{route}: no budget" for route in sorted(api_routes() - QUERY_BUDGETS.keys())]
+    failures += [f"{route}: not exercised" for route in sorted(api_routes() - counts.keys())]
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=8, help="players of every fixture session")
+    parser.add_argument("--sessions", type=int, default=60, help="number of fixture sessions")
+    arguments = parser.parse_args()
+    sys.exit(asyncio.run(main(arguments.players, arguments.sessions)))
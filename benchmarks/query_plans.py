@@ -0,0 +1,265 @@
+"""Check of the query plans of the repository reads.
+
+Seeds the local database configured for the app with enough rows for the
+planner to prefer indexes, runs the repository methods serving the keyset
+pages, the per-user lookups, the session writes and the refresh tokens,
+and explains every statement they send with `EXPLAIN (FORMAT JSON)`.
+Everything runs in one transaction which is rolled back, so the database
+is left unchanged; it only needs the schema from `python -m src.cli migrate`.
+
+The lookups run through the foreign keys when a referenced row is deleted
+are explained as well. A plan fails when it reads a seeded table with a
+sequential scan or sorts more than `--rows` rows, i.e. when a query no
+longer uses its index. An
+incremental sort only orders the rows within the groups its input already
+comes sorted by, e.g. from a unique index on the leading key, and under a
+limit it stops early, so it does not fail a plan.
+Exits with status 1 when a plan fails. Every declared index is needed by
+at least one check: indexes given with `--drop` are dropped inside the
+transaction before the statements are explained, which must fail the run.
+
+Usage:
+    python -m benchmarks.query_plans [--users 5000] [--sessions 50000] [--rows 1000]
+                                     [--drop INDEX ...]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Iterator
+
+from src.core.domain.session import SessionBroker
+from sqlalchemy import select
+
+from src.db import PooledConnection, database, metadata
+from src.infrastructure.repositories.commentdb import CommentRepository
+from src.infrastructure.repositories.gamedb import GameRepository
+from src.infrastructure.repositories.rankingdb import RankingRepository
+from src.infrastructure.repositories.sessiondb import SessionRepository
+from src.infrastructure.repositories.userdb import UserRepository
+
+SEEDED_TABLES = (
+    "users", "refresh_tokens", "games", "sessions", "session_scores", "rankings", "comments",
+)
+PAGE = 50
+
+SEED = [
+    """
+    INSERT INTO users (email, password, nick)
+    SELECT 'plan-' || i || '@test.com', 'x', 'plan-' || lpad(i::text, 6, '0')
+    FROM generate_series(1, :users) AS i
+    """,
+    """
+    INSERT INTO refresh_tokens (user_id, token_hash, expires_at)
+    SELECT id, md5('plan-' || id::text || k), now() + interval '1 day'
+    FROM users, generate_series(1, 4) AS k
+    """,
+    """
+    INSERT INTO games (title, min_players, max_players, admin_id)
+    SELECT 'Plan ' || lpad(i::text, 6, '0'), 1, 4, ids[1 + i % cardinality(ids)]
+    FROM generate_series(1, :users / 2) AS i, (SELECT array_agg(id) AS ids FROM users) AS u
+    """,
+    """
+    INSERT INTO sessions (game_id, created_by, session_date, date)
+    SELECT g.ids[1 + i % cardinality(g.ids)], u.ids[1 + (i * 7) % cardinality(u.ids)],
+           now(), timestamp '2020-01-01' + i * interval '17 minutes'
+    FROM generate_series(1, :sessions) AS i,
+         (SELECT array_agg(id) AS ids FROM users) AS u,
+         (SELECT array_agg(id) AS ids FROM games) AS g
+    """,
+    """
+    INSERT INTO session_scores (session_id, user_id, score)
+    SELECT s.id, u.ids[1 + (s.id * 13 + k) % cardinality(u.ids)], (s.id + k) % 10
+    FROM sessions AS s, generate_series(1, 4) AS k, (SELECT array_agg(id) AS ids FROM users) AS u
+    """,
+    """
+    INSERT INTO rankings (user_id, game_id, games_played, wins, total_score,
+                          average_score, best_score, first_game_date, last_game_date)
+    SELECT sc.user_id, s.game_id, count(*), count(*) FILTER (WHERE sc.score > 6),
+           sum(sc.score), avg(sc.score), max(sc.score), min(s.date), max(s.date)
+    FROM session_scores AS sc JOIN sessions AS s ON s.id = sc.session_id
+    GROUP BY sc.user_id, s.game_id
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO comments (session_id, user_id, content, created_at)
+    SELECT s.ids[1 + i % 500], u.ids[1 + (i * 11) % cardinality(u.ids)], 'comment',
+           timestamp '2020-01-01' + i * interval '1 minute'
+    FROM generate_series(1, :sessions) AS i,
+         (SELECT array_agg(id) AS ids FROM users) AS u,
+         (SELECT array_agg(id) AS ids FROM sessions) AS s
+    """,
+]
+
+SAMPLES = {
+    "user_id": """
+        SELECT created_by FROM sessions JOIN users ON users.id = created_by
+        WHERE users.email LIKE 'plan-%' GROUP BY created_by ORDER BY count(*) DESC LIMIT 1
+    """,
+    "admin_id": "SELECT admin_id FROM games GROUP BY admin_id ORDER BY count(*) DESC LIMIT 1",
+    "game_id": "SELECT game_id FROM rankings GROUP BY game_id ORDER BY count(*) DESC LIMIT 1",
+    "session_id": "SELECT session_id FROM comments GROUP BY session_id ORDER BY count(*) DESC LIMIT 1",
+    "token_hash": "SELECT token_hash FROM refresh_tokens LIMIT 1",
+    "players": "SELECT array_agg(id) FROM (SELECT id FROM users LIMIT 4) AS u",
+}
+
+
+@contextmanager
+def captured_statements() -> Iterator[list[tuple[str, list]]]:
+    """Record the SQL and arguments of every statement sent through `database`."""
+    statements: list[tuple[str, list]] = []
+    compile_statement = PooledConnection._compile
+
+    def capture(self: PooledConnection, query: Any) -> tuple:
+        compiled = compile_statement(self, query)
+        statements.append((compiled[0], compiled[1]))
+        return compiled
+
+    PooledConnection._compile = capture
+    try:
+        yield statements
+    finally:
+        PooledConnection._compile = compile_statement
+
+
+def plan_failures(plan: dict, max_rows: int) -> list[str]:
+    """Return the sequential scans of seeded tables and large full sorts in a plan tree."""
+    failures = []
+    node = plan["Node Type"]
+    if node == "Seq Scan" and plan.get("Relation Name") in SEEDED_TABLES:
+        failures.append(f"Seq Scan on {plan['Relation Name']} ({plan['Plan Rows']} rows)")
+    if node == "Sort" and plan["Plan Rows"] > max_rows:
+        keys = ", ".join(plan.get("Sort Key", []))
+        failures.append(f"{node} of {plan['Plan Rows']} rows by {keys}")
+    for child in plan.get("Plans", []):
+        failures += plan_failures(child, max_rows)
+    return failures
+
+
+async def main(users: int, sessions: int, max_rows: int, dropped: list[str]) -> int:
+    """Seed the tables, explain the repository reads and report the failing plans."""
+    games = GameRepository()
+    users_repository = UserRepository()
+    session_repository = SessionRepository()
+    comments = CommentRepository()
+    rankings = RankingRepository()
+    failures: list[str] = []
+
+    await database.connect()
+    try:
+        transaction = await database.transaction()
+        try:
+            sizes = {"users": users, "sessions": sessions}
+            for statement in SEED:
+                await database.execute(
+                    statement, {name: size for name, size in sizes.items() if f":{name}" in statement}
+                )
+            for index in dropped:
+                await database.execute(f"DROP INDEX {index}")
+            for table in SEEDED_TABLES:
+                await database.execute(f"ANALYZE {table}")
+            sample = {name: await database.fetch_val(query) for name, query in SAMPLES.items()}
+            expires_at = datetime.now() + timedelta(days=1)
+
+            played = datetime.now()
+            session = SessionBroker(
+                game_id=sample["game_id"],
+                date=played,
+                participants=sample["players"],
+                winner_id=None,
+                scores={player: score for score, player in enumerate(sample["players"])},
+                user_id=sample["players"][0],
+                date_added=played,
+            )
+
+            async def second_page(method, *args) -> Any:
+                first = await method(*args, PAGE)
+                return await method(*args, PAGE, first.next_cursor)
+
+            async def export(since: datetime | None) -> None:
+                async for _ in session_repository.iterate_sessions(since):
+                    pass
+
+            # Load the sampler beforehand, a random pick reads all games only once.
+            await games.get_random_game()
+            # Deleting a row looks up the rows referencing it through every foreign key.
+            references = {
+                foreign_key: await database.fetch_val(select(foreign_key.column).limit(1))
+                for table in metadata.sorted_tables
+                for foreign_key in table.foreign_keys
+            }
+
+            checks = {
+                "games page": lambda: games.get_all(PAGE),
+                "games next page": lambda: second_page(games.get_all),
+                "games by admin": lambda: games.get_by_admin(sample["admin_id"]),
+                "game by name": lambda: games.get_by_name("Plan 000001"),
+                "random game": lambda: games.get_random_game(exclude_recent=10),
+                "users page": lambda: users_repository.get_all(PAGE),
+                "users next page": lambda: second_page(users_repository.get_all),
+                "user by email": lambda: users_repository.get_by_email("plan-1@test.com"),
+                "user token version": lambda: users_repository.get_token_version(sample["user_id"]),
+                "sessions page": lambda: session_repository.get_all_sessions(PAGE),
+                "sessions next page": lambda: second_page(session_repository.get_all_sessions),
+                "sessions by user": lambda: session_repository.get_by_user(sample["user_id"]),
+                "session by id": lambda: session_repository.get_session_by_id(sample["session_id"]),
+                "sessions export": lambda: export(None),
+                "sessions export since": lambda: export(played - timedelta(days=30)),
+                "comments page": lambda: comments.get_by_session(sample["session_id"], PAGE),
+                "comments next page": lambda: second_page(comments.get_by_session, sample["session_id"]),
+                "comments by user": lambda: comments.get_by_user(sample["user_id"]),
+                "rankings page": lambda: rankings.get_ranking_for_game(sample["game_id"], PAGE),
+                "rankings next page": lambda: second_page(rankings.get_ranking_for_game, sample["game_id"]),
+                "rankings by user": lambda: rankings.get_user_scores(sample["user_id"]),
+                "global ranking page": lambda: rankings.get_global_ranking(PAGE),
+                "global ranking next page": lambda: second_page(rankings.get_global_ranking),
+                "session add": lambda: session_repository.add_session(session),
+                "session delete": lambda: session_repository.delete_session(sample["session_id"]),
+                "refresh token rotation": lambda: users_repository.rotate_refresh_token(
+                    sample["token_hash"], "plan-rotated", expires_at,
+                ),
+                "refresh token issue": lambda: users_repository.add_refresh_token(
+                    sample["user_id"], "plan-issued", expires_at,
+                ),
+                "token revocation": lambda: users_repository.bump_token_version(sample["user_id"]),
+            }
+            for foreign_key, key in references.items():
+                column = foreign_key.parent
+                checks[f"{column.table.name}.{column.name} reference"] = (
+                    lambda column=column, key=key: database.fetch_all(select(column).where(column == key))
+                )
+
+            raw = database.connection().raw_connection
+            print(f"{'query':<38}{'statements':>11}  plan")
+            for name, call in checks.items():
+                with captured_statements() as statements:
+                    await call()
+                found = []
+                for statement, args in statements:
+                    explained = json.loads(await raw.fetchval(f"EXPLAIN (FORMAT JSON) {statement}", *args))
+                    found += plan_failures(explained[0]["Plan"], max_rows)
+                print(f"{name:<38}{len(statements):>11}  {'FAIL' if found else 'ok'}")
+                failures += [f"{name}: {failure}" for failure in found]
+        finally:
+            await transaction.rollback()
+    finally:
+        await database.disconnect()
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000, help="number of seeded users")
+    parser.add_argument("--sessions", type=int, default=50000, help="number of seeded sessions and comments")
+    parser.add_argument("--rows", type=int, default=1000, help="largest sort allowed in a plan")
+    parser.add_argument(
+        "--drop", action="append", default=[], metavar="INDEX", help="index dropped before explaining",
+    )
+    arguments = parser.parse_args()
+    sys.exit(asyncio.run(main(arguments.users, arguments.sessions, arguments.rows, arguments.drop)))
@@ -0,0 +1,103 @@
+"""Benchmark of the list endpoint response paths.
+
+Compares the requests per second of FastAPI validating DTO lists against
+`response_model` (the previous behaviour) with `dto_response` encoding
+them straight to JSON, for every DTO served by a list endpoint and for
+the default and maximum page sizes. No database is needed.
+
+Usage:
+    python -m benchmarks.serialization [--seconds 2.0]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime
+
+import httpx
+from fastapi import FastAPI
+
+from src.api.dependencies import dto_response
+from src.infrastructure.dto.commentdto import CommentDTO
+from src.infrastructure.dto.gamedto import GameDTO
+from src.infrastructure.dto.rankingdto import RankingDTO
+from src.infrastructure.dto.sessiondto import SessionDTO
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+
+def make_items(model: type, size: int) -> list:
+    """Build a list of DTOs with realistic field values."""
+    now = datetime.now()
+    factories = {
+        GameDTO: lambda i: GameDTO(
+            id=i, title=f"Game {i}", description="A board game " * 4,
+            min_players=2, max_players=5, rules_url="http://example.com/rules",
+            admin_id=uuid.uuid4(),
+        ),
+        SessionDTO: lambda i: SessionDTO(
+            id=i, game_id=i % 20, user_id=uuid.uuid4(), date=now, date_added=now,
+            note="Close game", winner_id=None,
+            scores={uuid.uuid4(): score for score in range(4)},
+        ),
+        RankingDTO: lambda i: RankingDTO(
+            user_id=uuid.uuid4(), games_played=40, wins=i % 40,
+            best_score=120, average_score=81.5,
+        ),
+        CommentDTO: lambda i: CommentDTO(id=i, content="Nice game " * 5, session_id=i),
+        UserDTO: lambda i: UserDTO(
+            id=uuid.uuid4(), email=f"user{i}@example.com", nick=f"user{i}",
+            is_admin=False, registration_date=now,
+        ),
+    }
+    return [factories[model](i) for i in range(size)]
+
+
+def build_app(model: type, items: list) -> FastAPI:
+    """Build an app serving the same items through both paths."""
+    app = FastAPI()
+
+    @app.get("/validated", response_model=list[model])
+    async def validated() -> list:
+        return items
+
+    @app.get("/encoded", response_model=list[model])
+    async def encoded():
+        return dto_response(items)
+
+    return app
+
+
+async def requests_per_second(app: FastAPI, path: str, seconds: float) -> float:
+    """Issue sequential requests for a fixed time and return their rate."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get(path)
+        count = 0
+        started = time.perf_counter()
+        while (elapsed := time.perf_counter() - started) < seconds:
+            response = await client.get(path)
+            response.raise_for_status()
+            count += 1
+    return count / elapsed
+
+
+async def main(seconds: float) -> None:
+    """Run the benchmark for every DTO and page size."""
+    print(f"{'dto':<12}{'items':>6}{'validated rps':>16}{'encoded rps':>14}{'speedup':>9}")
+    for model in (GameDTO, SessionDTO, RankingDTO, CommentDTO, UserDTO):
+        for size in (DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE):
+            app = build_app(model, make_items(model, size))
+            validated = await requests_per_second(app, "/validated", seconds)
+            encoded = await requests_per_second(app, "/encoded", seconds)
+            print(
+                f"{model.__name__:<12}{size:>6}{validated:>16.0f}"
+                f"{encoded:>14.0f}{encoded / validated:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="duration of each measurement")
+    asyncio.run(main(parser.parse_args().seconds))
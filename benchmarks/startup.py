@@ -0,0 +1,98 @@
+"""Benchmark of the worker startup time.
+
+Measures, in fresh interpreters, the time to import `src.main` (with the
+slowest modules reported by `-X importtime`) and the time from spawning a
+uvicorn worker until it answers its first request, which includes the
+lifespan startup. The app uses the database and backend configured in
+the environment.
+
+Usage:
+    python -m benchmarks.startup [--runs 5] [--path /ready]
+"""
+
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import src.main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def import_seconds() -> float:
+    """Import the app in a fresh interpreter and return the duration."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET], capture_output=True, text=True, check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(count: int) -> list[tuple[float, str]]:
+    """Return the modules with the largest cumulative import time in seconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        capture_output=True, text=True, check=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        timings.append((int(cumulative) / 1e6, module.strip()))
+    return sorted(timings, reverse=True)[:count]
+
+
+def free_port() -> int:
+    """Return a local port nobody listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def first_request_seconds(path: str, timeout: float) -> float:
+    """Spawn a worker and return the time until it answers a request."""
+    port = free_port()
+    started = time.perf_counter()
+    worker = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                httpx.get(f"http://127.0.0.1:{port}{path}", timeout=1.0)
+                return time.perf_counter() - started
+            except httpx.TransportError:
+                if worker.poll() is not None:
+                    raise RuntimeError("The worker exited during startup")
+                time.sleep(0.01)
+        raise RuntimeError(f"The worker did not answer within {timeout}s")
+    finally:
+        worker.terminate()
+        worker.wait()
+
+
+def main(runs: int, path: str, timeout: float) -> None:
+    """Run the measurements and print their medians."""
+    imports = [import_seconds() for _ in range(runs)]
+    first_requests = [first_request_seconds(path, timeout) for _ in range(runs)]
+    print(f"{'import src.main':<48}{statistics.median(imports) * 1000:>9.0f} ms")
+    print(f"{'time to first request':<48}{statistics.median(first_requests) * 1000:>9.0f} ms")
+    print("slowest imports (cumulative):")
+    for seconds, module in slowest_imports(8):
+        print(f"  {module:<46}{seconds * 1000:>9.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of measurements, the median is reported")
+    parser.add_argument("--path", default="/ready", help="path of the first request")
+    parser.add_argument("--timeout", type=float, default=60.0, help="limit of a single startup in seconds")
+    arguments = parser.parse_args()
+    main(arguments.runs, arguments.path, arguments.timeout)
@@ -0,0 +1,73 @@
+"""Benchmark of the throughput of a running server.
+
+Keeps `--connections` keep-alive connections busy with requests to one
+path for `--seconds` and reports the requests per second and latency
+percentiles. The server is started separately, so launch modes can be
+compared on the same machine and database, for example:
+
+    uvicorn src.main:app --reload     # the development setup
+    python -m src.server              # the production entrypoint
+
+    python -m benchmarks.throughput --url http://127.0.0.1:8000 --path /games/all
+
+The load generator competes with the server for CPU, so run it on another
+machine or pin it to other cores when measuring several workers. Results
+are only comparable between runs on the same hardware.
+
+Usage:
+    python -m benchmarks.throughput [--url http://127.0.0.1:8000] [--path /games/all]
+        [--connections 32] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def load(client: httpx.AsyncClient, path: str, deadline: float, latencies: list, errors: list) -> None:
+    """Send requests one after another until the deadline."""
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+                continue
+        except httpx.TransportError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+async def main(url: str, path: str, connections: int, seconds: float) -> None:
+    """Run the load and print its throughput and latencies."""
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+        await client.get(path)
+        latencies: list[float] = []
+        errors: list = []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            load(client, path, started + seconds, latencies, errors) for _ in range(connections)
+        ))
+        elapsed = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    print(f"{'requests':<24}{len(latencies):>10}")
+    print(f"{'errors':<24}{len(errors):>10}")
+    print(f"{'requests per second':<24}{len(latencies) / elapsed:>10.0f}")
+    print(f"{'p50 latency':<24}{percentiles[49] * 1000:>10.1f} ms")
+    print(f"{'p99 latency':<24}{percentiles[98] * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="base URL of the server")
+    parser.add_argument("--path", default="/games/all", help="path requested")
+    parser.add_argument("--connections", type=int, default=32, help="concurrent keep-alive connections")
+    parser.add_argument("--seconds", type=float, default=10.0, help="duration of the load")
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.url, arguments.path, arguments.connections, arguments.seconds))
@@ -0,0 +1,67 @@
+"""Module containing the query budgets of the API endpoints.
+
+A budget is the largest number of statements one request to a route may
+send through `database`, with cold caches and on any branch of the
+endpoint, the token version lookup of authenticated routes included.
+Every budget is a constant, so an endpoint issuing a statement per listed
+row, per player or per page item exceeds it as soon as the data grows.
+Routes are keyed by their method and path template; a route whose
+statement count grows with the data by design has a budget of None and
+is not checked.
+"""
+
+import json
+
+from src.infrastructure.utils.instrumentation import slow_query_log
+
+QUERY_BUDGETS: dict[str, int | None] = {
+    "POST /auth/register": 2,
+    "POST /auth/login": 2,
+    "POST /auth/refresh": 1,
+    "POST /auth/revoke": 4,
+    "POST /users/register": 1,
+    "POST /users/token": 2,
+    "GET /users/all": 2,
+    "GET /games/all": 2,
+    "GET /games/random": 2,
+    "GET /games/{game_id}": 1,
+    "POST /games/create": 2,
+    "PUT /games/update/{game_id}": 3,
+    "DELETE /games/{game_id}": 3,
+    "GET /sessions/all": 1,
+    "GET /sessions/export": 1,
+    "POST /sessions/add": 3,
+    "DELETE /sessions/delete/{session_id}": 6,
+    "GET /rankings/game/{game_id}": 2,
+    "GET /rankings/user/{user_id}": 1,
+    # One aggregation per game, computed as separate partitions.
+    "POST /rankings/rebuild": None,
+    "GET /comments/session/{session_id}": 2,
+    "POST /comments/add": 2,
+}
+
+
+def check_query_budget(method: str, route: str, queries: int) -> bool:
+    """The function checking the statement count of a request against its budget.
+
+    A request over the budget is logged with the slow queries.
+
+    Args:
+        method (str): The HTTP method.
+        route (str): The path template of the matched route.
+        queries (int): The number of statements the request sent.
+
+    Returns:
+        bool: Whether the request kept within the budget, True if the route has none.
+    """
+    budget = QUERY_BUDGETS.get(f"{method} {route}")
+    if budget is None or queries <= budget:
+        return True
+
+    slow_query_log.warning(json.dumps({
+        "event": "query_budget_exceeded",
+        "route": f"{method} {route}",
+        "queries": queries,
+        "budget": budget,
+    }))
+    return False
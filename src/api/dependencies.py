@@ -1,17 +1,22 @@
 """Module containing API dependencies."""
 
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Awaitable, Sequence
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from src.container import Container
 from src.infrastructure.services.iuser import IUserService
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.dto.tokendto import TokenPayload
-from src.infrastructure.utils.consts import ALGORITHM, SECRET_KEY
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.utils.consts import ALGORITHM, SECRET_KEY, NEXT_CURSOR_HEADER
+from src.infrastructure.utils.etag import etag_matches
+from src.infrastructure.utils.pagination import InvalidCursorError
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -22,7 +27,12 @@ async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     user_service: IUserService = Depends(Provide[Container.user_service]),
 ):
-    """Dependency for getting currently authenticated user."""
+    """Dependency for getting currently authenticated user.
+
+    The user is built from the claims signed into the access token. Only
+    the token version is checked against the (cached) current version, so
+    revoked tokens are rejected without loading the user.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -30,15 +40,108 @@ async def get_current_user(
     )
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
+        token_data = TokenPayload(**payload)
+        if token_data.sub is None or token_data.type != "access":
             raise credentials_exception
-        token_data = TokenPayload(sub=user_id)
+        user = UserDTO(
+            id=token_data.sub,
+            email=token_data.email,
+            nick=token_data.nick,
+            is_admin=token_data.is_admin,
+            registration_date=token_data.registration_date,
+        )
     except (JWTError, ValidationError):
         raise credentials_exception
 
-    user = await user_service.get_by_uuid(token_data.sub)
-    if user is None:
+    if not await user_service.is_token_current(user.id, token_data.ver):
         raise credentials_exception
 
-    return user
\ No newline at end of file
+    return user
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def dto_response(
+    content: BaseModel | Sequence[BaseModel],
+    response: Response | None = None,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """Encode already validated DTOs straight to JSON bytes.
+
+    Returning the response directly skips FastAPI's validation against
+    `response_model`, so the DTO type must match the route's model.
+
+    Args:
+        content (BaseModel | Sequence[BaseModel]): The DTO or a list of DTOs of one type.
+        response (Response | None, optional): The injected response whose headers are kept.
+        status_code (int, optional): The status code of the response.
+
+    Returns:
+        Response: The JSON response.
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json()
+    elif content:
+        body = _list_adapter(type(content[0])).dump_json(list(content))
+    else:
+        body = b"[]"
+
+    encoded = Response(body, status_code=status_code, media_type="application/json")
+    if response is not None:
+        encoded.headers.raw.extend(response.headers.raw)
+    return encoded
+
+
+async def page_response(response: Response, fetch: Awaitable[PageDTO]) -> Response:
+    """Await a page fetch and encode its items, exposing the next cursor as a header.
+
+    Args:
+        response (Response): The injected response whose headers are kept.
+        fetch (Awaitable[PageDTO]): The pending service call returning a page.
+
+    Raises:
+        HTTPException: 400 if the cursor provided by the client is invalid.
+
+    Returns:
+        Response: The JSON response with the items of the page.
+    """
+    try:
+        page = await fetch
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return dto_response(page.items, response)
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str,
+) -> Response | None:
+    """Set the caching headers and answer a matching conditional request.
+
+    The ETag must be taken before the rows are read, so a change committed
+    in between yields a newer ETag on the next request rather than an old
+    ETag on new content.
+
+    Args:
+        request (Request): The incoming request.
+        response (Response): The response the headers are set on.
+        etag (str): The current ETag of the resource.
+        cache_control (str): The Cache-Control policy of the route.
+
+    Returns:
+        Response | None: A 304 response if the client's copy is current, otherwise None.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
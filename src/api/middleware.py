@@ -0,0 +1,116 @@
+"""Module containing ASGI middleware of the API."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.budgets import check_query_budget
+from src.infrastructure.utils.instrumentation import begin_request, end_request
+from src.infrastructure.utils.metrics import request_metrics
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """The function returning the path template of the route a request matched.
+
+    Routes of a router included with a prefix keep their path without it,
+    so the prefix is taken from the leading segments of the request path.
+    The result is only used if it is a path of the API schema, so a label
+    never carries segments of the request path which are not static.
+
+    Args:
+        scope (Scope): The scope of a handled request.
+
+    Returns:
+        str: The template, e.g. "/games/{game_id}", or a placeholder if no route matched.
+    """
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+
+    path = scope["path"]
+    depth = path.count("/") - template.count("/")
+    if depth <= 0:
+        return template
+
+    template = "/".join(path.split("/")[:depth + 1]) + template
+    return template if template in scope["app"].openapi()["paths"] else UNMATCHED_ROUTE
+
+
+class QueryTimingMiddleware:
+    """Middleware reporting the database usage of each request.
+
+    The query count, total database time and the slowest statement are sent
+    in the `Server-Timing` header. For streamed responses the header only
+    covers the statements run before the body started. Once the response
+    is complete, the count is checked against the query budget of the route.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = begin_request(scope["path"])
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request(stats, token)
+            check_query_budget(scope["method"], route_template(scope), stats.count)
+
+
+class RequestMetricsMiddleware:
+    """Middleware counting requests and their latency per route.
+
+    Requests are labelled with the path template of the matched route, e.g.
+    "/games/{game_id}", so the number of series does not grow with the ids
+    requested. Paths matching no route share one label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            request_metrics.observe(
+                scope["method"],
+                route_template(scope),
+                status_code,
+                (time.perf_counter() - started) * 1000,
+            )
@@ -4,8 +4,9 @@ from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
+from src.api.dependencies import get_current_user
 from src.container import Container
-from src.core.domain.user import UserIn, UserLogin
+from src.core.domain.user import TokenRefresh, UserIn, UserLogin
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.services.iuser import IUserService
@@ -52,4 +53,46 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), service: IUser
     user = await service.authenticate_user(user_login)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password", headers={"WWW-Authenticate": "Bearer"})
-    return user
\ No newline at end of file
+    return user
+
+
+@router.post("/refresh", response_model=TokenDTO)
+@inject
+async def refresh(data: TokenRefresh, service: IUserService = Depends(Provide[Container.user_service])):
+    """Exchange a refresh token for a new access token.
+
+    The refresh token is rotated, so the one returned must be used next time.
+
+    Args:
+        data (TokenRefresh): The refresh token issued at login.
+        service (IUserService): The user service dependency.
+
+    Returns:
+        TokenDTO: An object containing the new access and refresh tokens.
+
+    Raises:
+        HTTPException: If the refresh token is invalid or expired (401).
+    """
+    token = await service.refresh_token(data.refresh_token)
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token", headers={"WWW-Authenticate": "Bearer"})
+    return token
+
+
+@router.post("/revoke", status_code=status.HTTP_204_NO_CONTENT)
+@inject
+async def revoke_tokens(
+    current_user: UserDTO = Depends(get_current_user),
+    service: IUserService = Depends(Provide[Container.user_service]),
+) -> None:
+    """Revoke all access tokens issued to the current user.
+
+    Args:
+        current_user (UserDTO): The currently authenticated user.
+        service (IUserService): The user service dependency.
+
+    Raises:
+        HTTPException: If the user no longer exists (404).
+    """
+    if not await service.revoke_tokens(current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -2,21 +2,23 @@
 
 from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import dto_response, get_current_user, not_modified, page_response
 from src.container import Container
 from src.core.domain.comment import CommentIn, CommentBroker
 from src.infrastructure.dto.commentdto import CommentDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.services.icomment import ICommentService
+from src.infrastructure.utils.consts import COMMENTS_CACHE_CONTROL, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.infrastructure.utils.etag import ResourceVersions
 
 router = APIRouter()
 
 
 @router.post("/add", response_model=CommentDTO, status_code=201)
 @inject
-async def add_comment(comment: CommentIn, current_user: UserDTO = Depends(get_current_user), service: ICommentService = Depends(Provide[Container.comment_service])) -> dict:
+async def add_comment(comment: CommentIn, current_user: UserDTO = Depends(get_current_user), service: ICommentService = Depends(Provide[Container.comment_service])) -> Response | dict:
     """Add a new comment to a specific game session.
 
     Args:
@@ -25,23 +27,42 @@ async def add_comment(comment: CommentIn, current_user: UserDTO = Depends(get_cu
         service (ICommentService): The comment service.
 
     Returns:
-        dict: The created comment data.
+        Response | dict: The created comment data.
     """
 
     comment_broker = CommentBroker(**comment.model_dump(), user_id=current_user.id)
     new_comment = await service.add_comment(comment_broker)
-    return new_comment.model_dump() if new_comment else {}
+    return dto_response(new_comment, status_code=201) if new_comment else {}
 
 @router.get("/session/{session_id}", response_model=Iterable[CommentDTO])
 @inject
-async def get_comments_by_session(session_id: int, service: ICommentService = Depends(Provide[Container.comment_service])) -> Iterable:
-    """Retrieve all comments associated with a specific game session.
+async def get_comments_by_session(
+    session_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    service: ICommentService = Depends(Provide[Container.comment_service]),
+    versions: ResourceVersions = Depends(Provide[Container.resource_versions]),
+) -> Response:
+    """Retrieve a page of comments associated with a specific game session.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+    A request with a current `If-None-Match` is answered with 304.
 
     Args:
         session_id (int): The unique identifier of the session.
+        request (Request): The incoming request.
+        response (Response): The outgoing response.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the page to fetch.
         service (ICommentService): The comment service dependency.
+        versions (ResourceVersions): The resource versions dependency.
 
     Returns:
-        Iterable[CommentDTO]: A list of comments for the session.
+        Response: A page of comments for the session or a 304 response.
     """
-    return await service.get_by_session(session_id)
\ No newline at end of file
+    etag = await versions.etag(f"comments:{session_id}")
+    if cached := not_modified(request, response, etag, COMMENTS_CACHE_CONTROL):
+        return cached
+    return await page_response(response, service.get_by_session(session_id, limit, cursor))
\ No newline at end of file
@@ -2,15 +2,17 @@
 
 from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import dto_response, get_current_user, not_modified, page_response
 from src.container import Container
 from src.core.domain.game import GameIn
 from src.infrastructure.dto.gamedto import GameDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.services.igame import IGameService
 from src.infrastructure.services.iuser import IUserService
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, GAMES_CACHE_CONTROL, MAX_PAGE_SIZE
+from src.infrastructure.utils.etag import ResourceVersions
 
 router = APIRouter()
 
@@ -21,7 +23,7 @@ async def create_game(
     game: GameIn,
     current_user: UserDTO = Depends(get_current_user),
     service: IGameService = Depends(Provide[Container.game_service]),
-) -> dict:
+) -> Response | dict:
     """An endpoint for adding a new game.
 
     Args:
@@ -30,46 +32,68 @@ async def create_game(
         service (IGameService, optional): The injected service dependency.
 
     Returns:
-        dict: The new game attributes.
+        Response | dict: The new game attributes.
     """
     if not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can create games")
     new_game = await service.create_game(game, current_user.id)
-    return new_game.model_dump() if new_game else {}
+    return dto_response(new_game, status_code=201) if new_game else {}
 
 
 @router.get("/all", response_model=Iterable[GameDTO], status_code=200)
 @inject
-async def get_all_games(service: IGameService = Depends(Provide[Container.game_service])) -> Iterable:
-    """An endpoint for getting all games.
+async def get_all_games(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    service: IGameService = Depends(Provide[Container.game_service]),
+    versions: ResourceVersions = Depends(Provide[Container.resource_versions]),
+) -> Response:
+    """An endpoint for getting a page of games.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+    A request with a current `If-None-Match` is answered with 304.
 
     Args:
+        request (Request): The incoming request.
+        response (Response): The outgoing response.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the page to fetch.
         service (IGameService, optional): The injected service dependency.
+        versions (ResourceVersions, optional): The injected resource versions.
 
     Returns:
-        Iterable: The game attributes collection.
+        Response: The game attributes collection or a 304 response.
     """
-    return await service.get_all()
+    etag = await versions.etag("games")
+    if cached := not_modified(request, response, etag, GAMES_CACHE_CONTROL):
+        return cached
+    return await page_response(response, service.get_all(limit, cursor))
 
 
 @router.get("/random", response_model=GameDTO, status_code=200)
 @inject
 async def get_random_game(
+    players: int | None = Query(None, ge=1),
+    exclude_recent: int = Query(0, ge=0, le=MAX_PAGE_SIZE),
     service: IGameService = Depends(Provide[Container.game_service]),
-) -> dict:
+) -> Response:
     """An endpoint for getting a random game.
 
     Args:
+        players (int | None): The number of players the game must support.
+        exclude_recent (int): The number of latest sessions whose games are skipped.
         service (IGameService, optional): The injected service dependency.
 
     Raises:
         HTTPException: 404 if no games exist.
 
     Returns:
-        dict: The random game .
+        Response: The random game .
     """
-    if game := await service.get_random_game():
-        return game.model_dump()
+    if game := await service.get_random_game(players, exclude_recent):
+        return dto_response(game)
 
     raise HTTPException(status_code=404, detail="No games found")
 
@@ -79,7 +103,7 @@ async def get_random_game(
 async def get_game_by_id(
     game_id: int,
     service: IGameService = Depends(Provide[Container.game_service]),
-) -> dict:
+) -> Response:
     """An endpoint for getting game details by id.
 
     Args:
@@ -90,10 +114,10 @@ async def get_game_by_id(
         HTTPException: 404.
 
     Returns:
-        dict: game attributes.
+        Response: game attributes.
     """
     if game := await service.get_by_id(game_id):
-        return game.model_dump()
+        return dto_response(game)
 
     raise HTTPException(status_code=404, detail="Game not found")
 
@@ -146,7 +170,7 @@ async def update_game(
             current_user (UserDTO): The currently authenticated user.
 
         Returns:
-            GameDTO: The updated game DTO.
+            Response: The updated game DTO.
 
         Raises:
             HTTPException: If the user is not an administrator (403).
@@ -160,4 +184,4 @@ async def update_game(
     if not updated_game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    return updated_game
\ No newline at end of file
+    return dto_response(updated_game)
\ No newline at end of file
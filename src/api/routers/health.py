@@ -0,0 +1,29 @@
+"""A module containing the readiness endpoint."""
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from src.config import config
+from src.db import ping
+
+router = APIRouter()
+
+
+@router.get("/ready", include_in_schema=False)
+async def get_ready() -> JSONResponse:
+    """Report whether this worker can serve requests.
+
+    The worker is ready once its startup has completed and, with the
+    postgres backend, the database answers queries.
+
+    Returns:
+        JSONResponse: 200 when ready, 503 while the database is unreachable.
+    """
+    if config.REPOSITORY_BACKEND == "postgres" and not await ping():
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable"},
+            headers={"Retry-After": "1"},
+        )
+
+    return JSONResponse(content={"status": "ready"})
@@ -0,0 +1,82 @@
+"""A module containing the Prometheus metrics endpoint."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.container import Container
+from src.db import database
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.instrumentation import query_metrics
+from src.infrastructure.utils.metrics import (
+    CONTENT_TYPE,
+    LoopLagMonitor,
+    MetricsWriter,
+    request_metrics,
+    write_queries,
+    write_requests,
+)
+from src.infrastructure.utils.password import queue_depth
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+@inject
+async def get_metrics(
+    game_cache: TTLCache = Depends(Provide[Container.game_cache]),
+    token_version_cache: TTLCache = Depends(Provide[Container.token_version_cache]),
+    loop_lag: LoopLagMonitor = Depends(Provide[Container.loop_lag_monitor]),
+) -> PlainTextResponse:
+    """Expose the metrics of this worker in the Prometheus text format.
+
+    Every worker keeps its own metrics, so a scrape reports the worker
+    which accepted it.
+
+    Args:
+        game_cache (TTLCache): The injected game cache.
+        token_version_cache (TTLCache): The injected token version cache.
+        loop_lag (LoopLagMonitor): The injected event loop lag monitor.
+
+    Returns:
+        PlainTextResponse: The metrics.
+    """
+    writer = MetricsWriter()
+    write_requests(writer, request_metrics)
+
+    pool = database.pool_stats()
+    for name, help_text in (
+        ("size", "Open connections in the database pool."),
+        ("max_size", "Maximum size of the database pool."),
+        ("in_use", "Database connections checked out of the pool."),
+        ("waiting", "Coroutines waiting for a database connection."),
+    ):
+        writer.header(f"db_pool_{name}", "gauge", help_text)
+        writer.sample(f"db_pool_{name}", pool[name])
+
+    writer.header("password_queue_depth", "gauge", "Password operations waiting for a worker.")
+    writer.sample("password_queue_depth", queue_depth())
+
+    caches = {"game": game_cache.stats(), "token_version": token_version_cache.stats()}
+    writer.header("cache_hits_total", "counter", "Cache lookups answered from the cache.")
+    for cache, stats in caches.items():
+        writer.sample("cache_hits_total", stats["hits"], cache=cache)
+    writer.header("cache_misses_total", "counter", "Cache lookups which missed.")
+    for cache, stats in caches.items():
+        writer.sample("cache_misses_total", stats["misses"], cache=cache)
+    writer.header("cache_hit_ratio", "gauge", "Share of cache lookups answered from the cache.")
+    for cache, stats in caches.items():
+        lookups = stats["hits"] + stats["misses"]
+        writer.sample("cache_hit_ratio", stats["hits"] / lookups if lookups else 0.0, cache=cache)
+    writer.header("cache_entries", "gauge", "Entries held by the cache.")
+    for cache, stats in caches.items():
+        writer.sample("cache_entries", stats["size"], cache=cache)
+
+    writer.header("event_loop_lag_seconds", "gauge", "Delay of the last event loop wake-up.")
+    writer.sample("event_loop_lag_seconds", loop_lag.lag)
+    writer.header("event_loop_lag_max_seconds", "gauge", "Largest event loop wake-up delay seen.")
+    writer.sample("event_loop_lag_max_seconds", loop_lag.max_lag)
+
+    write_queries(writer, query_metrics.snapshot().items())
+
+    return PlainTextResponse(writer.render(), media_type=CONTENT_TYPE)
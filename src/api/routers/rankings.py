@@ -3,31 +3,55 @@
 from typing import Iterable
 from uuid import UUID
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
+from src.api.dependencies import dto_response, get_current_user, not_modified, page_response
+from src.config import config
 from src.container import Container
-from src.infrastructure.dto.rankingdto import RankingDTO
+from src.core.repositories.iranking import RebuildInProgressError
+from src.infrastructure.dto.rankingdto import RankingDTO, RebuildReportDTO
+from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.services.iranking import IRankingService
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, RANKING_CACHE_CONTROL
+from src.infrastructure.utils.etag import ResourceVersions
 
 router = APIRouter()
 
+MAX_REBUILD_CONCURRENCY = max(1, config.DB_POOL_MAX_SIZE // 2)
+
 
 @router.get("/game/{game_id}", response_model=Iterable[RankingDTO], status_code=200)
 @inject
 async def get_ranking_by_game(
     game_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
     service: IRankingService = Depends(Provide[Container.ranking_service]),
-) -> Iterable:
-    """Get the player ranking table for a specific game.
+    versions: ResourceVersions = Depends(Provide[Container.resource_versions]),
+) -> Response:
+    """Get a page of the player ranking table for a specific game.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+    A request with a current `If-None-Match` is answered with 304.
 
     Args:
         game_id (int): The id of the game.
+        request (Request): The incoming request.
+        response (Response): The outgoing response.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the page to fetch.
         service (IRankingService): The ranking service dependency.
+        versions (ResourceVersions): The resource versions dependency.
 
     Returns:
-        Iterable[RankingDTO]: A list of ranking entries for a game.
+        Response: A page of ranking entries for a game or a 304 response.
     """
-    return await service.get_ranking_for_game(game_id)
+    etag = await versions.etag(f"ranking:{game_id}")
+    if cached := not_modified(request, response, etag, RANKING_CACHE_CONTROL):
+        return cached
+    return await page_response(response, service.get_ranking_for_game(game_id, limit, cursor))
 
 
 @router.get("/user/{user_id}", response_model=Iterable[RankingDTO], status_code=200)
@@ -35,7 +59,7 @@ async def get_ranking_by_game(
 async def get_user_stats(
     user_id: UUID,
     service: IRankingService = Depends(Provide[Container.ranking_service]),
-) -> Iterable:
+) -> Response:
     """get statistics for a specific user.
 
     Args:
@@ -43,6 +67,45 @@ async def get_user_stats(
         service (IRankingService): The ranking service dependency.
 
     Returns:
-        Iterable[RankingDTO]: A list of ranking entries.
+        Response: A list of ranking entries.
+    """
+    return dto_response(await service.get_user_scores(user_id))
+
+
+@router.post("/rebuild", response_model=RebuildReportDTO, status_code=200)
+@inject
+async def rebuild_rankings(
+    concurrency: int = Query(config.RANKING_REBUILD_CONCURRENCY, ge=1, le=MAX_REBUILD_CONCURRENCY),
+    current_user: UserDTO = Depends(get_current_user),
+    service: IRankingService = Depends(Provide[Container.ranking_service]),
+) -> RebuildReportDTO:
+    """Rebuild all rankings from the stored sessions and scores.
+
+    Only admins can rebuild rankings. Every game processed at once holds
+    a pooled connection, so at most half of the pool is used and requests
+    served meanwhile still get connections.
+
+    Args:
+        concurrency (int): The number of games processed at once.
+        current_user (UserDTO): The currently authenticated user.
+        service (IRankingService): The ranking service dependency.
+
+    Raises:
+        HTTPException: If the user is not an administrator (403).
+        HTTPException: If another rebuild is running (409).
+
+    Returns:
+        RebuildReportDTO: The sizes and throughput of the rebuild.
     """
-    return await service.get_user_scores(user_id)
\ No newline at end of file
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrator can rebuild rankings."
+        )
+    try:
+        return await service.rebuild_rankings(min(concurrency, MAX_REBUILD_CONCURRENCY))
+    except RebuildInProgressError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Rankings are already being rebuilt."
+        )
@@ -1,17 +1,20 @@
 """A module containing session endpoints."""
 
-from typing import Iterable
+from typing import Iterable, Literal
 from datetime import datetime, timezone
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import dto_response, get_current_user, page_response
 from src.container import Container
 from src.core.domain.session import SessionIn, SessionBroker
 from src.infrastructure.dto.sessiondto import SessionDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.services.isession import ISessionService
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, EXPORT_CHUNK_ROWS
+from src.infrastructure.utils.export import csv_chunks, ndjson_chunks
 
 router = APIRouter()
 
@@ -22,7 +25,7 @@ async def add_session(
         session: SessionIn,
         current_user: UserDTO = Depends(get_current_user),
         service: ISessionService = Depends(Provide[Container.session_service]),
-) -> dict:
+) -> Response | dict:
     """Add a new game session result.
 
     Args:
@@ -31,7 +34,7 @@ async def add_session(
         service (ISessionService): The session service dependency.
 
     Returns:
-        dict: The created session DTO.
+        Response | dict: The created session DTO.
     """
 
     input_date = session.date
@@ -51,23 +54,68 @@ async def add_session(
 
     new_session = await service.add_session(session_broker)
 
-    return new_session.model_dump() if new_session else {}
+    return dto_response(new_session, status_code=201) if new_session else {}
 
 
 @router.get("/all", response_model=Iterable[SessionDTO], status_code=200)
 @inject
 async def get_all_sessions(
+        response: Response,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: str | None = None,
         service: ISessionService = Depends(Provide[Container.session_service]),
-) -> Iterable:
-    """History of all played sessions.
+) -> Response:
+    """History of played sessions, one page at a time.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
 
     Args:
+        response (Response): The outgoing response.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the page to fetch.
         service (ISessionService): The session service dependency.
 
     Returns:
-        Iterable[SessionDTO]: A list of all sessions.
+        Response: A page of sessions.
     """
-    return await service.get_all()
+    return await page_response(response, service.get_all(limit, cursor))
+
+
+@router.get("/export", status_code=200)
+@inject
+async def export_sessions(
+        export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+        since: datetime | None = None,
+        service: ISessionService = Depends(Provide[Container.session_service]),
+) -> StreamingResponse:
+    """Stream the session history with scores, oldest first.
+
+    Rows are read from a server-side cursor and written out in chunks,
+    so memory use does not depend on the size of the history.
+
+    Args:
+        export_format (str): The output format, `ndjson` or `csv`.
+        since (datetime | None): Export only sessions played at or after this date.
+        service (ISessionService): The session service dependency.
+
+    Returns:
+        StreamingResponse: The streamed export.
+    """
+    if since is not None and since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    sessions = service.export(since)
+    if export_format == "csv":
+        return StreamingResponse(
+            csv_chunks(sessions, EXPORT_CHUNK_ROWS),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="sessions.csv"'},
+        )
+
+    return StreamingResponse(
+        ndjson_chunks(sessions, EXPORT_CHUNK_ROWS),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.delete("/delete/{session_id}", status_code=204)
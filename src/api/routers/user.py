@@ -2,14 +2,15 @@
 
 from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from src.container import Container
 from src.core.domain.user import UserIn
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.services.iuser import IUserService
-from src.api.dependencies import get_current_user
+from src.infrastructure.utils.consts import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.api.dependencies import get_current_user, page_response
 
 router = APIRouter()
 
@@ -65,16 +66,25 @@ async def authenticate_user(
 @router.get("/all", response_model=Iterable[UserDTO], status_code=200)
 @inject
 async def get_all_users(
+        response: Response,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: str | None = None,
         service: IUserService = Depends(Provide[Container.user_service]),
         current_user: UserDTO = Depends(get_current_user),
-) -> Iterable:
-    """Retrieve a list of all registered users..
+) -> Response:
+    """Retrieve a page of registered users.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+
     Args:
+        response (Response): The outgoing response.
+        limit (int): The page size.
+        cursor (str | None): The cursor of the page to fetch.
         service (IUserService): The user service dependency.
         current_user (UserDTO): The currently authenticated user.
 
     Returns:
-        Iterable[UserDTO]: A list of all users.
+        Response: A page of users.
 
     Raises:
         HTTPException: If the current user is not an administrator (403).
@@ -85,4 +95,4 @@ async def get_all_users(
             detail="Only administrator can view all users."
         )
 
-    return await service.get_all()
\ No newline at end of file
+    return await page_response(response, service.get_all_users(limit, cursor))
\ No newline at end of file
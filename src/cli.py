@@ -0,0 +1,171 @@
+"""Module containing the command line tasks of the application.
+
+The tasks run once per deployment, before the workers are started:
+
+    python -m src.cli migrate
+    python -m src.cli seed
+
+`python -m src.cli migrations` lists the migrations not applied yet.
+`python -m src.cli purge-tokens` deletes the expired refresh tokens and
+is meant to run periodically, e.g. from cron.
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from src.container import Container
+from src.db import connect_db, database
+from src.core.domain.user import UserIn
+from src.core.domain.game import GameIn
+from src.core.domain.session import SessionBroker
+from src.core.domain.comment import CommentBroker
+from src.infrastructure.utils.password import shutdown_password_pool
+from src.migrations import migrate, pending_migrations
+
+
+async def seed_data(container: Container):
+    """Creates initial data"""
+    print("Seeding initial data")
+    user_service = container.user_service()
+    game_service = container.game_service()
+    session_service = container.session_service()
+    comment_service = container.comment_service()
+    admin_email = "admin@test.com"
+    admin = await user_service.get_by_email(admin_email)
+    if not admin:
+        print(f"admin: {admin_email}")
+        admin = await user_service.register_user(UserIn(
+            email=admin_email,
+            password="admin",
+            nick="SuperAdmin",
+            is_admin=True
+        ))
+    marek_email = "marek@test.com"
+    marek = await user_service.get_by_email(marek_email)
+    if not marek:
+        print(f"Creating user: {marek_email}")
+        marek = await user_service.register_user(UserIn(
+            email=marek_email,
+            password="user1",
+            nick="Marek",
+            is_admin=False
+        ))
+    jarek_email = "jarek@test.com"
+    jarek = await user_service.get_by_email(jarek_email)
+    if not jarek:
+        print(f"Creating user: {jarek_email}")
+        jarek = await user_service.register_user(UserIn(
+            email=jarek_email,
+            password="user2",
+            nick="Jarek",
+            is_admin=False
+        ))
+    catan = await game_service.get_by_name("Catan")
+
+    if not catan and admin:
+        print("Creating game: Catan")
+        catan = await game_service.create_game(GameIn(
+            title="Catan",
+            description="Osadnicy z Catanu",
+            min_players=3,
+            max_players=4,
+            rules_url="http://catan.com"
+        ), admin.id)
+    elif catan:
+        print(f"   Game found: Catan (ID: {catan.id})")
+
+    carcassonne = await game_service.get_by_name("Nemesis")
+    if not carcassonne and admin:
+        print("Creating game: Nemesis")
+        await game_service.create_game(GameIn(
+            title="Nemesis",
+            description="kooperacyjna gra o kosmitach",
+            min_players=2,
+            max_players=5,
+            rules_url="http://nemesis.com"
+        ), admin.id)
+    seed_session = None
+    if catan and marek and jarek:
+        seed_note = "SEED_SESSION_DEMO"
+        admin_sessions = await session_service.get_by_user(admin.id)
+        seed_session = next((s for s in admin_sessions if s.note == seed_note), None)
+        if not seed_session:
+            print(f"Creating seed session for Game ID {catan.id}...")
+            session_data = SessionBroker(
+                game_id=catan.id,
+                date=datetime(2026, 1, 8, 12, 0, 0, tzinfo=None),
+                note=seed_note,
+                participants=[marek.id, jarek.id],
+                winner_id=marek.id,
+                scores={marek.id: 10, jarek.id: 8},
+                user_id=admin.id,
+                date_added=datetime.now(timezone.utc).replace(tzinfo=None)
+            )
+            seed_session = await session_service.add_session(session_data)
+
+    if seed_session and marek and jarek:
+        existing_comments = await comment_service.get_by_session(seed_session.id, limit=1)
+        if not existing_comments.items:
+            print(f"Adding comments to session {seed_session.id}...")
+            await comment_service.add_comment(CommentBroker(
+                session_id=seed_session.id,
+                user_id=marek.id,
+                content="komentarz 1"
+            ))
+            await comment_service.add_comment(CommentBroker(
+                session_id=seed_session.id,
+                user_id=jarek.id,
+                content="komentarz 2"
+            ))
+
+
+async def run_migrate() -> None:
+    """Apply the pending migrations."""
+    applied = await migrate()
+    print(f"Applied migrations: {applied}" if applied else "The schema is up to date")
+
+
+async def run_pending() -> None:
+    """List the migrations not applied yet."""
+    for migration in await pending_migrations():
+        print(f"{migration.version}: {migration.description}")
+
+
+async def run_seed() -> None:
+    """Seed the database with the initial data."""
+    await seed_data(Container())
+
+
+async def run_purge_tokens() -> None:
+    """Delete the expired refresh tokens."""
+    purged = await Container().user_service().purge_refresh_tokens()
+    print(f"Deleted expired refresh tokens: {purged}")
+
+
+TASKS = {
+    "migrate": run_migrate,
+    "migrations": run_pending,
+    "seed": run_seed,
+    "purge-tokens": run_purge_tokens,
+}
+
+
+async def main(task: str) -> None:
+    """Run a task against the configured database.
+
+    Args:
+        task (str): The name of the task.
+    """
+    await connect_db()
+    try:
+        await TASKS[task]()
+    finally:
+        await database.disconnect()
+        shutdown_password_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a task of the application.")
+    parser.add_argument("task", choices=TASKS, help="the task to run")
+    asyncio.run(main(parser.parse_args().task))
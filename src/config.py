@@ -1,6 +1,6 @@
 """A module providing configuration variables."""
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,10 +10,42 @@ class BaseConfig(BaseSettings):
 
 class AppConfig(BaseConfig):
     """A class containing app's configuration."""
+    REPOSITORY_BACKEND: Literal["postgres", "memory"] = "postgres"
     DB_HOST: Optional[str] = "localhost"
     DB_NAME: Optional[str] = "boardgames"
     DB_USER: Optional[str] = "postgres"
     DB_PASSWORD: Optional[str] = "password"
+    DB_CONNECT_TIMEOUT: float = 30.0
+    DB_MIGRATE: bool = False
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_ACQUIRE_TIMEOUT: float = 5.0
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_COMMAND_TIMEOUT: Optional[float] = None
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    DB_APPLICATION_NAME: str = "boardgameapi"
+    DB_SLOW_QUERY_MS: float = 200.0
+    DB_QUERY_SHAPES_MAX: int = 500
+    PASSWORD_POOL_KIND: Literal["thread", "process"] = "thread"
+    PASSWORD_POOL_WORKERS: int = 4
+    PASSWORD_QUEUE_SIZE: int = 64
+    TOKEN_VERSION_CACHE_SIZE: int = 100_000
+    TOKEN_VERSION_CACHE_TTL: float = 30.0
+    RANKING_REBUILD_CONCURRENCY: int = 4
+    GAME_SAMPLER_TTL: float = 60.0
+    GAME_CACHE_SIZE: int = 10_000
+    GAME_CACHE_TTL: float = 300.0
+    METRICS_LOOP_LAG_INTERVAL: float = 0.5
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEP_ALIVE: int = 65
+    SERVER_GRACEFUL_TIMEOUT: int = 25
+    SERVER_LIMIT_CONCURRENCY: Optional[int] = None
+    SERVER_ACCESS_LOG: bool = False
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 config = AppConfig()
\ No newline at end of file
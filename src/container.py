@@ -1,7 +1,7 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Factory, Object, Selector, Singleton
 
 # Repositories
 from src.infrastructure.repositories.gamedb import GameRepository
@@ -9,6 +9,12 @@ from src.infrastructure.repositories.sessiondb import SessionRepository
 from src.infrastructure.repositories.rankingdb import RankingRepository
 from src.infrastructure.repositories.userdb import UserRepository
 from src.infrastructure.repositories.commentdb import CommentRepository
+from src.infrastructure.repositories.memory import MemoryStore
+from src.infrastructure.repositories.gamemem import InMemoryGameRepository
+from src.infrastructure.repositories.sessionmem import InMemorySessionRepository
+from src.infrastructure.repositories.rankingmem import InMemoryRankingRepository
+from src.infrastructure.repositories.usermem import InMemoryUserRepository
+from src.infrastructure.repositories.commentmem import InMemoryCommentRepository
 
 # Services
 from src.infrastructure.services.game import GameService
@@ -17,21 +23,72 @@ from src.infrastructure.services.ranking import RankingService
 from src.infrastructure.services.user import UserService
 from src.infrastructure.services.comment import CommentService
 
+from src.config import config
+from src.db import db_dsn
+from src.infrastructure.utils.bus import InvalidationBus
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.etag import DatabaseResourceVersions, InMemoryResourceVersions
+from src.infrastructure.utils.metrics import LoopLagMonitor
+
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
 
+    invalidation_bus = Singleton(InvalidationBus, dsn=db_dsn)
+    loop_lag_monitor = Singleton(LoopLagMonitor, interval=config.METRICS_LOOP_LAG_INTERVAL)
+
     #Repo
-    game_repository = Singleton(GameRepository)
-    session_repository = Singleton(SessionRepository)
-    ranking_repository = Singleton(RankingRepository)
-    user_repository = Singleton(UserRepository)
-    comment_repository = Singleton(CommentRepository)
+    repository_backend = Object(config.REPOSITORY_BACKEND)
+    memory_store = Singleton(MemoryStore)
+    resource_versions = Selector(
+        repository_backend,
+        postgres=Singleton(DatabaseResourceVersions),
+        memory=Singleton(InMemoryResourceVersions),
+    )
+
+    game_repository = Selector(
+        repository_backend,
+        postgres=Singleton(GameRepository),
+        memory=Singleton(InMemoryGameRepository, store=memory_store, bus=invalidation_bus),
+    )
+    session_repository = Selector(
+        repository_backend,
+        postgres=Singleton(SessionRepository),
+        memory=Singleton(InMemorySessionRepository, store=memory_store, bus=invalidation_bus),
+    )
+    ranking_repository = Selector(
+        repository_backend,
+        postgres=Singleton(RankingRepository),
+        memory=Singleton(InMemoryRankingRepository, store=memory_store, bus=invalidation_bus),
+    )
+    user_repository = Selector(
+        repository_backend,
+        postgres=Singleton(UserRepository),
+        memory=Singleton(InMemoryUserRepository, store=memory_store, bus=invalidation_bus),
+    )
+    comment_repository = Selector(
+        repository_backend,
+        postgres=Singleton(CommentRepository),
+        memory=Singleton(InMemoryCommentRepository, store=memory_store, bus=invalidation_bus),
+    )
+
+    #Cache
+    token_version_cache = Singleton(
+        TTLCache,
+        maxsize=config.TOKEN_VERSION_CACHE_SIZE,
+        ttl=config.TOKEN_VERSION_CACHE_TTL,
+    )
+    game_cache = Singleton(
+        TTLCache,
+        maxsize=config.GAME_CACHE_SIZE,
+        ttl=config.GAME_CACHE_TTL,
+    )
 
     #Serwisy
     game_service = Factory(
         GameService,
         repository=game_repository,
+        cache=game_cache,
     )
 
     ranking_service = Factory(
@@ -42,12 +99,12 @@ class Container(DeclarativeContainer):
     session_service = Factory(
         SessionService,
         repository=session_repository,
-        ranking_service=ranking_service,
     )
 
     user_service = Factory(
         UserService,
         repository=user_repository,
+        token_versions=token_version_cache,
     )
 
     comment_service = Factory(
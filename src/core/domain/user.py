@@ -15,6 +15,14 @@ class UserLogin(BaseModel):
     email: str
     password: str
 
+class TokenRefresh(BaseModel):
+    """Model representing a request for a new access token.
+
+    Attributes:
+        refresh_token (str): The refresh token issued at login.
+    """
+    refresh_token: str
+
 class UserIn(UserLogin):
     """Model for registering a new user.
 
@@ -22,14 +22,16 @@ class ICommentRepository(ABC):
         """
 
     @abstractmethod
-    async def get_by_session(self, session_id: int) -> Iterable[Any]:
-        """The abstract getting a comment by session from the data storage.
+    async def get_by_session(self, session_id: int, limit: int, cursor: str | None = None) -> Any:
+        """The abstract getting a page of comments by session from the data storage.
 
         Args:
             session_id (int): The session id.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Any | None: comment data.
+            Any: The page of comment data.
         """
     @abstractmethod
     async def delete_comment(self, comment_id: int, user_id: UUID1) -> bool:
@@ -11,11 +11,15 @@ class IGameRepository(ABC):
     """An abstract repository class for game."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[Any]:
-        """the abstract getting all games from data storage.
+    async def get_all(self, limit: int, cursor: str | None = None) -> Any:
+        """the abstract getting a page of games from data storage.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[Any]: The collection of all games
+            Any: The page of games.
 
         """
 
@@ -78,9 +82,18 @@ class IGameRepository(ABC):
         """
 
     @abstractmethod
-    async def get_random_game(self) -> Any | None:
+    async def get_random_game(
+        self,
+        players: int | None = None,
+        exclude_recent: int = 0,
+    ) -> Any | None:
         """abstract method to get a random game from the data storage.
 
+        Args:
+            players (int | None, optional): The number of players the game must support.
+            exclude_recent (int, optional): The number of latest sessions whose
+                games are excluded.
+
         Returns:
             Any | None: Returns a game if at least one exists, else returns None..
         """
@@ -1,26 +1,62 @@
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Iterable, Any
+from uuid import UUID
+
+
+class RebuildInProgressError(Exception):
+    """An exception raised when another rebuild of the rankings is running."""
 
 
 class IRankingRepository(ABC):
     """An abstract class representing protocol of ranking repository."""
 
     @abstractmethod
-    async def get_ranking_for_game(self, game_id: int) -> Iterable[Any]:
-        """The abstract getting ranking for a game.
+    async def get_ranking_for_game(self, game_id: int, limit: int, cursor: str | None = None) -> Any:
+        """The abstract getting a page of the ranking for a game.
 
         Args:
             game_id (int): The id of the game.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
+
+        Returns:
+            Any: The page of ranking entries.
+        """
+
+    @abstractmethod
+    async def get_global_ranking(self, limit: int, cursor: str | None = None) -> Any:
+        """The abstract getting a page of the global ranking across all games.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[Any]: The ranking entries.
+            Any: The page of ranking entries for all users.
         """
 
     @abstractmethod
-    async def get_global_ranking(self) -> Iterable[Any]:
-        """The abstract getting global ranking across all games.
+    async def update_rankings(self, game_id: int, scores: dict[UUID, int], date: datetime) -> None:
+        """The abstract applying the results of a session to the rankings.
+
+        Args:
+            game_id (int): The id of the game.
+            scores (dict[UUID, int]): Mapping of player UUIDs to their scores.
+            date (datetime): The date recorded for the session.
+        """
+
+    @abstractmethod
+    async def rebuild_rankings(self, concurrency: int) -> Any:
+        """The abstract rebuilding all rankings from the stored sessions.
+
+        Args:
+            concurrency (int): The number of partitions computed at once.
+
+        Raises:
+            RebuildInProgressError: If another rebuild is running.
 
         Returns:
-            Iterable[Any]: The global ranking entries for all users.
+            Any: The report of the rebuild.
         """
@@ -1,7 +1,8 @@
 """Module containing session repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable
 from pydantic import UUID1
 
 from src.core.domain.session import SessionIn, SessionBroker
@@ -46,11 +47,26 @@ class ISession(ABC):
         """
 
     @abstractmethod
-    async def get_all_sessions(self) -> Iterable[SessionBroker]:
-        """The abstract getting all sessions from the data storage.
+    async def get_all_sessions(self, limit: int, cursor: str | None = None) -> Any:
+        """The abstract getting a page of sessions from the data storage.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            all sessions data"""
+            Any: The page of sessions data."""
+
+    @abstractmethod
+    def iterate_sessions(self, since: datetime | None = None) -> AsyncIterator[Any]:
+        """The abstract streaming sessions in chronological order.
+
+        Args:
+            since (datetime | None): The lower bound of the session date.
+
+        Returns:
+            AsyncIterator[Any]: The session stream.
+        """
 
     @abstractmethod
     async def get_by_user(self, user_id: int) -> Iterable[Any]:
@@ -2,6 +2,7 @@
 
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 
 from pydantic import UUID5
@@ -57,9 +58,71 @@ class IUserRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all(self) -> Any | None:
-        """A method getting all users.
+    async def get_token_version(self, uuid: UUID5) -> int | None:
+        """A abstract method getting the current token version of a user.
+
+        Args:
+            uuid (UUID5): UUID of the user.
+
+        Returns:
+            int | None: The token version if the user exists.
+        """
+
+    @abstractmethod
+    async def bump_token_version(self, uuid: UUID5) -> int | None:
+        """A abstract method invalidating all tokens issued to a user.
+
+        Args:
+            uuid (UUID5): UUID of the user.
+
+        Returns:
+            int | None: The new token version if the user exists.
+        """
+
+    @abstractmethod
+    async def add_refresh_token(self, uuid: UUID5, token_hash: str, expires_at: datetime) -> None:
+        """A abstract method storing a refresh token issued to a user.
+
+        Args:
+            uuid (UUID5): UUID of the user.
+            token_hash (str): The keyed hash of the token.
+            expires_at (datetime): The expiration date of the token.
+        """
+
+    @abstractmethod
+    async def purge_refresh_tokens(self) -> int:
+        """A abstract method deleting the expired refresh tokens of all users.
+
+        Returns:
+            int: The number of tokens deleted.
+        """
+
+    @abstractmethod
+    async def rotate_refresh_token(
+        self,
+        token_hash: str,
+        new_token_hash: str,
+        expires_at: datetime,
+    ) -> Any | None:
+        """A abstract method replacing a valid refresh token with a new one.
+
+        Args:
+            token_hash (str): The hash of the presented token.
+            new_token_hash (str): The hash of the token replacing it.
+            expires_at (datetime): The expiration date of the new token.
+
+        Returns:
+            Any | None: The owner of the token if it was valid.
+        """
+
+    @abstractmethod
+    async def get_all(self, limit: int, cursor: str | None = None) -> Any:
+        """A method getting a page of users.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Any | None: The list of users.
+            Any: The page of users.
         """
\ No newline at end of file
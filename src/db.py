@@ -1,14 +1,17 @@
 """A module providing database access for BoardGame API."""
 
 import asyncio
+import time
+import asyncpg
 import databases
 import sqlalchemy
+from typing import Any, AsyncGenerator
+from databases.backends.postgres import PostgresBackend, PostgresConnection
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
 from asyncpg.exceptions import CannotConnectNowError, ConnectionDoesNotExistError
 
 from src.config import config
+from src.infrastructure.utils.instrumentation import record_query
 
 metadata = sqlalchemy.MetaData()
 
@@ -25,6 +28,12 @@ user_table = sqlalchemy.Table(
     sqlalchemy.Column("password", sqlalchemy.String, nullable=False),
     sqlalchemy.Column("nick", sqlalchemy.String, unique=True),
     sqlalchemy.Column("is_admin", sqlalchemy.Boolean, default=False),
+    sqlalchemy.Column(
+        "token_version",
+        sqlalchemy.Integer,
+        nullable=False,
+        server_default=sqlalchemy.text("0"),
+    ),
     sqlalchemy.Column(
         "registration_date",
         sqlalchemy.DateTime,
@@ -33,6 +42,25 @@ user_table = sqlalchemy.Table(
 )
 
 
+refresh_token_table = sqlalchemy.Table(
+    "refresh_tokens",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "user_id",
+        UUID(as_uuid=True),
+        sqlalchemy.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("token_hash", sqlalchemy.String, unique=True, nullable=False),
+    sqlalchemy.Column("expires_at", sqlalchemy.DateTime, nullable=False),
+    sqlalchemy.Column(
+        "created_at", sqlalchemy.DateTime, server_default=sqlalchemy.text("NOW()")
+    ),
+    sqlalchemy.Index("ix_refresh_tokens_user_id", "user_id", postgresql_concurrently=True),
+)
+
+
 game_table = sqlalchemy.Table(
     "games",
     metadata,
@@ -48,6 +76,8 @@ game_table = sqlalchemy.Table(
         sqlalchemy.ForeignKey("users.id"),
         nullable=False,
     ),
+    sqlalchemy.Index("ix_games_title_id", "title", "id", postgresql_concurrently=True),
+    sqlalchemy.Index("ix_games_admin_id", "admin_id", postgresql_concurrently=True),
 )
 
 session_score_table = sqlalchemy.Table(
@@ -67,6 +97,8 @@ session_score_table = sqlalchemy.Table(
         nullable=False,
     ),
     sqlalchemy.Column("score", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Index("ix_session_scores_session_id", "session_id", postgresql_concurrently=True),
+    sqlalchemy.Index("ix_session_scores_user_id", "user_id", postgresql_concurrently=True),
 )
 
 session_table = sqlalchemy.Table(
@@ -92,6 +124,16 @@ session_table = sqlalchemy.Table(
     sqlalchemy.Column("date", sqlalchemy.DateTime, nullable=False),
     sqlalchemy.Column("note", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("winner_id", UUID(as_uuid=True), sqlalchemy.ForeignKey("users.id"), nullable=True),
+    sqlalchemy.Index("ix_sessions_date_id", "date", "id", postgresql_concurrently=True),
+    sqlalchemy.Index(
+        "ix_sessions_created_by_date",
+        "created_by",
+        "date",
+        "id",
+        postgresql_concurrently=True,
+    ),
+    sqlalchemy.Index("ix_sessions_game_id", "game_id", postgresql_concurrently=True),
+    sqlalchemy.Index("ix_sessions_winner_id", "winner_id", postgresql_concurrently=True),
 )
 
 ranking_table = sqlalchemy.Table(
@@ -112,6 +154,13 @@ ranking_table = sqlalchemy.Table(
     ),
     sqlalchemy.Column("games_played", sqlalchemy.Integer, default=0, nullable=False),
     sqlalchemy.Column("wins", sqlalchemy.Integer, default=0, nullable=False),
+    sqlalchemy.Column(
+        "total_score",
+        sqlalchemy.BigInteger,
+        default=0,
+        nullable=False,
+        server_default=sqlalchemy.text("0"),
+    ),
     sqlalchemy.Column("average_score", sqlalchemy.Float, default=0.0, nullable=False),
     sqlalchemy.Column("best_score", sqlalchemy.Integer, default=0, nullable=False),
     sqlalchemy.Column("first_game_date", sqlalchemy.DateTime, nullable=True),
@@ -119,6 +168,14 @@ ranking_table = sqlalchemy.Table(
 
     
     sqlalchemy.UniqueConstraint("user_id", "game_id", name="uq_ranking_user_game"),
+    sqlalchemy.Index(
+        "ix_rankings_game_wins_id",
+        "game_id",
+        "wins",
+        "id",
+        postgresql_concurrently=True,
+    ),
+    sqlalchemy.Index("ix_rankings_wins_id", "wins", "id", postgresql_concurrently=True),
 )
 
 comment_table = sqlalchemy.Table(
@@ -141,43 +198,208 @@ comment_table = sqlalchemy.Table(
     sqlalchemy.Column(
         "created_at", sqlalchemy.DateTime, server_default=sqlalchemy.text("NOW()")
     ),
+    sqlalchemy.Index(
+        "ix_comments_session_created_id",
+        "session_id",
+        "created_at",
+        "id",
+        postgresql_concurrently=True,
+    ),
+    sqlalchemy.Index("ix_comments_user_id", "user_id", postgresql_concurrently=True),
 )
 
+resource_version_table = sqlalchemy.Table(
+    "resource_versions",
+    metadata,
+    sqlalchemy.Column("resource", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("version", sqlalchemy.BigInteger, nullable=False),
+)
 
-db_uri = (
-    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+migration_table = sqlalchemy.Table(
+    "schema_migrations",
+    metadata,
+    sqlalchemy.Column("version", sqlalchemy.Integer, primary_key=True, autoincrement=False),
+    sqlalchemy.Column("description", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column(
+        "applied_at", sqlalchemy.DateTime, server_default=sqlalchemy.text("NOW()")
+    ),
+)
+
+
+db_dsn = (
+    f"postgresql://{config.DB_USER}:{config.DB_PASSWORD}"
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
+db_uri = db_dsn.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+CONNECT_BACKOFF_INITIAL = 0.01
+CONNECT_BACKOFF_MAX = 1.0
 
-engine = create_async_engine(
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection frees up within the acquire timeout."""
+
+
+class PooledConnection(PostgresConnection):
+    """A connection acquired from the pool with a bounded wait.
+
+    Every statement is timed from the moment it is compiled until its
+    result is wrapped and recorded by the query instrumentation. A query
+    streamed with `iterate` is recorded once, timed until its first row,
+    as the pace of the remaining rows is set by the consumer.
+    """
+
+    _statement: str = ""
+    _started: float = 0.0
+
+    async def acquire(self) -> None:
+        assert self._connection is None, "Connection is already acquired"
+        assert self._database._pool is not None, "DatabaseBackend is not running"
+        self._database.waiting += 1
+        try:
+            self._connection = await self._database._pool.acquire(
+                timeout=config.DB_POOL_ACQUIRE_TIMEOUT,
+            )
+        except asyncio.TimeoutError as e:
+            raise PoolTimeoutError("No database connection available") from e
+        finally:
+            self._database.waiting -= 1
+
+    def _compile(self, query: Any) -> tuple:
+        compiled = super()._compile(query)
+        self._statement = compiled[0]
+        self._started = time.perf_counter()
+        return compiled
+
+    async def fetch_all(self, query: Any) -> list:
+        try:
+            return await super().fetch_all(query)
+        finally:
+            record_query(self._statement, self._started)
+
+    async def fetch_one(self, query: Any) -> Any:
+        try:
+            return await super().fetch_one(query)
+        finally:
+            record_query(self._statement, self._started)
+
+    async def execute(self, query: Any) -> Any:
+        try:
+            return await super().execute(query)
+        finally:
+            record_query(self._statement, self._started)
+
+    async def iterate(self, query: Any) -> AsyncGenerator[Any, None]:
+        recorded = False
+        try:
+            async for record in super().iterate(query):
+                if not recorded:
+                    recorded = True
+                    record_query(self._statement, self._started)
+                yield record
+        finally:
+            if not recorded:
+                record_query(self._statement, self._started)
+
+    async def execute_many(self, queries: list) -> None:
+        for query in queries:
+            await self.execute(query)
+
+
+class PooledBackend(PostgresBackend):
+    """The asyncpg backend handing out connections with a bounded wait."""
+
+    waiting: int = 0
+
+    def connection(self) -> PooledConnection:
+        return PooledConnection(self, self._dialect)
+
+    def stats(self) -> dict:
+        """The method returning the occupancy of the pool.
+
+        Returns:
+            dict: The pool size, its maximum, connections in use and waiting acquires.
+        """
+        if self._pool is None:
+            return {"size": 0, "max_size": 0, "in_use": 0, "waiting": self.waiting}
+
+        size = self._pool.get_size()
+        return {
+            "size": size,
+            "max_size": self._pool.get_max_size(),
+            "in_use": size - self._pool.get_idle_size(),
+            "waiting": self.waiting,
+        }
+
+
+class PooledDatabase(databases.Database):
+    """The database resolving asyncpg URLs to the pooled backend."""
+
+    SUPPORTED_BACKENDS = {
+        **databases.Database.SUPPORTED_BACKENDS,
+        "postgresql+asyncpg": "src.db:PooledBackend",
+    }
+
+    def pool_stats(self) -> dict:
+        """The method returning the occupancy of the connection pool.
+
+        Returns:
+            dict: The pool size, its maximum, connections in use and waiting acquires.
+        """
+        return self._backend.stats()
+
+
+database = PooledDatabase(
     db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+    max_inactive_connection_lifetime=config.DB_POOL_MAX_INACTIVE_LIFETIME,
+    command_timeout=config.DB_COMMAND_TIMEOUT,
+    server_settings={
+        "application_name": config.DB_APPLICATION_NAME,
+        "statement_timeout": str(config.DB_STATEMENT_TIMEOUT_MS),
+    },
 )
 
-database = databases.Database(db_uri, force_rollback=True)
 
-async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+async def connect_db(timeout: float | None = None) -> None:
+    """Function connecting the pool as soon as the database accepts connections.
+
+    Failed attempts are retried with an exponential backoff starting at
+    a few milliseconds, so a worker starting along with the database is
+    ready moments after it is.
 
     Args:
-        retries (int, optional): Number of retries of connect to DB.
-            Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+        timeout (float | None, optional): The time to wait for the database
+            in seconds. Defaults to `DB_CONNECT_TIMEOUT`.
+
+    Raises:
+        ConnectionError: If the database is still unreachable after the timeout.
     """
-    for attempt in range(retries):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (config.DB_CONNECT_TIMEOUT if timeout is None else timeout)
+    delay = CONNECT_BACKOFF_INITIAL
+    while True:
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
+            await database.connect()
             return
-        except (
-            OperationalError,
-            DatabaseError,
-            CannotConnectNowError,
-            ConnectionDoesNotExistError,
-        ) as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            await asyncio.sleep(delay)
-
-    raise ConnectionError("Could not connect to DB after several retries.")
+        except (OSError, asyncio.TimeoutError, CannotConnectNowError, ConnectionDoesNotExistError) as e:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise ConnectionError("Could not connect to DB within the timeout.") from e
+            print(f"Database not ready: {e}")
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, CONNECT_BACKOFF_MAX)
+
+
+async def ping() -> bool:
+    """Function checking whether the database answers queries.
+
+    Returns:
+        bool: Whether a pooled connection answered a trivial query.
+    """
+    try:
+        return await database.fetch_val(sqlalchemy.select(1)) == 1
+    except (OSError, asyncio.TimeoutError, PoolTimeoutError, AssertionError, asyncpg.PostgresError):
+        return False
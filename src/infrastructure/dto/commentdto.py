@@ -3,6 +3,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from src.infrastructure.utils.mapping import record_mapper
+
 
 
 class CommentDTO(BaseModel):
@@ -33,9 +35,10 @@ class CommentDTO(BaseModel):
             Returns:
                 CommentDTO: The final DTO instance.
             """
-        r = dict(record)
-        return cls(
-            id = r.get("id"),
-            content=r.get("content"),
-            session_id = r.get("session_id")
-        )
+        return _map_record(record)
+
+
+_map_record = record_mapper(
+    CommentDTO,
+    {"id": "id", "content": "content", "session_id": "session_id"},
+)
@@ -5,6 +5,8 @@ from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 
+from src.infrastructure.utils.mapping import record_mapper
+
 
 
 class GameDTO(BaseModel):
@@ -42,13 +44,18 @@ class GameDTO(BaseModel):
             Returns:
                 GameDTO: The final DTO instance.
             """
-        r = dict(record)
-        return cls(
-            id=r.get("id"),
-            title=r.get("title"),
-            description=r.get("description"),
-            min_players=r.get("min_players"),
-            max_players=r.get("max_players"),
-            rules_url=r.get("rules_url"),
-            admin_id=r.get("admin_id"),
-        )
+        return _map_record(record)
+
+
+_map_record = record_mapper(
+    GameDTO,
+    {
+        "id": "id",
+        "title": "title",
+        "description": "description",
+        "min_players": "min_players",
+        "max_players": "max_players",
+        "rules_url": "rules_url",
+        "admin_id": "admin_id",
+    },
+)
@@ -0,0 +1,18 @@
+"""A module containing DTO model for paginated listings."""
+
+from typing import Generic, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class PageDTO(BaseModel, Generic[T]):
+    """DTO for transferring a single page of a listing.
+
+    Attributes:
+        items (list[T]): The items of the page.
+        next_cursor (str | None): The opaque cursor of the next page,
+            None if this is the last page.
+    """
+    items: list[T]
+    next_cursor: Optional[str] = None
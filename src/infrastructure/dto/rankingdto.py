@@ -4,6 +4,8 @@ from uuid import UUID
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from src.infrastructure.utils.mapping import record_mapper
+
 
 class RankingDTO(BaseModel):
     """DTO for transferring ranking statistics.
@@ -37,11 +39,33 @@ class RankingDTO(BaseModel):
             Returns:
                 RankingDTO: The DTO populated with data from the record.
         """
-        r = dict(record)
-        return cls(
-            user_id=r.get("user_id"),
-            games_played=r.get("games_played"),
-            wins=r.get("wins"),
-            best_score=r.get("best_score"),
-            average_score=r.get("average_score"),
-        )
+        return _map_record(record)
+
+
+class RebuildReportDTO(BaseModel):
+    """DTO for transferring the outcome of a full ranking rebuild.
+
+        Attributes:
+            partitions (int): Number of games processed.
+            rankings (int): Number of ranking rows written.
+            scores (int): Number of session scores aggregated.
+            seconds (float): Total duration of the rebuild.
+            scores_per_second (float): Aggregation throughput.
+        """
+    partitions: int
+    rankings: int
+    scores: int
+    seconds: float
+    scores_per_second: float
+
+
+_map_record = record_mapper(
+    RankingDTO,
+    {
+        "user_id": "user_id",
+        "games_played": "games_played",
+        "wins": "wins",
+        "best_score": "best_score",
+        "average_score": "average_score",
+    },
+)
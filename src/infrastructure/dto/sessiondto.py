@@ -3,7 +3,9 @@
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from src.infrastructure.utils.mapping import record_mapper
 
 
 class SessionDTO(BaseModel):
@@ -17,6 +19,7 @@ class SessionDTO(BaseModel):
         date_added (datetime): The date when the session was added to the system.
         note (str): Optional note about the session.
         winner_id (UUID | None): The UUID of the winner (can be None).
+        scores (dict[UUID, int]): Mapping of player UUIDs to their scores.
     """
     id: int
     game_id: int
@@ -25,6 +28,7 @@ class SessionDTO(BaseModel):
     date_added: datetime
     note: Optional[str] = None
     winner_id: Optional[UUID] = None
+    scores: dict[UUID, int] = {}
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -35,18 +39,38 @@ class SessionDTO(BaseModel):
     def from_record(cls, record) -> "SessionDTO":
         """Create a SessionDTO instance from a database record.
 
+        The record is expected to carry the aggregated `scores` column
+        (a JSON object of player UUID to score).
+
         Args:
             record: A database record.
 
         Returns:
             SessionDTO: The DTO with data from the record.
         """
-        return cls(
-            id=record["id"],
-            game_id=record["game_id"],
-            user_id=record["created_by"],
-            date=record["date"],
-            date_added=record["session_date"],
-            note=record["note"],
-            winner_id=record["winner_id"]
-        )
\ No newline at end of file
+        return _map_record(record)
+
+
+_scores = TypeAdapter(dict[UUID, int])
+
+
+def _parse_scores(scores: str | dict | None) -> dict[UUID, int]:
+    if isinstance(scores, str):
+        return _scores.validate_json(scores)
+    return _scores.validate_python(scores or {})
+
+
+_map_record = record_mapper(
+    SessionDTO,
+    {
+        "id": "id",
+        "game_id": "game_id",
+        "user_id": "created_by",
+        "date": "date",
+        "date_added": "session_date",
+        "note": "note",
+        "winner_id": "winner_id",
+        "scores": "scores",
+    },
+    converters={"scores": _parse_scores},
+)
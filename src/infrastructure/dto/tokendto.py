@@ -1,6 +1,7 @@
 """A module containing token DTO models."""
 
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel, ConfigDict
 
 
@@ -11,10 +12,12 @@ class TokenDTO(BaseModel):
         access_token (str): The JWT access token.
         token_type (str): The type of token (e.g., "bearer").
         expires datetime: Token expiration date.
+        refresh_token (str | None): The rotating token used to obtain a new access token.
     """
     token_type: str
     access_token: str
     expires: datetime
+    refresh_token: Optional[str] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -28,5 +31,17 @@ class TokenPayload(BaseModel):
     Attributes:
         sub (str | None): The subject of the token, typically the user's unique identifier (UUID).
             Defaults to None.
+        email (str): The user's email address.
+        nick (str): The user's nickname.
+        is_admin (bool): Flag indicating administrative privileges.
+        registration_date (datetime): Date of registration.
+        ver (int): The token version of the user at issue time.
+        type (str): The kind of the token.
     """
-    sub: str | None = None
\ No newline at end of file
+    sub: str | None = None
+    email: str
+    nick: str
+    is_admin: bool
+    registration_date: datetime
+    ver: int
+    type: str
\ No newline at end of file
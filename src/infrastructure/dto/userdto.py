@@ -4,6 +4,8 @@ from datetime import datetime
 from uuid import UUID
 from pydantic import  BaseModel, ConfigDict
 
+from src.infrastructure.utils.mapping import record_mapper
+
 
 class UserDTO(BaseModel):
     """DTO for transferring user data.
@@ -37,10 +39,16 @@ class UserDTO(BaseModel):
         Returns:
             UserDTO: The DTO populated with data from the record.
         """
-        return cls(
-            id=record["id"],
-            email=record["email"],
-            nick=record["nick"],
-            is_admin=record["is_admin"],
-            registration_date=record["registration_date"]
-        )
\ No newline at end of file
+        return _map_record(record)
+
+
+_map_record = record_mapper(
+    UserDTO,
+    {
+        "id": "id",
+        "email": "email",
+        "nick": "nick",
+        "is_admin": "is_admin",
+        "registration_date": "registration_date",
+    },
+)
@@ -1,12 +1,16 @@
 """Module containing comment repository implementation."""
 
+from datetime import datetime
 from typing import Any, Iterable
 from pydantic import UUID4
-from sqlalchemy import desc
+from sqlalchemy import Text, cast, literal, select
 
 from src.core.repositories.icomment import ICommentRepository
 from src.db import comment_table, database
 from src.infrastructure.dto.commentdto import CommentDTO
+from src.infrastructure.utils.bus import notify_row
+from src.infrastructure.utils.etag import version_bump
+from src.infrastructure.utils.pagination import build_page, decode_cursor, keyset_query
 
 
 class CommentRepository(ICommentRepository):
@@ -21,25 +25,39 @@ class CommentRepository(ICommentRepository):
             Returns:
                 Any | None: The newly created comment DTO if successful, else None.
          """
-        query = comment_table.insert().values(**data)
-        new_id = await database.execute(query)
-
-        query_select = comment_table.select().where(comment_table.c.id == new_id)
-        record = await database.fetch_one(query_select)
+        inserted = comment_table.insert().values(**data).returning(comment_table).cte("inserted")
+        versions = version_bump(literal("comments:") + cast(inserted.c.session_id, Text))
+        query = select(inserted, notify_row("comment", inserted.c.session_id))
+        query = query.add_cte(versions.cte("versions"))
+        record = await database.fetch_one(query)
         return CommentDTO.from_record(record) if record else None
 
-    async def get_by_session(self, session_id: int) -> Iterable[Any]:
-        """Retrieve all comments from a session.
+    async def get_by_session(self, session_id: int, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of comments from a session, newest first.
 
         Args:
             session_id (int): The id of the session.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[Any]: A list of comment DTOs.
+            Any: The page of comment DTOs.
         """
-        query = comment_table.select().where(comment_table.c.session_id == session_id).order_by(desc(comment_table.c.created_at))
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+        query = keyset_query(
+            comment_table.select().where(comment_table.c.session_id == session_id),
+            [comment_table.c.created_at, comment_table.c.id],
+            after,
+            limit,
+            descending=True,
+        )
         records = await database.fetch_all(query)
-        return [CommentDTO.from_record(r) for r in records]
+        return build_page(
+            records,
+            limit,
+            key=lambda r: (r["created_at"], r["id"]),
+            mapper=CommentDTO.from_record,
+        )
 
     async def get_by_user(self, user_id: UUID4) -> Iterable[Any]:
         """Get comments by user.
@@ -64,7 +82,13 @@ class CommentRepository(ICommentRepository):
         Returns:
             bool: True if the operation executed.
         """
-        query = comment_table.delete().where(comment_table.c.id == comment_id)
-
+        deleted = (
+            comment_table.delete()
+            .where(comment_table.c.id == comment_id)
+            .returning(comment_table.c.session_id)
+            .cte("deleted")
+        )
+        versions = version_bump(literal("comments:") + cast(deleted.c.session_id, Text))
+        query = select(notify_row("comment", deleted.c.session_id)).add_cte(versions.cte("versions"))
         await database.execute(query)
         return True
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""Module containing comment repository in-memory implementation."""
+
+from datetime import datetime, timezone
+from typing import Any, Iterable
+from pydantic import UUID4
+
+from src.core.repositories.icomment import ICommentRepository
+from src.infrastructure.dto.commentdto import CommentDTO
+from src.infrastructure.repositories.memory import MemoryStore
+from src.infrastructure.utils.bus import InvalidationBus
+from src.infrastructure.utils.pagination import build_page, decode_cursor
+
+
+def _comment_key(comment: dict) -> tuple:
+    return comment["created_at"], comment["id"]
+
+
+def remove_comment(store: MemoryStore, comment_id: int) -> dict | None:
+    """Remove a comment with its index entries.
+
+    Args:
+        store (MemoryStore): The store.
+        comment_id (int): The id of the comment.
+
+    Returns:
+        dict | None: The removed row if it existed.
+    """
+    comment = store.comments.pop(comment_id, None)
+    if comment is not None:
+        if index := store.comments_by_session.get(comment["session_id"]):
+            index.discard(_comment_key(comment))
+        store.comments_by_user[comment["user_id"]].discard(comment_id)
+    return comment
+
+
+class InMemoryCommentRepository(ICommentRepository):
+    """A class implementing the comment repository in memory."""
+
+    _store: MemoryStore
+    _bus: InvalidationBus
+
+    def __init__(self, store: MemoryStore, bus: InvalidationBus) -> None:
+        """The initializer of the repository.
+
+        Args:
+            store (MemoryStore): The shared in-memory store.
+            bus (InvalidationBus): The bus the change events are dispatched to.
+        """
+        self._store = store
+        self._bus = bus
+
+    async def add_comment(self, data: dict) -> Any | None:
+        """Add a new comment to the store.
+
+            Args:
+                data (CommentBroker): The comment data.
+
+            Returns:
+                Any | None: The newly created comment DTO.
+         """
+        comment = {
+            "id": self._store.next_id("comments"),
+            "session_id": data["session_id"],
+            "user_id": data["user_id"],
+            "content": data["content"],
+            "created_at": datetime.now(timezone.utc).replace(tzinfo=None),
+        }
+        self._store.comments[comment["id"]] = comment
+        self._store.comments_by_session[comment["session_id"]].add(_comment_key(comment))
+        self._store.comments_by_user[comment["user_id"]].add(comment["id"])
+        self._bus.dispatch("comment", comment["session_id"], own=True)
+        return CommentDTO.from_record(comment)
+
+    async def get_by_session(self, session_id: int, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of comments from a session, newest first.
+
+        Args:
+            session_id (int): The id of the session.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
+
+        Returns:
+            Any: The page of comment DTOs.
+        """
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+        index = self._store.comments_by_session.get(session_id)
+        keys = index.page(after, limit, descending=True) if index else []
+        return build_page(
+            [self._store.comments[comment_id] for _, comment_id in keys],
+            limit,
+            key=_comment_key,
+            mapper=CommentDTO.from_record,
+        )
+
+    async def get_by_user(self, user_id: UUID4) -> Iterable[Any]:
+        """Get comments by user.
+
+        Args:
+             user_id (UUID4): The unique identifier of the user.
+
+        Returns:
+            Iterable[Any]: A list of comment DTOs.
+        """
+        comment_ids = sorted(self._store.comments_by_user.get(user_id, ()))
+        return [CommentDTO.from_record(self._store.comments[comment_id]) for comment_id in comment_ids]
+
+    async def delete_comment(self, comment_id: int) -> bool:
+        """Delete a comment by its ID.
+
+        Args:
+            comment_id (int): The id of the comment.
+
+        Returns:
+            bool: True if the operation executed.
+        """
+        if comment := remove_comment(self._store, comment_id):
+            self._bus.dispatch("comment", comment["session_id"], own=True)
+        return True
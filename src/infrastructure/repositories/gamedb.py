@@ -1,27 +1,100 @@
 """Module containing game repository database implementation."""
 
+import asyncio
+import time
 from typing import Any, Iterable
 from pydantic import UUID1
-from sqlalchemy import func
+from sqlalchemy import desc, select
 
+from src.config import config
 from src.core.domain.game import GameBroker, GameIn
 from src.core.repositories.igame import IGameRepository
-from src.db import game_table, database
+from src.db import game_table, session_table, database
 from src.infrastructure.dto.gamedto import GameDTO
+from src.infrastructure.utils.bus import notify_row
+from src.infrastructure.utils.etag import version_bump
+from src.infrastructure.utils.pagination import build_page, decode_cursor, keyset_query
+from src.infrastructure.utils.sampler import GameSampler
 
 
 class GameRepository(IGameRepository):
     """A class implementing the game repository."""
 
-    async def get_all(self) -> Iterable[Any]:
-        """The method getting all games from the data storage.
+    _sampler: GameSampler
+    _sampler_loaded_at: float | None
+
+    def __init__(self) -> None:
+        """The initializer of the repository."""
+        self._sampler = GameSampler()
+        self._sampler_loaded_at = None
+        self._sampler_lock = asyncio.Lock()
+
+    def _sampler_fresh(self) -> bool:
+        return (
+            self._sampler_loaded_at is not None
+            and time.monotonic() - self._sampler_loaded_at < config.GAME_SAMPLER_TTL
+        )
+
+    async def _get_sampler(self) -> GameSampler:
+        """The method returning the sampler, reloading it once it gets stale.
+
+        The sampler is kept up to date by the write methods of this process,
+        the periodic reload picks up changes made by other workers.
+        Whole games are loaded, so a pick needs no further query.
 
         Returns:
-            Iterable[Any]: The game collection.
+            GameSampler: The loaded sampler.
+        """
+        if self._sampler_fresh():
+            return self._sampler
+
+        async with self._sampler_lock:
+            if not self._sampler_fresh():
+                games = await database.fetch_all(game_table.select())
+                self._sampler.clear()
+                for game in games:
+                    self._sampler.add(GameDTO.from_record(game))
+                self._sampler_loaded_at = time.monotonic()
+
+        return self._sampler
+
+    def expire_sampler(self, game_id: int | None = None) -> None:
+        """The method forcing a reload of the sampler on the next pick.
+
+        Args:
+            game_id (int | None, optional): The changed game, unused as the
+                whole sampler is reloaded.
         """
-        query = game_table.select().order_by(game_table.c.title.asc())
+        self._sampler_loaded_at = None
+
+    def _track(self, game: GameDTO | None) -> None:
+        if game and self._sampler_loaded_at is not None:
+            self._sampler.add(game)
+
+    async def get_all(self, limit: int, cursor: str | None = None) -> Any:
+        """The method getting a page of games ordered by title.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
+
+        Returns:
+            Any: The page of games.
+        """
+        after = decode_cursor(cursor, str, int) if cursor else None
+        query = keyset_query(
+            game_table.select(),
+            [game_table.c.title, game_table.c.id],
+            after,
+            limit,
+        )
         games = await database.fetch_all(query)
-        return [GameDTO.from_record(game) for game in games]
+        return build_page(
+            games,
+            limit,
+            key=lambda game: (game["title"], game["id"]),
+            mapper=GameDTO.from_record,
+        )
 
     async def get_by_id(self, game_id: int) -> Any | None:
         """The method getting a game by id from the data storage.
@@ -71,9 +144,17 @@ class GameRepository(IGameRepository):
         Returns:
             Any | None: The newly created game.
         """
-        query = game_table.insert().values(**data.model_dump())
-        new_game_id = await database.execute(query)
-        return await self.get_by_id(new_game_id)
+        inserted = (
+            game_table.insert()
+            .values(**data.model_dump())
+            .returning(game_table)
+            .cte("inserted")
+        )
+        query = select(inserted, notify_row("game", inserted.c.id))
+        record = await database.fetch_one(query.add_cte(version_bump("games").cte("versions")))
+        game = GameDTO.from_record(record) if record else None
+        self._track(game)
+        return game
 
     async def update_game(self, game_id: int, game_data: Any) -> Any | None:
         """The method updating a game in the data storage.
@@ -87,9 +168,19 @@ class GameRepository(IGameRepository):
         """
         values = game_data.model_dump() if hasattr(game_data, 'model_dump') else game_data
 
-        query = game_table.update().where(game_table.c.id == game_id).values(**values)
-        await database.execute(query)
-        return await self.get_by_id(game_id)
+        updated = (
+            game_table.update()
+            .where(game_table.c.id == game_id)
+            .values(**values)
+            .returning(game_table)
+            .cte("updated")
+        )
+        versions = version_bump("games", f"ranking:{game_id}")
+        query = select(updated, notify_row("game", updated.c.id))
+        record = await database.fetch_one(query.add_cte(versions.cte("versions")))
+        game = GameDTO.from_record(record) if record else None
+        self._track(game)
+        return game
 
     async def delete_game(self, game_id: int) -> bool:
         """The method deleting a game from the data storage.
@@ -100,18 +191,43 @@ class GameRepository(IGameRepository):
         Returns:
             bool: Success of the operation.
         """
-        if await self.get_by_id(game_id):
-            query = game_table.delete().where(game_table.c.id == game_id)
-            await database.execute(query)
-            return True
-        return False
+        deleted = (
+            game_table.delete()
+            .where(game_table.c.id == game_id)
+            .returning(game_table.c.id)
+            .cte("deleted")
+        )
+        versions = version_bump("games", f"ranking:{game_id}")
+        query = select(deleted.c.id, notify_row("game", deleted.c.id))
+        if await database.fetch_one(query.add_cte(versions.cte("versions"))) is None:
+            return False
+
+        self._sampler.discard(game_id)
+        return True
+
+    async def get_random_game(
+        self,
+        players: int | None = None,
+        exclude_recent: int = 0,
+    ) -> Any | None:
+        """The method getting a random game from the in-process sampler.
 
-    async def get_random_game(self) -> Any | None:
-        """The method getting a random game from the data storage.
+        Args:
+            players (int | None, optional): The number of players the game must support.
+            exclude_recent (int, optional): The number of latest sessions whose
+                games are excluded.
 
         Returns:
             Any | None: The random game data.
         """
-        query = game_table.select().order_by(func.random()).limit(1)
-        game = await database.fetch_one(query)
-        return GameDTO.from_record(game) if game else None
\ No newline at end of file
+        sampler = await self._get_sampler()
+        exclude = set()
+        if exclude_recent:
+            query = (
+                select(session_table.c.game_id)
+                .order_by(desc(session_table.c.date), desc(session_table.c.id))
+                .limit(exclude_recent)
+            )
+            exclude = {row["game_id"] for row in await database.fetch_all(query)}
+
+        return sampler.choice(players, exclude)
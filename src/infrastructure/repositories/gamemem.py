@@ -0,0 +1,196 @@
+"""Module containing game repository in-memory implementation."""
+
+from typing import Any, Iterable
+from pydantic import UUID1
+
+from src.core.domain.game import GameBroker
+from src.core.repositories.igame import IGameRepository
+from src.infrastructure.dto.gamedto import GameDTO
+from src.infrastructure.repositories.memory import MemoryStore
+from src.infrastructure.repositories.rankingmem import remove_ranking
+from src.infrastructure.utils.bus import InvalidationBus
+from src.infrastructure.utils.pagination import build_page, decode_cursor
+from src.infrastructure.utils.sampler import GameSampler
+
+
+def _game_key(game: dict) -> tuple:
+    return game["title"], game["id"]
+
+
+class InMemoryGameRepository(IGameRepository):
+    """A class implementing the game repository in memory.
+
+    Titles are ordered by code point, as under the "C" collation.
+    """
+
+    _store: MemoryStore
+    _bus: InvalidationBus
+    _sampler: GameSampler
+
+    def __init__(self, store: MemoryStore, bus: InvalidationBus) -> None:
+        """The initializer of the repository.
+
+        Args:
+            store (MemoryStore): The shared in-memory store.
+            bus (InvalidationBus): The bus the change events are dispatched to.
+        """
+        self._store = store
+        self._bus = bus
+        self._sampler = GameSampler()
+
+    def expire_sampler(self, game_id: int | None = None) -> None:
+        """The method reloading the sampler from the store.
+
+        Args:
+            game_id (int | None, optional): The changed game, unused as the
+                whole sampler is reloaded.
+        """
+        self._sampler.clear()
+        for game in self._store.games.values():
+            self._sampler.add(GameDTO.from_record(game))
+
+    def _index(self, game: dict) -> None:
+        self._store.games_by_title[game["title"]].add(game["id"])
+        self._store.games_by_admin[game["admin_id"]].add(game["id"])
+        self._store.games_order.add(_game_key(game))
+        self._sampler.add(GameDTO.from_record(game))
+
+    def _unindex(self, game: dict) -> None:
+        self._store.games_by_title[game["title"]].discard(game["id"])
+        self._store.games_by_admin[game["admin_id"]].discard(game["id"])
+        self._store.games_order.discard(_game_key(game))
+        self._sampler.discard(game["id"])
+
+    async def get_all(self, limit: int, cursor: str | None = None) -> Any:
+        """The method getting a page of games ordered by title.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
+
+        Returns:
+            Any: The page of games.
+        """
+        after = decode_cursor(cursor, str, int) if cursor else None
+        keys = self._store.games_order.page(after, limit)
+        return build_page(
+            [self._store.games[game_id] for _, game_id in keys],
+            limit,
+            key=_game_key,
+            mapper=GameDTO.from_record,
+        )
+
+    async def get_by_id(self, game_id: int) -> Any | None:
+        """The method getting a game by id from the store.
+
+        Args:
+            game_id (int): The game id.
+
+        Returns:
+            Any | None: The game data.
+        """
+        game = self._store.games.get(game_id)
+        return GameDTO.from_record(game) if game else None
+
+    async def get_by_name(self, game_name: str) -> Any | None:
+        """The method getting a game by name.
+
+        Args:
+            game_name (str): The game name.
+
+        Returns:
+            Any | None: The game data.
+        """
+        game_ids = self._store.games_by_title.get(game_name)
+        return GameDTO.from_record(self._store.games[min(game_ids)]) if game_ids else None
+
+    async def get_by_admin(self, admin_id: UUID1) -> Iterable[Any]:
+        """The method getting games created by a specific admin.
+
+        Args:
+            admin_id (UUID1): The admin id.
+
+        Returns:
+            Iterable[Any]: The game collection.
+        """
+        game_ids = sorted(self._store.games_by_admin.get(admin_id, ()))
+        return [GameDTO.from_record(self._store.games[game_id]) for game_id in game_ids]
+
+    async def add_game(self, data: GameBroker) -> Any | None:
+        """The method adding a new game to the store.
+
+        Args:
+            data (GameBroker): The game attribute.
+
+        Returns:
+            Any | None: The newly created game.
+        """
+        game = {"id": self._store.next_id("games"), **data.model_dump()}
+        self._store.games[game["id"]] = game
+        self._index(game)
+        self._bus.dispatch("game", game["id"], own=True)
+        return GameDTO.from_record(game)
+
+    async def update_game(self, game_id: int, game_data: Any) -> Any | None:
+        """The method updating a game in the store.
+
+        Args:
+            game_id (int): The game id.
+            game_data (GameIn): The game attributes.
+
+        Returns:
+            Any | None: The updated game.
+        """
+        game = self._store.games.get(game_id)
+        if game is None:
+            return None
+
+        values = game_data.model_dump() if hasattr(game_data, 'model_dump') else game_data
+        self._unindex(game)
+        game.update(values)
+        self._index(game)
+        self._bus.dispatch("game", game_id, own=True)
+        return GameDTO.from_record(game)
+
+    async def delete_game(self, game_id: int) -> bool:
+        """The method deleting a game and its rankings from the store.
+
+        Args:
+            game_id (int): The game id.
+
+        Returns:
+            bool: Success of the operation.
+        """
+        game = self._store.games.pop(game_id, None)
+        if game is None:
+            return False
+
+        self._unindex(game)
+        if rankings := self._store.rankings_by_game.get(game_id):
+            for _, ranking_id in rankings.since(()):
+                remove_ranking(self._store, ranking_id)
+        self._store.rankings_by_game.pop(game_id, None)
+        self._bus.dispatch("game", game_id, own=True)
+        return True
+
+    async def get_random_game(
+        self,
+        players: int | None = None,
+        exclude_recent: int = 0,
+    ) -> Any | None:
+        """The method getting a random game from the sampler.
+
+        Args:
+            players (int | None, optional): The number of players the game must support.
+            exclude_recent (int, optional): The number of latest sessions whose
+                games are excluded.
+
+        Returns:
+            Any | None: The random game data.
+        """
+        exclude = set()
+        if exclude_recent:
+            keys = self._store.sessions_order.page(None, exclude_recent, descending=True)[:exclude_recent]
+            exclude = {self._store.sessions[session_id]["game_id"] for _, session_id in keys}
+
+        return self._sampler.choice(players, exclude)
@@ -0,0 +1,127 @@
+"""Module containing the in-process storage of the in-memory repositories."""
+
+import itertools
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from typing import Any
+from uuid import UUID
+
+
+class SortedIndex:
+    """An ordered index of row keys, the last element of a key being the row id.
+
+    It serves the keyset pages of the in-memory repositories the way the
+    composite indexes of the database serve `keyset_query`.
+    """
+
+    _keys: list[tuple]
+
+    def __init__(self) -> None:
+        """The initializer of the index."""
+        self._keys = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: tuple) -> None:
+        """The method adding a key.
+
+        Args:
+            key (tuple): The sort key of a row.
+        """
+        insort(self._keys, key)
+
+    def discard(self, key: tuple) -> None:
+        """The method removing a key if present.
+
+        Args:
+            key (tuple): The sort key of a row.
+        """
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def page(self, after: tuple | None, limit: int, descending: bool = False) -> list[tuple]:
+        """The method returning the keys following a cursor.
+
+        As `keyset_query`, it returns up to `limit + 1` keys, so the
+        presence of a next page can be detected.
+
+        Args:
+            after (tuple | None): The decoded cursor values, if any.
+            limit (int): The page size.
+            descending (bool, optional): The sort direction. Defaults to False.
+
+        Returns:
+            list[tuple]: The keys in the requested order.
+        """
+        if descending:
+            end = bisect_left(self._keys, after) if after is not None else len(self._keys)
+            return self._keys[max(end - limit - 1, 0):end][::-1]
+
+        start = bisect_right(self._keys, after) if after is not None else 0
+        return self._keys[start:start + limit + 1]
+
+    def since(self, lower: tuple) -> list[tuple]:
+        """The method returning a snapshot of the keys from a lower bound on.
+
+        Args:
+            lower (tuple): The bound, compared with the key prefix.
+
+        Returns:
+            list[tuple]: The keys in ascending order.
+        """
+        return self._keys[bisect_left(self._keys, lower):]
+
+
+class MemoryStore:
+    """The tables and indexes shared by the in-memory repositories.
+
+    Rows are plain dicts keyed by the column names of `src.db`, so the
+    DTO mappers and the services read them as they read database records.
+    Every repository method runs without awaiting in between, so it is
+    atomic on the event loop and no locking is needed. Cascading deletes
+    are applied by the repositories; other foreign keys are not enforced.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the store."""
+        self.users: dict[UUID, dict] = {}
+        self.users_by_email: dict[str, UUID] = {}
+        self.users_by_nick: dict[str, UUID] = {}
+        self.users_order = SortedIndex()
+        self.refresh_tokens: dict[str, dict] = {}
+        self.refresh_tokens_by_user: dict[UUID, set[str]] = defaultdict(set)
+
+        self.games: dict[int, dict] = {}
+        self.games_by_title: dict[str, set[int]] = defaultdict(set)
+        self.games_by_admin: dict[UUID, set[int]] = defaultdict(set)
+        self.games_order = SortedIndex()
+
+        self.sessions: dict[int, dict] = {}
+        self.session_scores: dict[int, dict[UUID, int]] = {}
+        self.sessions_by_user: dict[UUID, set[int]] = defaultdict(set)
+        self.sessions_by_game: dict[int, set[int]] = defaultdict(set)
+        self.sessions_order = SortedIndex()
+
+        self.rankings: dict[int, dict] = {}
+        self.rankings_by_user: dict[UUID, dict[int, int]] = defaultdict(dict)
+        self.rankings_by_game: dict[int, SortedIndex] = defaultdict(SortedIndex)
+        self.rankings_order = SortedIndex()
+
+        self.comments: dict[int, dict] = {}
+        self.comments_by_session: dict[int, SortedIndex] = defaultdict(SortedIndex)
+        self.comments_by_user: dict[UUID, set[int]] = defaultdict(set)
+
+        self._sequences: dict[str, Any] = defaultdict(lambda: itertools.count(1))
+
+    def next_id(self, table: str) -> int:
+        """The method returning the next value of a table's id sequence.
+
+        Args:
+            table (str): The table name.
+
+        Returns:
+            int: The new id.
+        """
+        return next(self._sequences[table])
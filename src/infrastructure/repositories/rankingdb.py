@@ -1,29 +1,302 @@
 """Module containing ranking repository implementation."""
 
+import asyncio
+import time
+from datetime import datetime
 from typing import Any, Iterable
+from uuid import UUID
 from pydantic import UUID4
-from sqlalchemy import desc
+from sqlalchemy import (
+    ARRAY,
+    Delete,
+    Float,
+    Integer,
+    Select,
+    Text,
+    Update,
+    cast,
+    column,
+    func,
+    literal,
+    select,
+    table,
+    text,
+)
+from databases.core import Connection
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, Insert, insert
 
-from src.core.repositories.iranking import IRankingRepository
-from src.db import ranking_table, database
-from src.infrastructure.dto.rankingdto import RankingDTO
+from src.core.repositories.iranking import IRankingRepository, RebuildInProgressError
+from src.db import game_table, ranking_table, session_score_table, session_table, database
+from src.infrastructure.dto.rankingdto import RankingDTO, RebuildReportDTO
+from src.infrastructure.utils.bus import notify
+from src.infrastructure.utils.etag import version_bump
+from src.infrastructure.utils.pagination import build_page, decode_cursor, keyset_query
+
+
+def session_results(scores: dict[UUID, int]) -> list[dict]:
+    """Compute the per-player results of a session.
+
+    Every player with the highest score is counted as a winner.
+
+    Args:
+        scores (dict[UUID, int]): Mapping of player UUIDs to their scores.
+
+    Returns:
+        list[dict]: The `user_id`, `score` and `win` of every player.
+    """
+    if not scores:
+        return []
+
+    max_score = max(scores.values())
+    return [
+        {"user_id": user_id, "score": score, "win": score == max_score}
+        for user_id, score in scores.items()
+    ]
+
+
+def ranking_upsert(game_id: int, results: list[dict], date: datetime) -> Insert:
+    """Build one statement applying session results to the rankings.
+
+    Rows of first-time players are inserted; existing rows are updated
+    in place with running totals, so concurrent sessions of the same player
+    cannot lose updates.
+
+    Args:
+        game_id (int): The id of the game.
+        results (list[dict]): The non-empty results as returned by `session_results`.
+        date (datetime): The date recorded for the session.
+
+    Returns:
+        Insert: The upsert statement.
+    """
+    statement = insert(ranking_table).values([
+        {
+            "user_id": result["user_id"],
+            "game_id": game_id,
+            "games_played": 1,
+            "wins": 1 if result["win"] else 0,
+            "total_score": result["score"],
+            "average_score": float(result["score"]),
+            "best_score": result["score"],
+            "first_game_date": date,
+            "last_game_date": date,
+        }
+        for result in results
+    ])
+    excluded = statement.excluded
+    games_played = ranking_table.c.games_played + 1
+    total_score = ranking_table.c.total_score + excluded.total_score
+
+    return statement.on_conflict_do_update(
+        constraint="uq_ranking_user_game",
+        set_={
+            "games_played": games_played,
+            "wins": ranking_table.c.wins + excluded.wins,
+            "total_score": total_score,
+            "average_score": cast(total_score, Float) / games_played,
+            "best_score": func.greatest(ranking_table.c.best_score, excluded.best_score),
+            "first_game_date": func.least(ranking_table.c.first_game_date, excluded.first_game_date),
+            "last_game_date": func.greatest(ranking_table.c.last_game_date, excluded.last_game_date),
+        },
+    )
+
+
+def ranking_reversal(game_id: int, results: list[dict]) -> Update:
+    """Build one statement reverting session results from the rankings.
+
+    Counters and the running total are decremented by the session's
+    results. Best score and first/last dates are recomputed from the
+    remaining scores of the affected players in this game only, so the
+    session's scores must already be deleted when the statement runs.
+
+    Args:
+        game_id (int): The id of the game.
+        results (list[dict]): The non-empty results as returned by `session_results`.
+
+    Returns:
+        Update: The update statement.
+    """
+    played = select(
+        func.unnest(
+            cast(literal([result["user_id"] for result in results]), ARRAY(PG_UUID(as_uuid=True))),
+            type_=PG_UUID(as_uuid=True),
+        ).label("user_id"),
+        func.unnest(
+            cast(literal([result["score"] for result in results]), ARRAY(Integer)),
+            type_=Integer,
+        ).label("score"),
+        func.unnest(
+            cast(literal([1 if result["win"] else 0 for result in results]), ARRAY(Integer)),
+            type_=Integer,
+        ).label("win"),
+    ).subquery("played")
+    remaining = (
+        session_score_table.join(session_table, session_table.c.id == session_score_table.c.session_id)
+    )
+
+    def remaining_aggregate(aggregate):
+        return (
+            select(aggregate)
+            .select_from(remaining)
+            .where(
+                (session_table.c.game_id == game_id) &
+                (session_score_table.c.user_id == ranking_table.c.user_id)
+            )
+            .scalar_subquery()
+        )
+
+    games_played = ranking_table.c.games_played - 1
+    total_score = ranking_table.c.total_score - played.c.score
+
+    return (
+        ranking_table.update()
+        .where(
+            (ranking_table.c.game_id == game_id) &
+            (ranking_table.c.user_id == played.c.user_id)
+        )
+        .values(
+            games_played=games_played,
+            wins=ranking_table.c.wins - played.c.win,
+            total_score=total_score,
+            average_score=func.coalesce(cast(total_score, Float) / func.nullif(games_played, 0), 0.0),
+            best_score=remaining_aggregate(func.coalesce(func.max(session_score_table.c.score), 0)),
+            first_game_date=remaining_aggregate(func.min(session_table.c.session_date)),
+            last_game_date=remaining_aggregate(func.max(session_table.c.session_date)),
+        )
+    )
+
+
+def ranking_cleanup(game_id: int, user_ids: list[UUID]) -> Delete:
+    """Build a statement removing ranking rows left without any games.
+
+    Args:
+        game_id (int): The id of the game.
+        user_ids (list[UUID]): The players whose rows were reverted.
+
+    Returns:
+        Delete: The delete statement.
+    """
+    return ranking_table.delete().where(
+        (ranking_table.c.game_id == game_id) &
+        (ranking_table.c.user_id.in_(user_ids)) &
+        (ranking_table.c.games_played <= 0)
+    )
+
+
+REBUILD_COLUMNS = [
+    "user_id",
+    "game_id",
+    "games_played",
+    "wins",
+    "total_score",
+    "average_score",
+    "best_score",
+    "first_game_date",
+    "last_game_date",
+]
+
+rebuild_table = table("rankings_rebuild", *[column(name) for name in REBUILD_COLUMNS])
+
+REBUILD_LOCK_ID = 0x726e6b
+REBUILD_RUN_LOCK_ID = 0x726e6c
+
+
+def rebuild_barrier() -> Select:
+    """Build a statement waiting until no rebuild of the rankings is running.
+
+    Writers of session scores and rankings run it first in their
+    transaction. It takes the rebuild lock in shared mode until the
+    transaction ends, so writers run concurrently with each other while a
+    rebuild, holding the lock exclusively, waits for the ones in flight
+    and keeps new ones waiting until the rankings are swapped.
+
+    Returns:
+        Select: The statement taking the lock.
+    """
+    return select(func.pg_advisory_xact_lock_shared(REBUILD_LOCK_ID))
+
+
+def partition_rebuild(game_id: int):
+    """Build a statement aggregating the rankings of one game into the staging table.
+
+    Args:
+        game_id (int): The id of the game.
+
+    Returns:
+        Select: A query inserting the rows and returning how many ranking
+            rows and score rows were processed.
+    """
+    scored = (
+        select(
+            session_score_table.c.user_id,
+            session_score_table.c.score,
+            session_table.c.game_id,
+            session_table.c.session_date,
+            func.max(session_score_table.c.score)
+            .over(partition_by=session_score_table.c.session_id)
+            .label("max_score"),
+        )
+        .select_from(
+            session_score_table.join(session_table, session_table.c.id == session_score_table.c.session_id)
+        )
+        .where(session_table.c.game_id == game_id)
+        .subquery("scored")
+    )
+    aggregated = (
+        select(
+            scored.c.user_id,
+            scored.c.game_id,
+            func.count(),
+            func.count().filter(scored.c.score == scored.c.max_score),
+            func.sum(scored.c.score),
+            cast(func.avg(scored.c.score), Float),
+            func.max(scored.c.score),
+            func.min(scored.c.session_date),
+            func.max(scored.c.session_date),
+        )
+        .group_by(scored.c.user_id, scored.c.game_id)
+    )
+    inserted = (
+        rebuild_table.insert()
+        .from_select(REBUILD_COLUMNS, aggregated)
+        .returning(rebuild_table.c.games_played)
+        .cte("inserted")
+    )
+    return select(
+        func.count().label("rankings"),
+        func.coalesce(func.sum(inserted.c.games_played), 0).label("scores"),
+    ).select_from(inserted)
 
 
 class RankingRepository(IRankingRepository):
     """A class implementing the ranking repository."""
 
-    async def get_ranking_for_game(self, game_id: int) -> Iterable[Any]:
-        """Retrieve ranking entries for a specific game.
+    async def get_ranking_for_game(self, game_id: int, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of ranking entries for a specific game.
 
         Args:
             game_id (int): The unique identifier of the game.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[Any]: A list of ranking DTOs sorted by wins (descending).
+            Any: The page of ranking DTOs sorted by wins (descending).
         """
-        query = ranking_table.select().where(ranking_table.c.game_id == game_id).order_by(desc(ranking_table.c.wins))
+        after = decode_cursor(cursor, int, int) if cursor else None
+        query = keyset_query(
+            ranking_table.select().where(ranking_table.c.game_id == game_id),
+            [ranking_table.c.wins, ranking_table.c.id],
+            after,
+            limit,
+            descending=True,
+        )
         records = await database.fetch_all(query)
-        return [RankingDTO.from_record(r) for r in records]
+        return build_page(
+            records,
+            limit,
+            key=lambda r: (r["wins"], r["id"]),
+            mapper=RankingDTO.from_record,
+        )
 
     async def get_user_scores(self, user_id: UUID4) -> Iterable[Any]:
         """Retrieve ranking statistics for a specific user across all games.
@@ -38,15 +311,31 @@ class RankingRepository(IRankingRepository):
         records = await database.fetch_all(query)
         return [RankingDTO.from_record(r) for r in records]
 
-    async def get_global_ranking(self) -> Iterable[Any]:
-        """Retrieve the global ranking of all entries.
+    async def get_global_ranking(self, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of the global ranking of all entries.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[Any]: A list of all ranking DTOs sorted by wins (descending).
+            Any: The page of ranking DTOs sorted by wins (descending).
         """
-        query = ranking_table.select().order_by(desc(ranking_table.c.wins))
+        after = decode_cursor(cursor, int, int) if cursor else None
+        query = keyset_query(
+            ranking_table.select(),
+            [ranking_table.c.wins, ranking_table.c.id],
+            after,
+            limit,
+            descending=True,
+        )
         records = await database.fetch_all(query)
-        return [RankingDTO.from_record(r) for r in records]
+        return build_page(
+            records,
+            limit,
+            key=lambda r: (r["wins"], r["id"]),
+            mapper=RankingDTO.from_record,
+        )
 
 
     async def update_ranking(self, ranking_data: dict) -> Any | None:
@@ -59,39 +348,133 @@ class RankingRepository(IRankingRepository):
         Returns:
             Any | None: None.
         """
-        query = ranking_table.select().where(
-            (ranking_table.c.user_id == ranking_data["user_id"]) &
-            (ranking_table.c.game_id == ranking_data["game_id"])
+        result = {
+            "user_id": ranking_data["user_id"],
+            "score": ranking_data["score"],
+            "win": ranking_data["win"],
+        }
+        async with database.transaction():
+            await database.execute(rebuild_barrier())
+            await database.execute(
+                ranking_upsert(ranking_data["game_id"], [result], ranking_data["date"])
+            )
+            versions = version_bump(f"ranking:{ranking_data['game_id']}")
+            await database.execute(
+                notify("ranking", ranking_data["game_id"]).add_cte(versions.cte("versions"))
+            )
+
+    async def update_rankings(self, game_id: int, scores: dict[UUID, int], date: datetime) -> None:
+        """Apply the results of a session to the rankings of all its players.
+
+        Args:
+            game_id (int): The id of the game.
+            scores (dict[UUID, int]): Mapping of player UUIDs to their scores.
+            date (datetime): The date recorded for the session.
+        """
+        if results := session_results(scores):
+            async with database.transaction():
+                await database.execute(rebuild_barrier())
+                await database.execute(ranking_upsert(game_id, results, date))
+                versions = version_bump(f"ranking:{game_id}")
+                await database.execute(notify("ranking", game_id).add_cte(versions.cte("versions")))
+
+    async def rebuild_rankings(self, concurrency: int) -> RebuildReportDTO:
+        """Rebuild the whole rankings table from sessions and their scores.
+
+        Every game is aggregated as a separate partition into an unlogged
+        staging table, up to `concurrency` partitions at a time, each on its
+        own pooled connection. The staging rows then replace the rankings in
+        a single transaction, so readers see either the old or the new table.
+
+        The rebuild holds the lock taken by `rebuild_barrier` exclusively
+        from before the partitions are read until the swap is committed.
+        Every partition therefore reads the same sessions, and sessions
+        added or deleted meanwhile wait and are applied to the new rankings.
+        The connections of the partitions are acquired before the lock, so
+        waiting writers cannot take them. The staging table is shared, so
+        only one rebuild runs at a time, whichever worker runs it.
+
+        Args:
+            concurrency (int): The number of partitions computed at once.
+
+        Raises:
+            RebuildInProgressError: If another rebuild is running.
+
+        Returns:
+            RebuildReportDTO: The sizes and throughput of the rebuild.
+        """
+        started = time.perf_counter()
+        async with database.connection() as connection:
+            lock = select(func.pg_try_advisory_lock(REBUILD_RUN_LOCK_ID))
+            if not await connection.fetch_val(lock):
+                raise RebuildInProgressError("Rankings are already being rebuilt")
+            try:
+                partitions = await self._rebuild(connection, concurrency)
+            finally:
+                await connection.execute(select(func.pg_advisory_unlock(REBUILD_RUN_LOCK_ID)))
+
+        seconds = time.perf_counter() - started
+        scores = sum(partition["scores"] for partition in partitions)
+        return RebuildReportDTO(
+            partitions=len(partitions),
+            rankings=sum(partition["rankings"] for partition in partitions),
+            scores=scores,
+            seconds=seconds,
+            scores_per_second=scores / seconds if seconds else 0.0,
         )
-        record = await database.fetch_one(query)
 
-        if record:
-            new_games = record["games_played"] + 1
-            new_wins = record["wins"] + (1 if ranking_data["win"] else 0)
+    async def _rebuild(self, connection: Connection, concurrency: int) -> list[Any]:
+        """Replace the rankings with the ones aggregated from the sessions.
 
-            current_total_score = record["average_score"] * record["games_played"]
-            new_total_score = current_total_score + ranking_data["score"]
-            new_average = new_total_score / new_games
+        Args:
+            connection (Connection): The connection holding the rebuild locks.
+            concurrency (int): The number of partitions computed at once.
 
-            new_best = max(record["best_score"], ranking_data["score"])
+        Returns:
+            list[Any]: The sizes of every partition rebuilt.
+        """
+        await connection.execute(text("DROP TABLE IF EXISTS rankings_rebuild"))
+        await connection.execute(
+            text("CREATE UNLOGGED TABLE rankings_rebuild (LIKE rankings INCLUDING DEFAULTS)")
+        )
 
-            update_query = ranking_table.update().where(ranking_table.c.id == record["id"]).values(
-                games_played=new_games,
-                wins=new_wins,
-                average_score=new_average,
-                best_score=new_best,
-                last_game_date=ranking_data["date"]
-            )
-            await database.execute(update_query)
-        else:
-            insert_query = ranking_table.insert().values(
-                user_id=ranking_data["user_id"],
-                game_id=ranking_data["game_id"],
-                games_played=1,
-                wins=1 if ranking_data["win"] else 0,
-                average_score=float(ranking_data["score"]),
-                best_score=ranking_data["score"],
-                first_game_date=ranking_data["date"],
-                last_game_date=ranking_data["date"]
-            )
-            await database.execute(insert_query)
\ No newline at end of file
+        connected = asyncio.Barrier(concurrency + 1)
+        locked = asyncio.Event()
+        partitions = []
+        pending = None
+        held = False
+
+        async def rebuild_partitions() -> None:
+            async with database.connection() as partition_connection:
+                await connected.wait()
+                await locked.wait()
+                for game_id in pending:
+                    partitions.append(await partition_connection.fetch_one(partition_rebuild(game_id)))
+
+        try:
+            async with asyncio.TaskGroup() as workers:
+                for _ in range(concurrency):
+                    workers.create_task(rebuild_partitions())
+                await connected.wait()
+                await connection.execute(select(func.pg_advisory_lock(REBUILD_LOCK_ID)))
+                held = True
+                records = await connection.fetch_all(select(game_table.c.id))
+                pending = iter([record["id"] for record in records])
+                locked.set()
+
+            async with connection.transaction():
+                await connection.execute(text("LOCK TABLE rankings IN SHARE ROW EXCLUSIVE MODE"))
+                await connection.execute(ranking_table.delete())
+                await connection.execute(
+                    ranking_table.insert().from_select(
+                        REBUILD_COLUMNS,
+                        select(*[rebuild_table.c[name] for name in REBUILD_COLUMNS]),
+                    )
+                )
+                await connection.execute(text("DROP TABLE rankings_rebuild"))
+                versions = version_bump(literal("ranking:") + cast(game_table.c.id, Text))
+                await connection.execute(notify("ranking", None).add_cte(versions.cte("versions")))
+        finally:
+            if held:
+                await connection.execute(select(func.pg_advisory_unlock(REBUILD_LOCK_ID)))
+        return partitions
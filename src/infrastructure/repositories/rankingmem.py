@@ -0,0 +1,260 @@
+"""Module containing ranking repository in-memory implementation."""
+
+import time
+from datetime import datetime
+from typing import Any, Iterable
+from uuid import UUID
+from pydantic import UUID4
+
+from src.core.repositories.iranking import IRankingRepository
+from src.infrastructure.dto.rankingdto import RankingDTO, RebuildReportDTO
+from src.infrastructure.repositories.memory import MemoryStore
+from src.infrastructure.repositories.rankingdb import session_results
+from src.infrastructure.utils.bus import InvalidationBus
+from src.infrastructure.utils.pagination import build_page, decode_cursor
+
+
+def _ranking_key(ranking: dict) -> tuple:
+    return ranking["wins"], ranking["id"]
+
+
+def _store_ranking(store: MemoryStore, ranking: dict) -> None:
+    store.rankings[ranking["id"]] = ranking
+    store.rankings_by_user[ranking["user_id"]][ranking["game_id"]] = ranking["id"]
+    store.rankings_by_game[ranking["game_id"]].add(_ranking_key(ranking))
+    store.rankings_order.add(_ranking_key(ranking))
+
+
+def _unindex_ranking(store: MemoryStore, ranking: dict) -> None:
+    store.rankings_by_game[ranking["game_id"]].discard(_ranking_key(ranking))
+    store.rankings_order.discard(_ranking_key(ranking))
+
+
+def _reindex_ranking(store: MemoryStore, ranking: dict) -> None:
+    store.rankings_by_game[ranking["game_id"]].add(_ranking_key(ranking))
+    store.rankings_order.add(_ranking_key(ranking))
+
+
+def remove_ranking(store: MemoryStore, ranking_id: int) -> None:
+    """Remove a ranking row with its index entries.
+
+    Args:
+        store (MemoryStore): The store.
+        ranking_id (int): The id of the row.
+    """
+    ranking = store.rankings.pop(ranking_id)
+    _unindex_ranking(store, ranking)
+    del store.rankings_by_user[ranking["user_id"]][ranking["game_id"]]
+
+
+def apply_results(store: MemoryStore, game_id: int, results: list[dict], date: datetime) -> None:
+    """Apply session results to the rankings, as `ranking_upsert` does.
+
+    Args:
+        store (MemoryStore): The store.
+        game_id (int): The id of the game.
+        results (list[dict]): The results as returned by `session_results`.
+        date (datetime): The date recorded for the session.
+    """
+    for result in results:
+        ranking_id = store.rankings_by_user[result["user_id"]].get(game_id)
+        if ranking_id is None:
+            _store_ranking(store, {
+                "id": store.next_id("rankings"),
+                "user_id": result["user_id"],
+                "game_id": game_id,
+                "games_played": 1,
+                "wins": 1 if result["win"] else 0,
+                "total_score": result["score"],
+                "average_score": float(result["score"]),
+                "best_score": result["score"],
+                "first_game_date": date,
+                "last_game_date": date,
+            })
+            continue
+
+        ranking = store.rankings[ranking_id]
+        _unindex_ranking(store, ranking)
+        ranking["games_played"] += 1
+        ranking["wins"] += 1 if result["win"] else 0
+        ranking["total_score"] += result["score"]
+        ranking["average_score"] = ranking["total_score"] / ranking["games_played"]
+        ranking["best_score"] = max(ranking["best_score"], result["score"])
+        ranking["first_game_date"] = min(ranking["first_game_date"], date)
+        ranking["last_game_date"] = max(ranking["last_game_date"], date)
+        _reindex_ranking(store, ranking)
+
+
+def revert_results(store: MemoryStore, game_id: int, results: list[dict]) -> None:
+    """Revert session results from the rankings, as `ranking_reversal` and `ranking_cleanup` do.
+
+    The session must already be removed from the store, as the best score
+    and the dates are recomputed from the remaining sessions of the game.
+
+    Args:
+        store (MemoryStore): The store.
+        game_id (int): The id of the game.
+        results (list[dict]): The results as returned by `session_results`.
+    """
+    for result in results:
+        ranking_id = store.rankings_by_user[result["user_id"]].get(game_id)
+        if ranking_id is None:
+            continue
+
+        ranking = store.rankings[ranking_id]
+        ranking["games_played"] -= 1
+        if ranking["games_played"] <= 0:
+            remove_ranking(store, ranking_id)
+            continue
+
+        remaining = [
+            (store.session_scores[session_id][result["user_id"]], store.sessions[session_id]["session_date"])
+            for session_id in store.sessions_by_game[game_id]
+            if result["user_id"] in store.session_scores[session_id]
+        ]
+        _unindex_ranking(store, ranking)
+        ranking["wins"] -= 1 if result["win"] else 0
+        ranking["total_score"] -= result["score"]
+        ranking["average_score"] = ranking["total_score"] / ranking["games_played"]
+        ranking["best_score"] = max((score for score, _ in remaining), default=0)
+        ranking["first_game_date"] = min((date for _, date in remaining), default=None)
+        ranking["last_game_date"] = max((date for _, date in remaining), default=None)
+        _reindex_ranking(store, ranking)
+
+
+class InMemoryRankingRepository(IRankingRepository):
+    """A class implementing the ranking repository in memory."""
+
+    _store: MemoryStore
+    _bus: InvalidationBus
+
+    def __init__(self, store: MemoryStore, bus: InvalidationBus) -> None:
+        """The initializer of the repository.
+
+        Args:
+            store (MemoryStore): The shared in-memory store.
+            bus (InvalidationBus): The bus the change events are dispatched to.
+        """
+        self._store = store
+        self._bus = bus
+
+    async def get_ranking_for_game(self, game_id: int, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of ranking entries for a specific game.
+
+        Args:
+            game_id (int): The unique identifier of the game.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
+
+        Returns:
+            Any: The page of ranking DTOs sorted by wins (descending).
+        """
+        after = decode_cursor(cursor, int, int) if cursor else None
+        index = self._store.rankings_by_game.get(game_id)
+        keys = index.page(after, limit, descending=True) if index else []
+        return build_page(
+            [self._store.rankings[ranking_id] for _, ranking_id in keys],
+            limit,
+            key=_ranking_key,
+            mapper=RankingDTO.from_record,
+        )
+
+    async def get_user_scores(self, user_id: UUID4) -> Iterable[Any]:
+        """Retrieve ranking statistics for a specific user across all games.
+
+        Args:
+            user_id (UUID4): The unique UUID of the user.
+
+        Returns:
+            Iterable[Any]: A list of ranking DTOs for the user.
+        """
+        ranking_ids = self._store.rankings_by_user.get(user_id, {}).values()
+        return [RankingDTO.from_record(self._store.rankings[ranking_id]) for ranking_id in ranking_ids]
+
+    async def get_global_ranking(self, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of the global ranking of all entries.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
+
+        Returns:
+            Any: The page of ranking DTOs sorted by wins (descending).
+        """
+        after = decode_cursor(cursor, int, int) if cursor else None
+        keys = self._store.rankings_order.page(after, limit, descending=True)
+        return build_page(
+            [self._store.rankings[ranking_id] for _, ranking_id in keys],
+            limit,
+            key=_ranking_key,
+            mapper=RankingDTO.from_record,
+        )
+
+    async def update_ranking(self, ranking_data: dict) -> Any | None:
+        """Update or create a ranking entry based on new session results.
+
+        Args:
+            ranking_data (dict): A dictionary containing 'user_id', 'game_id',
+                'win' (bool), 'score' (int), and 'date'.
+
+        Returns:
+            Any | None: None.
+        """
+        result = {
+            "user_id": ranking_data["user_id"],
+            "score": ranking_data["score"],
+            "win": ranking_data["win"],
+        }
+        apply_results(self._store, ranking_data["game_id"], [result], ranking_data["date"])
+        self._bus.dispatch("ranking", ranking_data["game_id"], own=True)
+
+    async def update_rankings(self, game_id: int, scores: dict[UUID, int], date: datetime) -> None:
+        """Apply the results of a session to the rankings of all its players.
+
+        Args:
+            game_id (int): The id of the game.
+            scores (dict[UUID, int]): Mapping of player UUIDs to their scores.
+            date (datetime): The date recorded for the session.
+        """
+        if results := session_results(scores):
+            apply_results(self._store, game_id, results, date)
+            self._bus.dispatch("ranking", game_id, own=True)
+
+    async def rebuild_rankings(self, concurrency: int) -> RebuildReportDTO:
+        """Rebuild all rankings from the stored sessions and their scores.
+
+        The sessions are replayed game by game in chronological order. The
+        rebuild runs in one step on the event loop, so `concurrency` is
+        not used.
+
+        Args:
+            concurrency (int): The number of partitions computed at once.
+
+        Returns:
+            RebuildReportDTO: The sizes and throughput of the rebuild.
+        """
+        started = time.perf_counter()
+        store = self._store
+        for ranking_id in list(store.rankings):
+            remove_ranking(store, ranking_id)
+
+        scores = 0
+        for game_id in store.games:
+            session_ids = sorted(
+                store.sessions_by_game.get(game_id, ()),
+                key=lambda session_id: store.sessions[session_id]["session_date"],
+            )
+            for session_id in session_ids:
+                results = session_results(store.session_scores[session_id])
+                apply_results(store, game_id, results, store.sessions[session_id]["session_date"])
+                scores += len(results)
+        self._bus.dispatch("ranking", None, own=True)
+
+        seconds = time.perf_counter() - started
+        return RebuildReportDTO(
+            partitions=len(store.games),
+            rankings=len(store.rankings),
+            scores=scores,
+            seconds=seconds,
+            scores_per_second=scores / seconds if seconds else 0.0,
+        )
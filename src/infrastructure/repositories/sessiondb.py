@@ -1,13 +1,51 @@
 """Module containing session repository implementation."""
 
-from typing import Any, Iterable
-from sqlalchemy import desc
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable
+from sqlalchemy import ARRAY, Integer, Text, cast, desc, func, literal, select, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from pydantic import UUID4
 
 from src.core.domain.session import SessionBroker
 from src.core.repositories.isession import ISession
 from src.db import session_table, session_score_table, database
 from src.infrastructure.dto.sessiondto import SessionDTO
+from src.infrastructure.repositories.rankingdb import (
+    ranking_cleanup,
+    ranking_reversal,
+    ranking_upsert,
+    rebuild_barrier,
+    session_results,
+)
+from src.infrastructure.utils.bus import notify, notify_row
+from src.infrastructure.utils.etag import version_bump
+from src.infrastructure.utils.pagination import build_page, decode_cursor, keyset_query
+
+
+def _sessions_with_scores():
+    """Build a select of sessions with their scores aggregated per row.
+
+    Scores are folded into a JSON object (player UUID -> score) by a
+    correlated subquery, so a listing of any size is served by one query.
+
+    Returns:
+        Select: The query selecting session columns and `scores`.
+    """
+    scores = (
+        select(
+            func.coalesce(
+                func.json_object_agg(
+                    session_score_table.c.user_id,
+                    session_score_table.c.score,
+                ),
+                text("'{}'::json"),
+            )
+        )
+        .where(session_score_table.c.session_id == session_table.c.id)
+        .scalar_subquery()
+        .label("scores")
+    )
+    return select(session_table, scores)
 
 
 class SessionRepository(ISession):
@@ -16,14 +54,19 @@ class SessionRepository(ISession):
     async def add_session(self, data: SessionBroker) -> Any | None:
         """Add a new session to the database.
 
+            The session, the scores and the rankings of all players are written
+            by a single statement, the rankings with an upsert, once a running
+            rebuild of the rankings has finished.
+
             Args:
                 data (SessionBroker): The session data including scores.
 
             Returns:
                 Any | None: The newly created session DTO.
         """
-        async with database.transaction():
-            query_session = session_table.insert().values(
+        new_session = (
+            session_table.insert()
+            .values(
                 game_id=data.game_id,
                 created_by=data.user_id,
                 session_date=data.date_added,
@@ -31,21 +74,36 @@ class SessionRepository(ISession):
                 note=data.note,
                 winner_id=data.winner_id,
             )
-            new_session_id = await database.execute(query_session)
-
-            score_values = []
-            for player_id, score in data.scores.items():
-                score_values.append({
-                    "session_id": new_session_id,
-                    "user_id": player_id,
-                    "score": score
-                })
+            .returning(session_table)
+            .cte("new_session")
+        )
+        query = select(new_session)
+
+        if data.scores:
+            players = list(data.scores)
+            scores = [data.scores[player] for player in players]
+            new_scores = session_score_table.insert().from_select(
+                ["session_id", "user_id", "score"],
+                select(
+                    new_session.c.id,
+                    func.unnest(cast(literal(players), ARRAY(PG_UUID(as_uuid=True)))),
+                    func.unnest(cast(literal(scores), ARRAY(Integer))),
+                ),
+            )
+            query = query.add_cte(new_scores.cte("new_scores"))
 
-            if score_values:
-                query_scores = session_score_table.insert().values(score_values)
-                await database.execute(query_scores)
+        if results := session_results(data.scores):
+            rankings = ranking_upsert(data.game_id, results, data.date_added)
+            query = query.add_cte(rankings.cte("rankings"))
+            query = query.add_cte(version_bump(f"ranking:{data.game_id}").cte("versions"))
+            query = query.add_columns(notify_row("ranking", new_session.c.game_id))
 
-            return await self.get_session_by_id(new_session_id)
+        async with database.transaction():
+            await database.execute(rebuild_barrier())
+            record = await database.fetch_one(query)
+        if record is None:
+            return None
+        return SessionDTO.from_record({**record._mapping, "scores": data.scores})
 
     async def get_session_by_id(self, session_id: int) -> Any | None:
         """Retrieve a session by its ID.
@@ -56,44 +114,61 @@ class SessionRepository(ISession):
             Returns:
                 Any | None: The session DTO if found, else None.
         """
-        query = session_table.select().where(session_table.c.id == session_id)
-        session_record = await database.fetch_one(query)
-
-        if not session_record:
-            return None
+        query = _sessions_with_scores().where(session_table.c.id == session_id)
+        record = await database.fetch_one(query)
+        return SessionDTO.from_record(record) if record else None
 
-        query_scores = session_score_table.select().where(session_score_table.c.session_id == session_id)
-        scores_records = await database.fetch_all(query_scores)
+    async def get_all_sessions(self, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of sessions ordered by date descending.
 
+            Args:
+                limit (int): The page size.
+                cursor (str | None): The cursor of the page to fetch.
 
-        return SessionDTO(
-            id=session_record["id"],
-            game_id=session_record["game_id"],
-            user_id=session_record["created_by"],
-            date=session_record["date"],
-            date_added=session_record["session_date"],
-            note=session_record["note"],
-            winner_id=session_record["winner_id"],
+            Returns:
+                Any: The page of session DTOs.
+        """
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+        query = keyset_query(
+            _sessions_with_scores(),
+            [session_table.c.date, session_table.c.id],
+            after,
+            limit,
+            descending=True,
+        )
+        sessions = await database.fetch_all(query)
+        return build_page(
+            sessions,
+            limit,
+            key=lambda sess: (sess["date"], sess["id"]),
+            mapper=SessionDTO.from_record,
         )
 
-    async def get_all_sessions(self) -> Iterable[Any]:
-        """Retrieve all sessions ordered by date descending.
+    async def iterate_sessions(self, since: datetime | None = None) -> AsyncIterator[Any]:
+        """Stream sessions in chronological order through a server-side cursor.
 
-            Returns:
-                Iterable[Any]: A list of session DTOs.
+            Args:
+                since (datetime | None): If given, only sessions played
+                    at or after this date are returned.
+
+            Yields:
+                Any: The consecutive session DTOs.
         """
-        query = session_table.select().order_by(desc(session_table.c.date))
-        sessions = await database.fetch_all(query)
+        query = _sessions_with_scores()
+        if since is not None:
+            query = query.where(session_table.c.date >= since)
+        query = query.order_by(session_table.c.date, session_table.c.id)
 
-        result = []
-        for sess in sessions:
-            full_session = await self.get_session_by_id(sess["id"])
-            if full_session:
-                result.append(full_session)
-        return result
+        async for record in database.iterate(query):
+            yield SessionDTO.from_record(record)
 
     async def delete_session(self, session_id: int) -> bool:
-        """Delete a session record.
+        """Delete a session record and revert its effect on the rankings.
+
+            Only the ranking rows of the session's players are touched, in the
+            same transaction as the deletion, once a running rebuild of the
+            rankings has finished. The events are published by the
+            deleting and the cleanup statements.
 
             Args:
                 session_id (int): The ID of the session.
@@ -101,13 +176,37 @@ class SessionRepository(ISession):
             Returns:
                 bool: Success of the operation.
         """
-        check_query = session_table.select().where(session_table.c.id == session_id)
-        if not await database.fetch_one(check_query):
-            return False
+        async with database.transaction():
+            await database.execute(rebuild_barrier())
+            query_scores = (
+                session_score_table.delete()
+                .where(session_score_table.c.session_id == session_id)
+                .returning(session_score_table.c.user_id, session_score_table.c.score)
+            )
+            scores = await database.fetch_all(query_scores)
 
-        query = session_table.delete().where(session_table.c.id == session_id)
-        await database.execute(query)
-        return True
+            deleted = (
+                session_table.delete()
+                .where(session_table.c.id == session_id)
+                .returning(session_table.c.id, session_table.c.game_id)
+                .cte("deleted")
+            )
+            versions = version_bump(
+                f"comments:{session_id}",
+                literal("ranking:") + cast(deleted.c.game_id, Text),
+            )
+            query = select(deleted.c.game_id, notify_row("comment", deleted.c.id))
+            query = query.add_cte(versions.cte("versions"))
+            game_id = await database.fetch_val(query)
+            if game_id is None:
+                return False
+
+            results = session_results({score["user_id"]: score["score"] for score in scores})
+            if results:
+                await database.execute(ranking_reversal(game_id, results))
+                cleanup = ranking_cleanup(game_id, [result["user_id"] for result in results])
+                await database.execute(notify("ranking", game_id).add_cte(cleanup.cte("cleanup")))
+            return True
 
     async def get_by_user(self, user_id: UUID4) -> Iterable[Any]:
         """Get all sessions created by a specific user.
@@ -118,13 +217,10 @@ class SessionRepository(ISession):
         Returns:
             Iterable[Any]: A list of sessions.
         """
-        query = session_table.select().where(session_table.c.created_by == user_id).order_by(desc(session_table.c.date))
+        query = (
+            _sessions_with_scores()
+            .where(session_table.c.created_by == user_id)
+            .order_by(desc(session_table.c.date))
+        )
         sessions = await database.fetch_all(query)
-
-        result = []
-        for sess in sessions:
-            full_session = await self.get_session_by_id(sess["id"])
-            if full_session:
-                result.append(full_session)
-        return result
-
+        return [SessionDTO.from_record(sess) for sess in sessions]
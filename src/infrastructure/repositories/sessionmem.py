@@ -0,0 +1,165 @@
+"""Module containing session repository in-memory implementation."""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable
+from pydantic import UUID4
+
+from src.core.domain.session import SessionBroker
+from src.core.repositories.isession import ISession
+from src.infrastructure.dto.sessiondto import SessionDTO
+from src.infrastructure.repositories.commentmem import remove_comment
+from src.infrastructure.repositories.memory import MemoryStore
+from src.infrastructure.repositories.rankingdb import session_results
+from src.infrastructure.repositories.rankingmem import apply_results, revert_results
+from src.infrastructure.utils.bus import InvalidationBus
+from src.infrastructure.utils.pagination import build_page, decode_cursor
+
+
+def _session_key(session: dict) -> tuple:
+    return session["date"], session["id"]
+
+
+class InMemorySessionRepository(ISession):
+    """A class implementing the session repository in memory."""
+
+    _store: MemoryStore
+    _bus: InvalidationBus
+
+    def __init__(self, store: MemoryStore, bus: InvalidationBus) -> None:
+        """The initializer of the repository.
+
+        Args:
+            store (MemoryStore): The shared in-memory store.
+            bus (InvalidationBus): The bus the change events are dispatched to.
+        """
+        self._store = store
+        self._bus = bus
+
+    def _record(self, session_id: int) -> dict:
+        return {**self._store.sessions[session_id], "scores": self._store.session_scores[session_id]}
+
+    async def add_session(self, data: SessionBroker) -> Any | None:
+        """Add a new session along with its scores and their effect on the rankings.
+
+            Args:
+                data (SessionBroker): The session data including scores.
+
+            Returns:
+                Any | None: The newly created session DTO.
+        """
+        store = self._store
+        session = {
+            "id": store.next_id("sessions"),
+            "game_id": data.game_id,
+            "created_by": data.user_id,
+            "session_date": data.date_added,
+            "date": data.date,
+            "note": data.note,
+            "winner_id": data.winner_id,
+        }
+        store.sessions[session["id"]] = session
+        store.session_scores[session["id"]] = dict(data.scores)
+        store.sessions_by_user[data.user_id].add(session["id"])
+        store.sessions_by_game[data.game_id].add(session["id"])
+        store.sessions_order.add(_session_key(session))
+
+        if results := session_results(data.scores):
+            apply_results(store, data.game_id, results, data.date_added)
+            self._bus.dispatch("ranking", data.game_id, own=True)
+
+        return SessionDTO.from_record(self._record(session["id"]))
+
+    async def get_session_by_id(self, session_id: int) -> Any | None:
+        """Retrieve a session by its ID.
+
+            Args:
+                session_id (int): The ID of the session.
+
+            Returns:
+                Any | None: The session DTO if found, else None.
+        """
+        if session_id not in self._store.sessions:
+            return None
+        return SessionDTO.from_record(self._record(session_id))
+
+    async def get_all_sessions(self, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of sessions ordered by date descending.
+
+            Args:
+                limit (int): The page size.
+                cursor (str | None): The cursor of the page to fetch.
+
+            Returns:
+                Any: The page of session DTOs.
+        """
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+        keys = self._store.sessions_order.page(after, limit, descending=True)
+        return build_page(
+            [self._record(session_id) for _, session_id in keys],
+            limit,
+            key=_session_key,
+            mapper=SessionDTO.from_record,
+        )
+
+    async def iterate_sessions(self, since: datetime | None = None) -> AsyncIterator[Any]:
+        """Stream sessions in chronological order.
+
+            The order is taken as a snapshot when the stream starts, sessions
+            deleted meanwhile are skipped.
+
+            Args:
+                since (datetime | None): If given, only sessions played
+                    at or after this date are returned.
+
+            Yields:
+                Any: The consecutive session DTOs.
+        """
+        lower = (since,) if since is not None else ()
+        for _, session_id in self._store.sessions_order.since(lower):
+            if session_id in self._store.sessions:
+                yield SessionDTO.from_record(self._record(session_id))
+
+    async def delete_session(self, session_id: int) -> bool:
+        """Delete a session with its comments and revert its effect on the rankings.
+
+            Args:
+                session_id (int): The ID of the session.
+
+            Returns:
+                bool: Success of the operation.
+        """
+        store = self._store
+        session = store.sessions.pop(session_id, None)
+        if session is None:
+            return False
+
+        scores = store.session_scores.pop(session_id)
+        store.sessions_by_user[session["created_by"]].discard(session_id)
+        store.sessions_by_game[session["game_id"]].discard(session_id)
+        store.sessions_order.discard(_session_key(session))
+        comments = store.comments_by_session.pop(session_id, None)
+        for _, comment_id in comments.since(()) if comments else ():
+            remove_comment(store, comment_id)
+        self._bus.dispatch("comment", session_id, own=True)
+
+        if results := session_results(scores):
+            revert_results(store, session["game_id"], results)
+            self._bus.dispatch("ranking", session["game_id"], own=True)
+        return True
+
+    async def get_by_user(self, user_id: UUID4) -> Iterable[Any]:
+        """Get all sessions created by a specific user.
+
+        Args:
+            user_id (UUID4): The UUID of the user.
+
+        Returns:
+            Iterable[Any]: A list of sessions.
+        """
+        session_ids = self._store.sessions_by_user.get(user_id, ())
+        records = sorted(
+            (self._record(session_id) for session_id in session_ids),
+            key=_session_key,
+            reverse=True,
+        )
+        return [SessionDTO.from_record(record) for record in records]
@@ -1,10 +1,15 @@
 """Module containing user repository implementation."""
 
+from datetime import datetime, timezone
 from typing import Any
+from uuid import UUID
 from pydantic import UUID1
+from sqlalchemy import func, literal, select
 from src.core.repositories.iuser import IUserRepository
-from src.db import user_table, database
+from src.db import refresh_token_table, user_table, database
 from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.utils.bus import notify
+from src.infrastructure.utils.pagination import build_page, decode_cursor, keyset_query
 
 class UserRepository(IUserRepository):
     """A class implementing the user repository."""
@@ -47,6 +52,126 @@ class UserRepository(IUserRepository):
         query = user_table.select().where(user_table.c.nick == nick)
         return await database.fetch_one(query)
 
+    async def get_token_version(self, uuid: UUID1) -> int | None:
+        """Retrieve the current token version of a user.
+
+        Args:
+            uuid (UUID1): The user's UUID.
+
+        Returns:
+            int | None: The token version if the user exists, otherwise None.
+        """
+        query = select(user_table.c.token_version).where(user_table.c.id == uuid)
+        return await database.fetch_val(query)
+
+    async def bump_token_version(self, uuid: UUID1) -> int | None:
+        """Increment the token version, invalidating previously issued tokens.
+
+        Refresh tokens of the user are removed as well.
+
+        Args:
+            uuid (UUID1): The user's UUID.
+
+        Returns:
+            int | None: The new token version if the user exists, otherwise None.
+        """
+        query = (
+            user_table.update()
+            .where(user_table.c.id == uuid)
+            .values(token_version=user_table.c.token_version + 1)
+            .returning(user_table.c.token_version)
+        )
+        async with database.transaction():
+            await database.execute(
+                refresh_token_table.delete().where(refresh_token_table.c.user_id == uuid)
+            )
+            version = await database.fetch_val(query)
+            if version is not None:
+                await database.execute(notify("user", uuid))
+            return version
+
+    async def add_refresh_token(self, uuid: UUID1, token_hash: str, expires_at: datetime) -> None:
+        """Store a refresh token issued to a user.
+
+        The expired tokens of the user are deleted by the same statement.
+
+        Args:
+            uuid (UUID1): The user's UUID.
+            token_hash (str): The keyed hash of the token.
+            expires_at (datetime): The expiration date of the token.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expired = (
+            refresh_token_table.delete()
+            .where(
+                (refresh_token_table.c.user_id == uuid) &
+                (refresh_token_table.c.expires_at <= now)
+            )
+            .returning(refresh_token_table.c.id)
+            .cte("expired")
+        )
+        query = refresh_token_table.insert().values(
+            user_id=uuid,
+            token_hash=token_hash,
+            expires_at=expires_at,
+        ).add_cte(expired)
+        await database.execute(query)
+
+    async def purge_refresh_tokens(self) -> int:
+        """Delete the expired refresh tokens of all users.
+
+        Returns:
+            int: The number of tokens deleted.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        purged = (
+            refresh_token_table.delete()
+            .where(refresh_token_table.c.expires_at <= now)
+            .returning(refresh_token_table.c.id)
+            .cte("purged")
+        )
+        return await database.fetch_val(select(func.count()).select_from(purged))
+
+    async def rotate_refresh_token(
+        self,
+        token_hash: str,
+        new_token_hash: str,
+        expires_at: datetime,
+    ) -> Any | None:
+        """Replace a valid refresh token with a new one in a single statement.
+
+        The presented token is deleted, so it cannot be used twice.
+
+        Args:
+            token_hash (str): The hash of the presented token.
+            new_token_hash (str): The hash of the token replacing it.
+            expires_at (datetime): The expiration date of the new token.
+
+        Returns:
+            Any | None: The user record if the token was valid, otherwise None.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        consumed = (
+            refresh_token_table.delete()
+            .where(
+                (refresh_token_table.c.token_hash == token_hash) &
+                (refresh_token_table.c.expires_at > now)
+            )
+            .returning(refresh_token_table.c.user_id)
+            .cte("consumed")
+        )
+        inserted = (
+            refresh_token_table.insert()
+            .from_select(
+                ["user_id", "token_hash", "expires_at"],
+                select(consumed.c.user_id, literal(new_token_hash), literal(expires_at)),
+            )
+            .returning(refresh_token_table.c.user_id)
+            .cte("inserted")
+        )
+        query = select(user_table).join(inserted, user_table.c.id == inserted.c.user_id)
+        return await database.fetch_one(query)
+
     async def register_user(self, user_data: dict) -> Any | None:
         """Register a new user in the database.
 
@@ -58,16 +183,31 @@ class UserRepository(IUserRepository):
         Returns:
             Any | None: The newly registered user DTO.
         """
-        query = user_table.insert().values(**user_data)
-        new_id = await database.execute(query)
-        return await self.get_by_uuid(new_id)
+        query = user_table.insert().values(**user_data).returning(user_table)
+        user = await database.fetch_one(query)
+        return UserDTO.from_record(user) if user else None
+
+    async def get_all(self, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of users ordered by nick.
 
-    async def get_all(self) -> list[UserDTO]:
-        """Retrieve all users from the database.
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[Any]: A list of user DTOs.
+            Any: The page of user DTOs.
         """
-        query = user_table.select().order_by(user_table.c.nick)
+        after = decode_cursor(cursor, str, UUID) if cursor else None
+        query = keyset_query(
+            user_table.select(),
+            [user_table.c.nick, user_table.c.id],
+            after,
+            limit,
+        )
         users = await database.fetch_all(query)
-        return [UserDTO.from_record(user) for user in users]
\ No newline at end of file
+        return build_page(
+            users,
+            limit,
+            key=lambda user: (user["nick"], user["id"]),
+            mapper=UserDTO.from_record,
+        )
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""Module containing user repository in-memory implementation."""
+
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+from pydantic import UUID1
+
+from src.core.repositories.iuser import IUserRepository
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.repositories.memory import MemoryStore
+from src.infrastructure.utils.bus import InvalidationBus
+from src.infrastructure.utils.pagination import build_page, decode_cursor
+
+
+def _user_key(user: dict) -> tuple:
+    return user["nick"], user["id"]
+
+
+class InMemoryUserRepository(IUserRepository):
+    """A class implementing the user repository in memory.
+
+    Nicks are ordered by code point, as under the "C" collation.
+    """
+
+    _store: MemoryStore
+    _bus: InvalidationBus
+
+    def __init__(self, store: MemoryStore, bus: InvalidationBus) -> None:
+        """The initializer of the repository.
+
+        Args:
+            store (MemoryStore): The shared in-memory store.
+            bus (InvalidationBus): The bus the change events are dispatched to.
+        """
+        self._store = store
+        self._bus = bus
+
+    async def get_by_email(self, email: str) -> Any | None:
+        """Retrieve a user row by their email address.
+
+        Args:
+            email (EmailStr): The user's email.
+
+        Returns:
+            Any | None: The user row if found, otherwise None.
+        """
+        user_id = self._store.users_by_email.get(email)
+        return self._store.users[user_id] if user_id else None
+
+    async def get_by_uuid(self, uuid: UUID1) -> UserDTO | None:
+        """Retrieve a user by their UUID.
+
+        Args:
+            uuid (str): The user's UUID string.
+
+        Returns:
+            Any | None: The user DTO if found, otherwise None.
+        """
+        user = self._store.users.get(uuid)
+        return UserDTO.from_record(user) if user else None
+
+    async def get_by_nickname(self, nick: str) -> Any | None:
+        """Retrieve a user row by their nickname.
+
+        Args:
+            nick (str): The user's nickname.
+
+        Returns:
+            Any | None: The user row if found, otherwise None.
+        """
+        user_id = self._store.users_by_nick.get(nick)
+        return self._store.users[user_id] if user_id else None
+
+    async def get_token_version(self, uuid: UUID1) -> int | None:
+        """Retrieve the current token version of a user.
+
+        Args:
+            uuid (UUID1): The user's UUID.
+
+        Returns:
+            int | None: The token version if the user exists, otherwise None.
+        """
+        user = self._store.users.get(uuid)
+        return user["token_version"] if user else None
+
+    async def bump_token_version(self, uuid: UUID1) -> int | None:
+        """Increment the token version, invalidating previously issued tokens.
+
+        Refresh tokens of the user are removed as well.
+
+        Args:
+            uuid (UUID1): The user's UUID.
+
+        Returns:
+            int | None: The new token version if the user exists, otherwise None.
+        """
+        for token_hash in self._store.refresh_tokens_by_user.pop(uuid, ()):
+            self._store.refresh_tokens.pop(token_hash, None)
+
+        user = self._store.users.get(uuid)
+        if user is None:
+            return None
+
+        user["token_version"] += 1
+        self._bus.dispatch("user", str(uuid), own=True)
+        return user["token_version"]
+
+    async def add_refresh_token(self, uuid: UUID1, token_hash: str, expires_at: datetime) -> None:
+        """Store a refresh token issued to a user.
+
+        The expired tokens of the user are deleted.
+
+        Args:
+            uuid (UUID1): The user's UUID.
+            token_hash (str): The keyed hash of the token.
+            expires_at (datetime): The expiration date of the token.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        tokens = self._store.refresh_tokens_by_user[uuid]
+        expired = [stored for stored in tokens if self._store.refresh_tokens[stored]["expires_at"] <= now]
+        for stored in expired:
+            tokens.discard(stored)
+            del self._store.refresh_tokens[stored]
+
+        self._store.refresh_tokens[token_hash] = {"user_id": uuid, "expires_at": expires_at}
+        tokens.add(token_hash)
+
+    async def purge_refresh_tokens(self) -> int:
+        """Delete the expired refresh tokens of all users.
+
+        Returns:
+            int: The number of tokens deleted.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expired = [
+            (token_hash, token["user_id"])
+            for token_hash, token in self._store.refresh_tokens.items()
+            if token["expires_at"] <= now
+        ]
+        for token_hash, user_id in expired:
+            del self._store.refresh_tokens[token_hash]
+            self._store.refresh_tokens_by_user[user_id].discard(token_hash)
+        return len(expired)
+
+    async def rotate_refresh_token(
+        self,
+        token_hash: str,
+        new_token_hash: str,
+        expires_at: datetime,
+    ) -> Any | None:
+        """Replace a valid refresh token with a new one.
+
+        The presented token is deleted, so it cannot be used twice.
+
+        Args:
+            token_hash (str): The hash of the presented token.
+            new_token_hash (str): The hash of the token replacing it.
+            expires_at (datetime): The expiration date of the new token.
+
+        Returns:
+            Any | None: The user row if the token was valid, otherwise None.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        token = self._store.refresh_tokens.get(token_hash)
+        if token is None or token["expires_at"] <= now:
+            return None
+
+        del self._store.refresh_tokens[token_hash]
+        self._store.refresh_tokens_by_user[token["user_id"]].discard(token_hash)
+        await self.add_refresh_token(token["user_id"], new_token_hash, expires_at)
+        return self._store.users.get(token["user_id"])
+
+    async def register_user(self, user_data: dict) -> Any | None:
+        """Register a new user in the store.
+
+        Args:
+            user (UserIn): The user registration data.
+
+        Raises:
+            ValueError: If the email or the nick is already taken.
+
+        Returns:
+            Any | None: The newly registered user DTO.
+        """
+        if user_data["email"] in self._store.users_by_email:
+            raise ValueError("Email is already taken")
+        if user_data["nick"] in self._store.users_by_nick:
+            raise ValueError("Nick is already taken")
+
+        user = {
+            "id": uuid4(),
+            "is_admin": False,
+            "token_version": 0,
+            "registration_date": datetime.now(),
+            **user_data,
+        }
+        self._store.users[user["id"]] = user
+        self._store.users_by_email[user["email"]] = user["id"]
+        self._store.users_by_nick[user["nick"]] = user["id"]
+        self._store.users_order.add(_user_key(user))
+        return UserDTO.from_record(user)
+
+    async def get_all(self, limit: int, cursor: str | None = None) -> Any:
+        """Retrieve a page of users ordered by nick.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
+
+        Returns:
+            Any: The page of user DTOs.
+        """
+        after = decode_cursor(cursor, str, UUID) if cursor else None
+        keys = self._store.users_order.page(after, limit)
+        return build_page(
+            [self._store.users[user_id] for _, user_id in keys],
+            limit,
+            key=_user_key,
+            mapper=UserDTO.from_record,
+        )
@@ -6,6 +6,7 @@ from uuid import UUID
 from src.core.domain.comment import CommentBroker
 from src.core.repositories.icomment import ICommentRepository
 from src.infrastructure.dto.commentdto import CommentDTO
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.services.icomment import ICommentService
 
 
@@ -34,16 +35,18 @@ class CommentService(ICommentService):
         comment_data = data.model_dump()
         return await self._repository.add_comment(comment_data)
 
-    async def get_by_session(self, session_id: int) -> Iterable[CommentDTO]:
-        """The method getting comments for a session.
+    async def get_by_session(self, session_id: int, limit: int, cursor: str | None = None) -> PageDTO[CommentDTO]:
+        """The method getting a page of comments for a session.
 
         Args:
             session_id (int): The session id.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[CommentDTO]: Collection of comments.
+            PageDTO[CommentDTO]: A page of comments.
         """
-        return await self._repository.get_by_session(session_id)
+        return await self._repository.get_by_session(session_id, limit, cursor)
 
     async def delete_comment(self, comment_id: int, user_id: UUID) -> bool:
         """The method deleting a comment.
@@ -6,29 +6,55 @@ from pydantic import UUID1
 from src.core.domain.game import GameBroker, GameIn
 from src.core.repositories.igame import IGameRepository
 from src.infrastructure.dto.gamedto import GameDTO
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.services.igame import IGameService
+from src.infrastructure.utils.cache import TTLCache
 
 
 class GameService(IGameService):
     """A class implementing the game service."""
 
     _repository: IGameRepository
+    _cache: TTLCache
 
-    def __init__(self, repository: IGameRepository) -> None:
+    def __init__(self, repository: IGameRepository, cache: TTLCache) -> None:
         """Initialize the GameService.
 
             Args:
                 repository (IGameRepository): The game repository instance.
+                cache (TTLCache): The shared read-through cache of the catalog.
         """
         self._repository = repository
+        self._cache = cache
 
-    async def get_all(self) -> Iterable[GameDTO]:
-        """Retrieve all games.
+    def _invalidate(self, *games: GameDTO | None) -> None:
+        """Drop the cached lookups of the given games and all cached pages.
+
+            Args:
+                *games (GameDTO | None): The games whose entries are stale.
+        """
+        for game in games:
+            if game:
+                self._cache.invalidate(("id", game.id))
+                self._cache.invalidate(("name", game.title))
+        self._cache.invalidate_where(lambda key: key[0] == "all")
+
+    async def get_all(self, limit: int, cursor: str | None = None) -> PageDTO[GameDTO]:
+        """Retrieve a page of games.
+
+            Args:
+                limit (int): The page size.
+                cursor (str | None): The cursor of the page to fetch.
 
             Returns:
-                Iterable[GameDTO]: A list of game data transfer objects.
+                PageDTO[GameDTO]: A page of game data transfer objects.
             """
-        return await self._repository.get_all()
+        key = ("all", limit, cursor)
+        if (page := self._cache.get(key)) is None:
+            generation = self._cache.generation(key)
+            page = await self._repository.get_all(limit, cursor)
+            self._cache.set(key, page, generation)
+        return page
 
     async def get_by_id(self, game_id: int) -> GameDTO | None:
         """Retrieve a game by its id.
@@ -39,7 +65,28 @@ class GameService(IGameService):
             Returns:
                 GameDTO | None: The game object if found otherwise None.
             """
-        return await self._repository.get_by_id(game_id)
+        key = ("id", game_id)
+        if (game := self._cache.get(key)) is None:
+            generation = self._cache.generation(key)
+            if game := await self._repository.get_by_id(game_id):
+                self._cache.set(key, game, generation)
+        return game
+
+    async def get_by_name(self, game_name: str) -> GameDTO | None:
+        """Retrieve a game by its title.
+
+            Args:
+                game_name (str): The title of the game.
+
+            Returns:
+                GameDTO | None: The game object if found otherwise None.
+            """
+        key = ("name", game_name)
+        if (game := self._cache.get(key)) is None:
+            generation = self._cache.generation(key)
+            if game := await self._repository.get_by_name(game_name):
+                self._cache.set(key, game, generation)
+        return game
 
     async def get_by_admin(self, admin_id: UUID1) -> Iterable[GameDTO]:
         #nieużywana
@@ -56,7 +103,9 @@ class GameService(IGameService):
                 GameDTO | None: The created game object.
         """
         game_data = GameBroker(**data.model_dump(), admin_id=admin_id)
-        return await self._repository.add_game(game_data)
+        new_game = await self._repository.add_game(game_data)
+        self._invalidate(new_game)
+        return new_game
 
     async def update_game(self, game_id: int, game: GameIn) -> GameDTO | None:
         """Update an existing game.
@@ -68,7 +117,10 @@ class GameService(IGameService):
         Returns:
             GameDTO | None: The updated game object if successful, otherwise None.
         """
-        return await self._repository.update_game(game_id, game)
+        old_game = await self.get_by_id(game_id)
+        updated_game = await self._repository.update_game(game_id, game)
+        self._invalidate(old_game, updated_game)
+        return updated_game
 
     async def delete_game(self, game_id: int) -> bool:
         """Delete a game.
@@ -79,7 +131,49 @@ class GameService(IGameService):
             Returns:
                 bool: sukccess of the operation.
          """
-        return await self._repository.delete_game(game_id)
+        old_game = await self.get_by_id(game_id)
+        deleted = await self._repository.delete_game(game_id)
+        if deleted:
+            self._invalidate(old_game)
+        return deleted
+
+    async def get_random_game(
+        self,
+        players: int | None = None,
+        exclude_recent: int = 0,
+    ) -> GameDTO | None:
+        """Retrieve a random game.
 
-    async def get_random_game(self) -> GameDTO | None:
-        return await self._repository.get_random_game()
\ No newline at end of file
+            Args:
+                players (int | None, optional): The number of players the game must support.
+                exclude_recent (int, optional): The number of latest sessions whose
+                    games are excluded.
+
+            Returns:
+                GameDTO | None: The game object if any game is eligible otherwise None.
+            """
+        return await self._repository.get_random_game(players, exclude_recent)
+
+    def evict(self, game_id: int | None) -> None:
+        """Drop the cached entries of a game changed by another worker.
+
+            The title of the game is not known here, so all title lookups
+            are dropped together with the pages.
+
+            Args:
+                game_id (int | None): The id of the changed game, None to drop everything.
+            """
+        if game_id is None:
+            self._cache.clear()
+            return
+
+        self._cache.invalidate(("id", game_id))
+        self._cache.invalidate_where(lambda key: key[0] != "id")
+
+    def cache_stats(self) -> dict:
+        """Return the counters of the catalog cache.
+
+            Returns:
+                dict: The size, hit and miss counters.
+            """
+        return self._cache.stats()
@@ -6,6 +6,7 @@ from pydantic import UUID1
 
 from src.core.domain.comment import CommentBroker
 from src.infrastructure.dto.commentdto import CommentDTO
+from src.infrastructure.dto.pagedto import PageDTO
 
 
 class ICommentService(ABC):
@@ -23,14 +24,16 @@ class ICommentService(ABC):
         """
 
     @abstractmethod
-    async def get_by_session(self, session_id: int) -> Iterable[CommentDTO]:
-        """The abstract method getting comments for a session.
+    async def get_by_session(self, session_id: int, limit: int, cursor: str | None = None) -> PageDTO[CommentDTO]:
+        """The abstract method getting a page of comments for a session.
 
         Args:
             session_id (int): The session id.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[CommentDTO]: The comment collection.
+            PageDTO[CommentDTO]: The page of comments.
         """
 
     @abstractmethod
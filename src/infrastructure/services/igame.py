@@ -6,17 +6,22 @@ from pydantic import UUID1
 
 from src.core.domain.game import Game, GameIn, GameBroker
 from src.infrastructure.dto.gamedto import GameDTO
+from src.infrastructure.dto.pagedto import PageDTO
 
 
 class IGameService(ABC):
     """A class representing game service."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[GameDTO]:
-        """The method getting all games.
+    async def get_all(self, limit: int, cursor: str | None = None) -> PageDTO[GameDTO]:
+        """The method getting a page of games.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[GameDTO]: All games.
+            PageDTO[GameDTO]: The page of games.
         """
 
     @abstractmethod
@@ -30,6 +35,17 @@ class IGameService(ABC):
             GameDTO | None: The game details.
         """
 
+    @abstractmethod
+    async def get_by_name(self, game_name: str) -> GameDTO | None:
+        """The method getting game details by its title.
+
+        Args:
+            game_name (str): The title of the game.
+
+        Returns:
+            GameDTO | None: The game details.
+        """
+
     @abstractmethod
     async def get_by_admin(self, admin_id: UUID1) -> Iterable[GameDTO]:
         """The method getting games created by a particular admin.
@@ -77,9 +93,34 @@ class IGameService(ABC):
         """
 
     @abstractmethod
-    async def get_random_game(self) -> GameDTO | None:
+    async def get_random_game(
+        self,
+        players: int | None = None,
+        exclude_recent: int = 0,
+    ) -> GameDTO | None:
         """The method getting a random game
 
+            Args:
+                players (int | None, optional): The number of players the game must support.
+                exclude_recent (int, optional): The number of latest sessions whose
+                    games are excluded.
+
             Returns:
                 GameDTO | None: The game details.
         """
+
+    @abstractmethod
+    def evict(self, game_id: int | None) -> None:
+        """The method dropping the cached entries of a changed game.
+
+        Args:
+            game_id (int | None): The id of the changed game, None to drop everything.
+        """
+
+    @abstractmethod
+    def cache_stats(self) -> dict:
+        """The method returning the counters of the catalog cache.
+
+        Returns:
+            dict: The size, hit and miss counters.
+        """
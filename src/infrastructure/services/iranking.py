@@ -4,21 +4,24 @@ from abc import ABC, abstractmethod
 from typing import Iterable, Any
 from uuid import UUID
 
-from src.infrastructure.dto.rankingdto import RankingDTO
+from src.infrastructure.dto.pagedto import PageDTO
+from src.infrastructure.dto.rankingdto import RankingDTO, RebuildReportDTO
 
 
 class IRankingService(ABC):
     """An abstract class representing ranking service."""
 
     @abstractmethod
-    async def get_ranking_for_game(self, game_id: int) -> Iterable[RankingDTO]:
-        """The abstract getting ranking entries for a game.
+    async def get_ranking_for_game(self, game_id: int, limit: int, cursor: str | None = None) -> PageDTO[RankingDTO]:
+        """The abstract getting a page of ranking entries for a game.
 
         Args:
             game_id (int): The id of the game.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[RankingDTO]: The ranking collection.
+            PageDTO[RankingDTO]: The page of ranking entries.
         """
 
     @abstractmethod
@@ -45,4 +48,18 @@ class IRankingService(ABC):
             game_id (int): The id of the game.
             scores (dict[UUID1, int]): The dictionary of user ids and their scores.
             date (Any): The date of the session.
-        """
\ No newline at end of file
+        """
+
+    @abstractmethod
+    async def rebuild_rankings(self, concurrency: int) -> RebuildReportDTO:
+        """The abstract rebuilding all rankings from the stored sessions.
+
+        Args:
+            concurrency (int): The number of games processed at once.
+
+        Raises:
+            RebuildInProgressError: If another rebuild is running.
+
+        Returns:
+            RebuildReportDTO: The report of the rebuild.
+        """
@@ -1,8 +1,10 @@
 """Module containing session service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from datetime import datetime
+from typing import AsyncIterator, Iterable
 from src.core.domain.session import Session, SessionBroker
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.dto.sessiondto import SessionDTO
 
 
@@ -10,11 +12,26 @@ class ISessionService(ABC):
     """An abstract class representing session service."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[SessionDTO]:
-        """The abstract getting all sessions.
+    async def get_all(self, limit: int, cursor: str | None = None) -> PageDTO[SessionDTO]:
+        """The abstract getting a page of sessions.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
+
+        Returns:
+            PageDTO[SessionDTO]: The page of sessions.
+        """
+
+    @abstractmethod
+    def export(self, since: datetime | None = None) -> AsyncIterator[SessionDTO]:
+        """The abstract streaming the session history.
+
+        Args:
+            since (datetime | None): The lower bound of the session date.
 
         Returns:
-            Iterable[SessionDTO]: Collection of sessions.
+            AsyncIterator[SessionDTO]: The session stream.
         """
 
     @abstractmethod
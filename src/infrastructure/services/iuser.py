@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pydantic import UUID5
 
 from src.core.domain.user import UserLogin, UserIn
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.dto.tokendto import TokenDTO
 
@@ -35,6 +36,17 @@ class IUserService(ABC):
             TokenDTO | None: The token details.
         """
 
+    @abstractmethod
+    async def refresh_token(self, refresh_token: str) -> TokenDTO | None:
+        """The method exchanging a refresh token for a new token pair.
+
+        Args:
+            refresh_token (str): The refresh token issued earlier.
+
+        Returns:
+            TokenDTO | None: The new token details if the token was valid.
+        """
+
     @abstractmethod
     async def get_by_uuid(self, uuid: UUID5) -> UserDTO | None:
         """A method getting user by UUID.
@@ -46,6 +58,45 @@ class IUserService(ABC):
             UserDTO | None: The user data, if found.
         """
 
+    @abstractmethod
+    async def is_token_current(self, uuid: UUID5, version: int) -> bool:
+        """A method checking whether a token version has not been revoked.
+
+        Args:
+            uuid (UUID5): The UUID of the user.
+            version (int): The token version carried by the token.
+
+        Returns:
+            bool: True if the token is still valid.
+        """
+
+    @abstractmethod
+    async def revoke_tokens(self, uuid: UUID5) -> bool:
+        """A method revoking all tokens issued to a user.
+
+        Args:
+            uuid (UUID5): The UUID of the user.
+
+        Returns:
+            bool: True if the user exists.
+        """
+
+    @abstractmethod
+    async def purge_refresh_tokens(self) -> int:
+        """A method deleting the expired refresh tokens of all users.
+
+        Returns:
+            int: The number of tokens deleted.
+        """
+
+    @abstractmethod
+    def evict_token_version(self, uuid: str | None) -> None:
+        """A method dropping the cached token version of a user revoked elsewhere.
+
+        Args:
+            uuid (str | None): The UUID of the user, None to drop all versions.
+        """
+
     @abstractmethod
     async def get_by_email(self, email: str) -> UserDTO | None:
         """A method getting user by email.
@@ -58,9 +109,13 @@ class IUserService(ABC):
         """
 
     @abstractmethod
-    async def get_all_users(self) -> UserDTO | None:
-        """A method getting all users.
+    async def get_all_users(self, limit: int, cursor: str | None = None) -> PageDTO[UserDTO]:
+        """A method getting a page of users.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            UserDTO | None: The user data, if found.
+            PageDTO[UserDTO]: The page of users.
         """
\ No newline at end of file
@@ -4,7 +4,8 @@ from typing import Iterable, Any
 from uuid import UUID
 
 from src.core.repositories.iranking import IRankingRepository
-from src.infrastructure.dto.rankingdto import RankingDTO
+from src.infrastructure.dto.pagedto import PageDTO
+from src.infrastructure.dto.rankingdto import RankingDTO, RebuildReportDTO
 from src.infrastructure.services.iranking import IRankingService
 
 
@@ -21,16 +22,18 @@ class RankingService(IRankingService):
         """
         self._repository = repository
 
-    async def get_ranking_for_game(self, game_id: int) -> Iterable[RankingDTO]:
-        """The method getting ranking entries for a game.
+    async def get_ranking_for_game(self, game_id: int, limit: int, cursor: str | None = None) -> PageDTO[RankingDTO]:
+        """The method getting a page of ranking entries for a game.
 
         Args:
             game_id (int): The game id.
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[RankingDTO]: Collection of ranking entries.
+            PageDTO[RankingDTO]: A page of ranking entries.
         """
-        return await self._repository.get_ranking_for_game(game_id)
+        return await self._repository.get_ranking_for_game(game_id, limit, cursor)
 
     async def get_user_scores(self, user_id: UUID) -> Iterable[RankingDTO]:
         """The method getting ranking entries for a particular user.
@@ -51,19 +54,18 @@ class RankingService(IRankingService):
             scores (dict[UUID, int]): Dictionary mapping user IDs to their scores.
             date (Any): The date of the session.
         """
-        if not scores:
-            return
-
-        max_score = max(scores.values())
-        for user_id, score in scores.items():
-            is_winner = (score == max_score)
-
-            ranking_data = {
-                "user_id": user_id,
-                "game_id": game_id,
-                "score": score,
-                "win": is_winner,
-                "date": date
-            }
-
-            await self._repository.update_ranking(ranking_data)
\ No newline at end of file
+        await self._repository.update_rankings(game_id, scores, date)
+
+    async def rebuild_rankings(self, concurrency: int) -> RebuildReportDTO:
+        """The method rebuilding all rankings from the stored sessions.
+
+        Args:
+            concurrency (int): The number of games processed at once.
+
+        Raises:
+            RebuildInProgressError: If another rebuild is running.
+
+        Returns:
+            RebuildReportDTO: The report of the rebuild.
+        """
+        return await self._repository.rebuild_rankings(concurrency)
@@ -1,34 +1,48 @@
 """Module containing session service implementation."""
 
-from typing import Iterable
+from datetime import datetime
+from typing import AsyncIterator, Iterable
 from src.core.domain.session import Session, SessionBroker
 from src.core.repositories.isession import ISession
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.dto.sessiondto import SessionDTO
 from src.infrastructure.services.isession import ISessionService
-from src.infrastructure.services.iranking import IRankingService
 
 class SessionService(ISessionService):
     """A class implementing the session service."""
 
     _repository: ISession
-    _ranking_service: IRankingService
 
-    def __init__(self, repository: ISession, ranking_service: IRankingService) -> None:
+    def __init__(self, repository: ISession) -> None:
         """Initialize the SessionService.
 
             Args:
                 repository (ISession): The session repository instance.
         """
         self._repository = repository
-        self._ranking_service = ranking_service
 
-    async def get_all(self) -> Iterable[SessionDTO]:
-        """Retrieve history of all sessions.
+    async def get_all(self, limit: int, cursor: str | None = None) -> PageDTO[SessionDTO]:
+        """Retrieve a page of the session history.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[SessionDTO]: A list of all sessions sorted by date.
+            PageDTO[SessionDTO]: A page of sessions sorted by date.
         """
-        return await self._repository.get_all_sessions()
+        return await self._repository.get_all_sessions(limit, cursor)
+
+    def export(self, since: datetime | None = None) -> AsyncIterator[SessionDTO]:
+        """Stream the session history in chronological order.
+
+        Args:
+            since (datetime | None): The lower bound of the session date.
+
+        Returns:
+            AsyncIterator[SessionDTO]: The session stream.
+        """
+        return self._repository.iterate_sessions(since)
 
     async def get_by_id(self, session_id: int) -> SessionDTO | None:
         """Get session by id."""
@@ -41,6 +55,9 @@ class SessionService(ISessionService):
     async def add_session(self, data: SessionBroker) -> Session | None:
         """Add a new game session.
 
+            The rankings of all players are updated by the repository in the
+            same transaction.
+
             Args:
                 session_broker (SessionBroker): The broker object containing session details
                 and normalized dates.
@@ -48,14 +65,7 @@ class SessionService(ISessionService):
             Returns:
                 SessionDTO | None: The created session object.
             """
-        new_session = await self._repository.add_session(data)
-        if new_session:
-            await self._ranking_service.update_stats_after_session(
-                game_id=data.game_id,
-                scores=data.scores,
-                date=data.date_added
-            )
-        return new_session
+        return await self._repository.add_session(data)
 
     async def delete_session(self, session_id: int) -> bool:
         """Delete a session by its ID.
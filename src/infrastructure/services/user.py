@@ -1,22 +1,38 @@
 """A module containing user service."""
 from datetime import datetime
+from uuid import UUID
 
 from pydantic import UUID4
 
 from src.core.domain.user import UserIn, UserLogin
 from src.core.repositories.iuser import IUserRepository
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.services.iuser import IUserService
-from src.infrastructure.utils.password import verify_password, hash_password
-from src.infrastructure.utils.token import generate_user_token
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.password import verify_password_async, hash_password_async
+from src.infrastructure.utils.token import (
+    generate_refresh_token,
+    generate_user_token,
+    hash_refresh_token,
+)
 
 
 class UserService(IUserService):
     """An abstract class for user service."""
     _repository: IUserRepository
-    def __init__(self, repository: IUserRepository) -> None:
+    _token_versions: TTLCache
+
+    def __init__(self, repository: IUserRepository, token_versions: TTLCache) -> None:
+        """The initializer of the user service.
+
+        Args:
+            repository (IUserRepository): The reference to the repository.
+            token_versions (TTLCache): The shared cache of users' token versions.
+        """
         self._repository = repository
+        self._token_versions = token_versions
 
     async def register_user(self, user: UserIn) -> UserDTO | None:
         """A method registering a new user.
@@ -27,7 +43,7 @@ class UserService(IUserService):
             UserDTO | None: The user DTO model.
         """
 
-        hashed_pwd = hash_password(user.password)
+        hashed_pwd = await hash_password_async(user.password)
 
 
         user_data = {
@@ -49,11 +65,49 @@ class UserService(IUserService):
         """
 
         if user_data := await self._repository.get_by_email(user.email):
-            if verify_password(user.password, user_data["password"]):
-                token_details = generate_user_token(user_data["id"])
-                return TokenDTO(token_type="Bearer", **token_details)
+            if await verify_password_async(user.password, user_data["password"]):
+                token_details = generate_user_token(user_data)
+                refresh = generate_refresh_token()
+                await self._repository.add_refresh_token(
+                    user_data["id"],
+                    refresh["token_hash"],
+                    refresh["expires_at"],
+                )
+                return TokenDTO(
+                    token_type="Bearer",
+                    refresh_token=refresh["refresh_token"],
+                    **token_details,
+                )
         return None
 
+    async def refresh_token(self, refresh_token: str) -> TokenDTO | None:
+        """The method exchanging a refresh token for a new token pair.
+
+        The presented token is rotated: it is invalidated and a new one is
+        returned along with the access token.
+
+        Args:
+            refresh_token (str): The refresh token issued earlier.
+
+        Returns:
+            TokenDTO | None: The new token details if the token was valid.
+        """
+        refresh = generate_refresh_token()
+        user_data = await self._repository.rotate_refresh_token(
+            hash_refresh_token(refresh_token),
+            refresh["token_hash"],
+            refresh["expires_at"],
+        )
+        if not user_data:
+            return None
+
+        token_details = generate_user_token(user_data)
+        return TokenDTO(
+            token_type="Bearer",
+            refresh_token=refresh["refresh_token"],
+            **token_details,
+        )
+
     async def get_by_uuid(self, uuid: UUID4) -> UserDTO | None:
         """A method getting user by UUID.
 
@@ -65,6 +119,61 @@ class UserService(IUserService):
         """
 
         return await self._repository.get_by_uuid(uuid)
+    async def is_token_current(self, uuid: UUID4, version: int) -> bool:
+        """A method checking whether a token version has not been revoked.
+
+        The current version is cached for a short time, so most requests
+        are authorized without touching the database.
+
+        Args:
+            uuid (UUID4): The UUID of the user.
+            version (int): The token version carried by the token.
+
+        Returns:
+            bool: True if the token is still valid.
+        """
+        current = self._token_versions.get(uuid)
+        if current is None:
+            current = await self._repository.get_token_version(uuid)
+            if current is None:
+                return False
+            self._token_versions.set(uuid, current)
+        return current == version
+
+    async def revoke_tokens(self, uuid: UUID4) -> bool:
+        """A method revoking all tokens issued to a user.
+
+        Args:
+            uuid (UUID4): The UUID of the user.
+
+        Returns:
+            bool: True if the user exists.
+        """
+        version = await self._repository.bump_token_version(uuid)
+        if version is None:
+            return False
+        self._token_versions.set(uuid, version)
+        return True
+
+    async def purge_refresh_tokens(self) -> int:
+        """A method deleting the expired refresh tokens of all users.
+
+        Returns:
+            int: The number of tokens deleted.
+        """
+        return await self._repository.purge_refresh_tokens()
+
+    def evict_token_version(self, uuid: str | None) -> None:
+        """A method dropping the cached token version of a user revoked elsewhere.
+
+        Args:
+            uuid (str | None): The UUID of the user, None to drop all versions.
+        """
+        if uuid is None:
+            self._token_versions.clear()
+        else:
+            self._token_versions.invalidate(UUID(uuid))
+
     async def get_by_email(self, email: str) -> UserDTO | None:
         """A method getting user by email.
 
@@ -77,10 +186,14 @@ class UserService(IUserService):
         record = await self._repository.get_by_email(email)
         return UserDTO.from_record(record) if record else None
 
-    async def get_all_users(self) -> list[UserDTO]:
-        """The method getting all users.
+    async def get_all_users(self, limit: int, cursor: str | None = None) -> PageDTO[UserDTO]:
+        """The method getting a page of users.
+
+        Args:
+            limit (int): The page size.
+            cursor (str | None): The cursor of the page to fetch.
 
         Returns:
-            Iterable[UserDTO]: Collection of all users.
+            PageDTO[UserDTO]: A page of users.
         """
-        return await self._repository.get_all()
\ No newline at end of file
+        return await self._repository.get_all(limit, cursor)
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""A module containing the cross-worker cache invalidation bus."""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from typing import Any, Callable
+
+import asyncpg
+from sqlalchemy import Text, cast, func, literal, select
+from sqlalchemy.sql import ColumnElement, Select
+from sqlalchemy.sql.elements import Label
+
+from src.infrastructure.utils.consts import INVALIDATION_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+WORKER_ID = uuid.uuid4().hex
+
+Handler = Callable[[Any], None]
+
+
+def notify(topic: str, key: Any) -> Select:
+    """The function building a statement publishing a change event.
+
+    Executed inside a transaction the event is delivered on commit only,
+    so listeners never evict before the change is visible.
+
+    Args:
+        topic (str): The kind of the changed object, e.g. "game".
+        key (Any): The JSON-serializable identifier of the changed object.
+
+    Returns:
+        Select: The NOTIFY statement.
+    """
+    payload = json.dumps({"topic": topic, "key": key, "origin": WORKER_ID}, default=str)
+    return select(func.pg_notify(INVALIDATION_CHANNEL, payload))
+
+
+def notify_row(topic: str, key: ColumnElement) -> Label:
+    """The function building a column publishing a change event of a written row.
+
+    Selected from the rows returned by a write, e.g. `INSERT ... RETURNING`
+    in a CTE, it publishes the event in the statement making the change,
+    once per returned row, so no separate statement or transaction is
+    needed. The event is delivered on commit only.
+
+    Args:
+        topic (str): The kind of the changed object, e.g. "game".
+        key (ColumnElement): The column identifying the changed object.
+
+    Returns:
+        Label: The NOTIFY column, labelled "notified".
+    """
+    def text(value: str) -> ColumnElement:
+        return cast(literal(value), Text)
+
+    payload = func.json_build_object(
+        text("topic"), text(topic), text("key"), key, text("origin"), text(WORKER_ID)
+    )
+    return func.pg_notify(INVALIDATION_CHANNEL, cast(payload, Text)).label("notified")
+
+
+class InvalidationBus:
+    """A bus dispatching change events from other workers to local handlers.
+
+    Every worker holds one dedicated LISTEN connection. Events published by
+    the worker itself are skipped, as the writer evicts its caches directly,
+    unless a handler asks for them.
+
+    When the connection is lost, events may be missed, so all handlers are
+    called with `None`, meaning "drop everything", once it is re-established.
+    """
+
+    _handlers: dict[str, list[tuple[Handler, bool]]]
+    _connection: asyncpg.Connection | None
+    _task: asyncio.Task | None
+
+    def __init__(self, dsn: str, reconnect_delay: float = 1.0) -> None:
+        """The initializer of the bus.
+
+        Args:
+            dsn (str): The asyncpg connection string.
+            reconnect_delay (float, optional): The pause between reconnects in seconds.
+        """
+        self._dsn = dsn
+        self._reconnect_delay = reconnect_delay
+        self._handlers = defaultdict(list)
+        self._connection = None
+        self._task = None
+        self._lost = asyncio.Event()
+
+    def subscribe(self, topic: str, handler: Handler, own: bool = False) -> None:
+        """The method registering a handler of a topic.
+
+        Args:
+            topic (str): The topic to listen to.
+            handler (Handler): The callback receiving the changed key or None.
+            own (bool, optional): Whether the handler also receives the events
+                published by this worker.
+        """
+        self._handlers[topic].append((handler, own))
+
+    def dispatch(self, topic: str, key: Any, own: bool = False) -> None:
+        """The method calling the handlers of a topic.
+
+        Args:
+            topic (str): The topic of the event.
+            key (Any): The changed key or None to drop everything.
+            own (bool, optional): Whether the event was published by this worker.
+        """
+        for handler, wants_own in self._handlers.get(topic, ()):
+            if own and not wants_own:
+                continue
+            try:
+                handler(key)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Invalidation handler for %s failed", topic)
+
+    def _dispatch_all(self) -> None:
+        for topic in list(self._handlers):
+            self.dispatch(topic, None)
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Malformed invalidation event: %s", payload)
+            return
+
+        self.dispatch(event.get("topic"), event.get("key"), event.get("origin") == WORKER_ID)
+
+    def _on_termination(self, connection: Any) -> None:
+        self._lost.set()
+
+    async def _connect(self) -> None:
+        self._connection = await asyncpg.connect(self._dsn)
+        self._connection.add_termination_listener(self._on_termination)
+        await self._connection.add_listener(INVALIDATION_CHANNEL, self._on_notification)
+
+    async def _watch(self) -> None:
+        while True:
+            await self._lost.wait()
+            self._lost.clear()
+            while True:
+                try:
+                    await self._connect()
+                    break
+                except (OSError, asyncpg.PostgresError) as e:
+                    logger.warning("Invalidation bus reconnect failed: %s", e)
+                    await asyncio.sleep(self._reconnect_delay)
+            self._dispatch_all()
+
+    async def start(self) -> None:
+        """The method opening the LISTEN connection."""
+        await self._connect()
+        self._task = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        """The method closing the LISTEN connection."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self._connection and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
@@ -0,0 +1,132 @@
+"""A module containing an in-process cache with bounded size and expiry."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """A least-recently-used cache whose entries expire after a fixed time.
+
+    A read-through caller takes the `generation` of a key before reading
+    the value from its source and passes it to `set`. An invalidation
+    during the read changes the generation, so the value read before it
+    is not stored. Single keys have their own counters, up to `maxsize` of
+    them; invalidations of many keys bump an epoch shared by all of them.
+    """
+
+    _entries: OrderedDict
+    _generations: dict
+    _epoch: int
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """The initializer of the cache.
+
+        Args:
+            maxsize (int): The maximum number of entries kept.
+            ttl (float): The lifetime of an entry in seconds.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """The method getting a live entry from the cache.
+
+        Args:
+            key (Hashable): The entry key.
+            default (Any, optional): The value returned on a miss.
+
+        Returns:
+            Any: The cached value or `default`.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        return default
+
+    def generation(self, key: Hashable) -> tuple[int, int]:
+        """The method returning the generation of a key, changed by its invalidation.
+
+        Args:
+            key (Hashable): The entry key.
+
+        Returns:
+            tuple[int, int]: The epoch and the invalidation count of the key.
+        """
+        return self._epoch, self._generations.get(key, 0)
+
+    def set(self, key: Hashable, value: Any, generation: tuple[int, int] | None = None) -> None:
+        """The method storing an entry, evicting the least recently used one if full.
+
+        Args:
+            key (Hashable): The entry key.
+            value (Any): The value to cache.
+            generation (tuple[int, int] | None, optional): The generation of
+                the key taken before the value was read. The value is not
+                stored if the key was invalidated since.
+        """
+        if generation is not None and generation != self.generation(key):
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """The method removing a single entry.
+
+        Args:
+            key (Hashable): The entry key.
+        """
+        self._entries.pop(key, None)
+        if len(self._generations) >= self._maxsize:
+            self._next_epoch()
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """The method removing all entries whose key matches a predicate.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): The key filter.
+        """
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+        self._next_epoch()
+
+    def clear(self) -> None:
+        """The method removing all entries."""
+        self._entries.clear()
+        self._next_epoch()
+
+    def _next_epoch(self) -> None:
+        """The method changing the generation of every key.
+
+        Keys being read may not be cached yet, so an invalidation of many
+        keys cannot tell which ones it covers. The per-key counters are
+        reset, as the epoch already differs from every generation taken.
+        """
+        self._epoch += 1
+        self._generations.clear()
+
+    def stats(self) -> dict:
+        """The method returning the cache counters.
+
+        Returns:
+            dict: The size, hit and miss counters.
+        """
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -1,5 +1,18 @@
 """A module containing constant values for infrastructure layer."""
 
 EXPIRATION_MINUTES = 60
+REFRESH_EXPIRATION_DAYS = 30
 SECRET_KEY = "s3cr3t"
-ALGORITHM = "HS256"
\ No newline at end of file
+ALGORITHM = "HS256"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+EXPORT_CHUNK_ROWS = 200
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+GAMES_CACHE_CONTROL = "public, max-age=30"
+RANKING_CACHE_CONTROL = "public, no-cache"
+COMMENTS_CACHE_CONTROL = "public, no-cache"
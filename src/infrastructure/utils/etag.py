@@ -0,0 +1,156 @@
+"""A module containing the resource versions used to build ETags."""
+
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from sqlalchemy import Text, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import Insert, array, insert
+from sqlalchemy.sql import ColumnElement
+
+from src.db import database, resource_version_table
+
+
+def version_bump(*resources: str | ColumnElement) -> Insert:
+    """The function building a statement marking resources as changed.
+
+    Added as a CTE to a write, it bumps the shared versions in the statement
+    making the change, so the new ETags are current as soon as it commits,
+    in every worker. A resource given as a column, e.g. built from the rows
+    returned by the write, is bumped once per distinct value.
+
+    Args:
+        *resources (str | ColumnElement): The names of the changed resources.
+
+    Returns:
+        Insert: The upsert of the versions.
+    """
+    names = [cast(literal(name), Text) if isinstance(name, str) else name for name in resources]
+    changed = select(func.unnest(array(names)).label("resource")).distinct().subquery("changed")
+    statement = insert(resource_version_table).from_select(
+        ["resource", "version"],
+        select(changed.c.resource, literal(1)),
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[resource_version_table.c.resource],
+        set_={"version": resource_version_table.c.version + 1},
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """The function checking an `If-None-Match` header against an ETag.
+
+    Args:
+        if_none_match (str | None): The header value sent by the client.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        bool: Whether the client's representation is still current.
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+class ResourceVersions(ABC):
+    """A registry of the versions of cacheable resources.
+
+    A resource is named by a string such as "games" or "ranking:7".
+    """
+
+    @abstractmethod
+    async def etag(self, resource: str) -> str:
+        """The method returning the current strong ETag of a resource.
+
+        Args:
+            resource (str): The resource name.
+
+        Returns:
+            str: The quoted ETag.
+        """
+
+
+class DatabaseResourceVersions(ResourceVersions):
+    """The resource versions stored in the database.
+
+    Versions are bumped by `version_bump` in the writes changing the
+    resources and read for every request, so all workers send the same
+    ETag for the same data and a change is visible once committed.
+    """
+
+    async def etag(self, resource: str) -> str:
+        """The method returning the current strong ETag of a resource.
+
+        Args:
+            resource (str): The resource name.
+
+        Returns:
+            str: The quoted ETag, based on version 0 for a resource never changed.
+        """
+        query = select(resource_version_table.c.version).where(
+            resource_version_table.c.resource == resource
+        )
+        return f'"{await database.fetch_val(query) or 0}"'
+
+
+class InMemoryResourceVersions(ResourceVersions):
+    """A registry of in-process version counters of the in-memory backend.
+
+    The counters are bumped by the handlers of the change events, which the
+    in-memory repositories dispatch synchronously. The ETag combines a
+    per-process epoch, a generation bumped when every resource may have
+    changed, and the resource's own counter.
+    """
+
+    _versions: dict[str, int]
+
+    def __init__(self) -> None:
+        """The initializer of the registry."""
+        self._epoch = uuid.uuid4().hex[:12]
+        self._generation = 0
+        self._versions = {}
+
+    def bump(self, resource: str) -> None:
+        """The method marking a resource as changed.
+
+        Args:
+            resource (str): The resource name.
+        """
+        self._versions[resource] = self._versions.get(resource, 0) + 1
+
+    def bump_all(self) -> None:
+        """The method marking all resources as changed."""
+        self._generation += 1
+        self._versions.clear()
+
+    async def etag(self, resource: str) -> str:
+        """The method returning the current strong ETag of a resource.
+
+        Args:
+            resource (str): The resource name.
+
+        Returns:
+            str: The quoted ETag.
+        """
+        return f'"{self._epoch}-{self._generation}-{self._versions.get(resource, 0)}"'
+
+    def invalidator(self, template: str) -> Callable[[Any], None]:
+        """The method building a bus handler bumping the resource of an event.
+
+        Args:
+            template (str): The resource name, formatted with the event `key`.
+
+        Returns:
+            Callable[[Any], None]: The handler.
+        """
+        def invalidate(key: Any) -> None:
+            if key is None:
+                self.bump_all()
+            else:
+                self.bump(template.format(key=key))
+
+        return invalidate
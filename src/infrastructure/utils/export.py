@@ -0,0 +1,73 @@
+"""A module containing helper functions for streaming session exports."""
+
+import csv
+import io
+import json
+from typing import AsyncIterator
+
+from src.infrastructure.dto.sessiondto import SessionDTO
+
+CSV_COLUMNS = ["id", "game_id", "user_id", "date", "date_added", "note", "winner_id", "scores"]
+
+
+async def ndjson_chunks(sessions: AsyncIterator[SessionDTO], chunk_rows: int) -> AsyncIterator[str]:
+    """A function encoding a session stream as newline-delimited JSON.
+
+    Args:
+        sessions (AsyncIterator[SessionDTO]): The session stream.
+        chunk_rows (int): The number of rows written per chunk.
+
+    Yields:
+        str: The consecutive chunks of the export.
+    """
+    buffer = []
+    async for session in sessions:
+        buffer.append(session.model_dump_json())
+        if len(buffer) >= chunk_rows:
+            yield "\n".join(buffer) + "\n"
+            buffer.clear()
+
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+async def csv_chunks(sessions: AsyncIterator[SessionDTO], chunk_rows: int) -> AsyncIterator[str]:
+    """A function encoding a session stream as CSV with a header row.
+
+    Scores are written as a JSON object in a single column.
+
+    Args:
+        sessions (AsyncIterator[SessionDTO]): The session stream.
+        chunk_rows (int): The number of rows written per chunk.
+
+    Yields:
+        str: The consecutive chunks of the export.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue()
+
+    rows = 0
+    buffer.seek(0)
+    buffer.truncate()
+    async for session in sessions:
+        writer.writerow([
+            session.id,
+            session.game_id,
+            session.user_id,
+            session.date.isoformat(),
+            session.date_added.isoformat(),
+            session.note or "",
+            session.winner_id or "",
+            json.dumps({str(player): score for player, score in session.scores.items()}),
+        ])
+        rows += 1
+        if rows >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+
+    if rows:
+        yield buffer.getvalue()
@@ -0,0 +1,197 @@
+"""A module containing the database query instrumentation."""
+
+import json
+import logging
+import re
+import time
+from bisect import bisect_left
+from contextvars import ContextVar, Token
+from functools import lru_cache
+
+from src.config import config
+
+slow_query_log = logging.getLogger("src.db.slow_queries")
+
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+OVERFLOW_SHAPE = "<other>"
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|(?<![\w$])\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def statement_shape(statement: str) -> str:
+    """The function normalizing a statement to the shape its latency is tracked under.
+
+    Parameters are already positional, literals inlined into a statement
+    (e.g. a VALUES list) are replaced with `?`.
+
+    Args:
+        statement (str): The SQL sent to the server.
+
+    Returns:
+        str: The statement shape.
+    """
+    return _LITERALS.sub("?", _WHITESPACE.sub(" ", statement).strip())
+
+
+class LatencyHistogram:
+    """A cumulative latency histogram with fixed millisecond buckets."""
+
+    __slots__ = ("counts", "count", "total_ms")
+
+    def __init__(self) -> None:
+        """The initializer of the histogram."""
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        """The method recording a single latency.
+
+        Args:
+            duration_ms (float): The latency in milliseconds.
+        """
+        self.counts[bisect_left(BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+
+
+class QueryMetrics:
+    """Latency histograms of the statement shapes executed by this process."""
+
+    _histograms: dict[str, LatencyHistogram]
+
+    def __init__(self, max_shapes: int) -> None:
+        """The initializer of the registry.
+
+        Args:
+            max_shapes (int): The number of shapes tracked separately, the
+                rest is aggregated under one shape.
+        """
+        self._max_shapes = max_shapes
+        self._histograms = {}
+
+    def observe(self, shape: str, duration_ms: float) -> None:
+        """The method recording the latency of a statement.
+
+        Args:
+            shape (str): The statement shape.
+            duration_ms (float): The latency in milliseconds.
+        """
+        histogram = self._histograms.get(shape)
+        if histogram is None:
+            if len(self._histograms) >= self._max_shapes:
+                shape = OVERFLOW_SHAPE
+            histogram = self._histograms.setdefault(shape, LatencyHistogram())
+        histogram.observe(duration_ms)
+
+    def snapshot(self) -> dict[str, LatencyHistogram]:
+        """The method returning the histograms by shape.
+
+        Returns:
+            dict[str, LatencyHistogram]: The live histograms.
+        """
+        return dict(self._histograms)
+
+
+class RequestQueryStats:
+    """The database usage of a single request."""
+
+    __slots__ = ("path", "count", "total_ms", "slowest_ms", "slowest")
+
+    def __init__(self, path: str) -> None:
+        """The initializer of the stats.
+
+        Args:
+            path (str): The request path.
+        """
+        self.path = path
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest: str | None = None
+
+    def add(self, shape: str, duration_ms: float) -> None:
+        """The method recording a statement run for the request.
+
+        Args:
+            shape (str): The statement shape.
+            duration_ms (float): The latency in milliseconds.
+        """
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms >= self.slowest_ms:
+            self.slowest_ms = duration_ms
+            self.slowest = shape
+
+    def server_timing(self) -> str:
+        """The method formatting the stats as a `Server-Timing` header value.
+
+        Returns:
+            str: The header value.
+        """
+        return (
+            f'db;dur={self.total_ms:.2f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest_ms:.2f}"
+        )
+
+
+query_metrics = QueryMetrics(config.DB_QUERY_SHAPES_MAX)
+_request_stats: ContextVar[RequestQueryStats | None] = ContextVar("request_stats", default=None)
+
+
+def begin_request(path: str) -> tuple[RequestQueryStats, Token]:
+    """The function starting to collect the statements of a request.
+
+    Args:
+        path (str): The request path.
+
+    Returns:
+        tuple[RequestQueryStats, Token]: The stats and the token restoring the context.
+    """
+    stats = RequestQueryStats(path)
+    return stats, _request_stats.set(stats)
+
+
+def end_request(stats: RequestQueryStats, token: Token) -> None:
+    """The function finishing a request, logging it if its database time was slow.
+
+    Args:
+        stats (RequestQueryStats): The stats of the request.
+        token (Token): The token returned by `begin_request`.
+    """
+    _request_stats.reset(token)
+    if stats.total_ms >= config.DB_SLOW_QUERY_MS:
+        slow_query_log.warning(json.dumps({
+            "event": "slow_request",
+            "path": stats.path,
+            "queries": stats.count,
+            "db_ms": round(stats.total_ms, 2),
+            "slowest_ms": round(stats.slowest_ms, 2),
+            "slowest": stats.slowest,
+        }))
+
+
+def record_query(statement: str, started: float) -> None:
+    """The function recording a finished statement.
+
+    Args:
+        statement (str): The SQL sent to the server.
+        started (float): The `time.perf_counter()` value when it was sent.
+    """
+    duration_ms = (time.perf_counter() - started) * 1000
+    shape = statement_shape(statement)
+    query_metrics.observe(shape, duration_ms)
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.add(shape, duration_ms)
+
+    if duration_ms >= config.DB_SLOW_QUERY_MS:
+        slow_query_log.warning(json.dumps({
+            "event": "slow_query",
+            "path": stats.path if stats else None,
+            "duration_ms": round(duration_ms, 2),
+            "statement": shape,
+        }))
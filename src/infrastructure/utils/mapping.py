@@ -0,0 +1,62 @@
+"""A module containing mappers building DTOs from trusted database rows."""
+
+from operator import itemgetter
+from typing import Any, Callable, Mapping, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+def record_mapper(
+    model: type[M],
+    columns: Mapping[str, str],
+    converters: Mapping[str, Callable[[Any], Any]] | None = None,
+) -> Callable[[Any], M]:
+    """The function compiling a mapper of rows to DTOs of a model.
+
+    The rows come from our own typed schema, so the DTOs are not validated.
+    They are set up the way `model_construct` does it, without its per-call
+    bookkeeping. Values are read from the driver row behind a `databases`
+    record, skipping its per-column type lookup, which is a no-op for the
+    PostgreSQL types we use. Values whose database type differs from the
+    field type must be given a converter. Every DTO gets its own copy of
+    the fields set, which pydantic adds to when a field is assigned.
+
+    Args:
+        model (type[M]): The DTO class.
+        columns (Mapping[str, str]): The column of each DTO field, covering all fields.
+        converters (Mapping[str, Callable[[Any], Any]] | None, optional): The
+            functions converting the values of particular fields.
+
+    Raises:
+        ValueError: If the columns do not cover exactly the fields of the model.
+
+    Returns:
+        Callable[[Any], M]: The mapper taking a record.
+    """
+    if set(columns) != set(model.model_fields):
+        raise ValueError(f"Columns of {model.__name__} must cover exactly its fields")
+
+    fields = tuple(columns)
+    fields_set = set(fields)
+    getter = itemgetter(*columns.values())
+    conversions = tuple((converters or {}).items())
+
+    def map_record(record: Any) -> M:
+        values = dict(zip(fields, getter(getattr(record, "_mapping", record))))
+        for field, convert in conversions:
+            values[field] = convert(values[field])
+
+        dto = _new(model)
+        _set(dto, "__dict__", values)
+        _set(dto, "__pydantic_fields_set__", fields_set.copy())
+        _set(dto, "__pydantic_extra__", None)
+        _set(dto, "__pydantic_private__", None)
+        return dto
+
+    return map_record
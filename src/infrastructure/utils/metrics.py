@@ -0,0 +1,185 @@
+"""A module containing process metrics in the Prometheus text format."""
+
+import asyncio
+from typing import Iterable
+
+from src.infrastructure.utils.instrumentation import BUCKETS_MS, LatencyHistogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RequestMetrics:
+    """Request counters and latency histograms by route template."""
+
+    _counts: dict[tuple[str, str, int], int]
+    _latencies: dict[tuple[str, str], LatencyHistogram]
+
+    def __init__(self) -> None:
+        """The initializer of the registry."""
+        self._counts = {}
+        self._latencies = {}
+
+    def observe(self, method: str, route: str, status: int, duration_ms: float) -> None:
+        """The method recording a finished request.
+
+        Args:
+            method (str): The HTTP method.
+            route (str): The path template of the matched route.
+            status (int): The response status code.
+            duration_ms (float): The time spent in the application in milliseconds.
+        """
+        key = (method, route, status)
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+        histogram = self._latencies.get((method, route))
+        if histogram is None:
+            histogram = self._latencies.setdefault((method, route), LatencyHistogram())
+        histogram.observe(duration_ms)
+
+    def counts(self) -> dict[tuple[str, str, int], int]:
+        """The method returning the request counts.
+
+        Returns:
+            dict[tuple[str, str, int], int]: The counts by method, route and status.
+        """
+        return dict(self._counts)
+
+    def latencies(self) -> dict[tuple[str, str], LatencyHistogram]:
+        """The method returning the latency histograms.
+
+        Returns:
+            dict[tuple[str, str], LatencyHistogram]: The live histograms by method and route.
+        """
+        return dict(self._latencies)
+
+
+class LoopLagMonitor:
+    """A task measuring how late the event loop wakes up a sleeping coroutine."""
+
+    lag: float
+    max_lag: float
+
+    def __init__(self, interval: float) -> None:
+        """The initializer of the monitor.
+
+        Args:
+            interval (float): The sleep between two measurements in seconds.
+        """
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self._interval)
+            self.lag = max(loop.time() - started - self._interval, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+
+    def start(self) -> None:
+        """The method starting the measurements."""
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """The method stopping the measurements."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, object]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class MetricsWriter:
+    """A builder of a Prometheus text exposition."""
+
+    _lines: list[str]
+
+    def __init__(self) -> None:
+        """The initializer of the writer."""
+        self._lines = []
+
+    def header(self, name: str, kind: str, help_text: str) -> None:
+        """The method starting a metric family.
+
+        Args:
+            name (str): The metric name.
+            kind (str): The metric type, e.g. "counter".
+            help_text (str): The description of the metric.
+        """
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, **labels: object) -> None:
+        """The method adding a sample.
+
+        Args:
+            name (str): The metric name.
+            value (float): The sample value.
+            **labels (object): The sample labels.
+        """
+        self._lines.append(f"{name}{_labels(labels)} {value}")
+
+    def histogram(self, name: str, histogram: LatencyHistogram, **labels: object) -> None:
+        """The method adding the samples of a millisecond histogram in seconds.
+
+        Args:
+            name (str): The metric name.
+            histogram (LatencyHistogram): The histogram.
+            **labels (object): The histogram labels.
+        """
+        cumulative = 0
+        for bound, count in zip(BUCKETS_MS, histogram.counts):
+            cumulative += count
+            self.sample(f"{name}_bucket", cumulative, **labels, le=bound / 1000)
+        self.sample(f"{name}_bucket", histogram.count, **labels, le="+Inf")
+        self.sample(f"{name}_sum", histogram.total_ms / 1000, **labels)
+        self.sample(f"{name}_count", histogram.count, **labels)
+
+    def render(self) -> str:
+        """The method returning the exposition text.
+
+        Returns:
+            str: The metrics in the Prometheus text format.
+        """
+        return "\n".join(self._lines) + "\n"
+
+
+def write_requests(writer: MetricsWriter, metrics: RequestMetrics) -> None:
+    """The function adding the request metrics to an exposition.
+
+    Args:
+        writer (MetricsWriter): The exposition.
+        metrics (RequestMetrics): The request metrics.
+    """
+    writer.header("http_requests_total", "counter", "Requests by route template and status.")
+    for (method, route, status), count in metrics.counts().items():
+        writer.sample("http_requests_total", count, method=method, route=route, status=status)
+
+    writer.header("http_request_duration_seconds", "histogram", "Request latency by route template.")
+    for (method, route), histogram in metrics.latencies().items():
+        writer.histogram("http_request_duration_seconds", histogram, method=method, route=route)
+
+
+def write_queries(writer: MetricsWriter, histograms: Iterable[tuple[str, LatencyHistogram]]) -> None:
+    """The function adding the statement latencies to an exposition.
+
+    Args:
+        writer (MetricsWriter): The exposition.
+        histograms (Iterable[tuple[str, LatencyHistogram]]): The histograms by statement shape.
+    """
+    writer.header("db_query_duration_seconds", "histogram", "Statement latency by statement shape.")
+    for shape, histogram in histograms:
+        writer.histogram("db_query_duration_seconds", histogram, statement=shape)
+
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,110 @@
+"""A module containing helper functions for keyset pagination."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+
+from src.infrastructure.dto.pagedto import PageDTO
+
+
+class InvalidCursorError(ValueError):
+    """An exception raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """A function encoding sort key values into an opaque cursor.
+
+    Args:
+        *values (Any): The sort key values of the last returned row.
+
+    Returns:
+        str: The URL-safe cursor token.
+    """
+    serialized = [
+        value.isoformat() if isinstance(value, datetime)
+        else str(value) if isinstance(value, UUID)
+        else value
+        for value in values
+    ]
+    raw = json.dumps(serialized, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """A function decoding a cursor into typed sort key values.
+
+    Args:
+        cursor (str): The cursor token received from the client.
+        *types (Callable): Converters applied to the consecutive values,
+            e.g. `int` or `datetime.fromisoformat`.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+
+    Returns:
+        tuple: The decoded sort key values.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise InvalidCursorError("Invalid cursor")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def keyset_query(
+    query: Select,
+    columns: Sequence[Any],
+    after: tuple | None,
+    limit: int,
+    descending: bool = False,
+) -> Select:
+    """A function applying keyset ordering, bound and limit to a query.
+
+    One row more than `limit` is requested so that the presence of a next
+    page can be detected without an extra count query.
+
+    Args:
+        query (Select): The base query.
+        columns (Sequence[Any]): The sort columns, the last one being unique.
+        after (tuple | None): The decoded cursor values, if any.
+        limit (int): The page size.
+        descending (bool, optional): The sort direction. Defaults to False.
+
+    Returns:
+        Select: The paginated query.
+    """
+    if after is not None:
+        key = tuple_(*columns)
+        query = query.where(key < tuple_(*after) if descending else key > tuple_(*after))
+
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    return query.order_by(*ordering).limit(limit + 1)
+
+
+def build_page(
+    records: Sequence[Any],
+    limit: int,
+    key: Callable[[Any], tuple],
+    mapper: Callable[[Any], Any],
+) -> PageDTO:
+    """A function building a page out of records fetched by `keyset_query`.
+
+    Args:
+        records (Sequence[Any]): The fetched records (up to `limit + 1`).
+        limit (int): The page size.
+        key (Callable): A function returning the sort key of a record.
+        mapper (Callable): A function mapping a record to a DTO.
+
+    Returns:
+        PageDTO: The page with items and the cursor of the next page.
+    """
+    items = records[:limit]
+    next_cursor = encode_cursor(*key(items[-1])) if len(records) > limit else None
+    return PageDTO(items=[mapper(record) for record in items], next_cursor=next_cursor)
@@ -1,10 +1,24 @@
 """A module containing password helper methods."""
 
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
 
 from passlib.context import CryptContext
 
+from src.config import config
+
 pwd_context = CryptContext(schemes=["bcrypt"])
 
+_executor: Executor | None = None
+_pending = 0
+_pending_lock = threading.Lock()
+
+
+class PasswordQueueFullError(Exception):
+    """An exception raised when too many password operations are pending."""
+
 
 def hash_password(password: str) -> str:
     """A function generating has password.
@@ -27,4 +41,107 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches the hash, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _get_executor() -> Executor:
+    """A function returning the password worker pool, creating it on first use.
+
+    Returns:
+        Executor: The configured thread or process pool.
+    """
+    global _executor
+    if _executor is None:
+        if config.PASSWORD_POOL_KIND == "process":
+            _executor = ProcessPoolExecutor(max_workers=config.PASSWORD_POOL_WORKERS)
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.PASSWORD_POOL_WORKERS,
+                thread_name_prefix="password",
+            )
+    return _executor
+
+
+def _release_slot(future: Future | None) -> None:
+    """A function freeing the queue slot of a finished password operation.
+
+    Args:
+        future (Future | None): The finished operation, None if it never started.
+    """
+    global _pending
+    with _pending_lock:
+        _pending -= 1
+
+
+async def _run_in_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """A function running a password operation in the worker pool.
+
+    The queue slot is freed when the operation finishes in the pool, not
+    when the caller stops waiting, so the operations of cancelled requests
+    still count against the queue while they keep a worker busy.
+
+    Args:
+        func (Callable): The blocking function to run.
+        *args (Any): The function arguments.
+
+    Raises:
+        PasswordQueueFullError: If the pool and its queue are saturated.
+
+    Returns:
+        Any: The result of the function.
+    """
+    global _pending
+    with _pending_lock:
+        if _pending >= config.PASSWORD_POOL_WORKERS + config.PASSWORD_QUEUE_SIZE:
+            raise PasswordQueueFullError("Too many pending password operations")
+        _pending += 1
+
+    try:
+        future = _get_executor().submit(func, *args)
+    except BaseException:
+        _release_slot(None)
+        raise
+    future.add_done_callback(_release_slot)
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(password: str) -> str:
+    """A function hashing a password without blocking the event loop.
+
+    Args:
+        password (str): A raw form of the password.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await _run_in_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """A function verifying a password without blocking the event loop.
+
+    Args:
+        plain_password (str): The raw password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise.
+    """
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+
+def queue_depth() -> int:
+    """A function returning the number of password operations waiting for a worker.
+
+    Returns:
+        int: The current queue depth.
+    """
+    return max(_pending - config.PASSWORD_POOL_WORKERS, 0)
+
+
+def shutdown_password_pool() -> None:
+    """A function stopping the password worker pool."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,179 @@
+"""A module containing an in-process sampler for picking random games."""
+
+import random
+from typing import Callable, Container
+
+from src.infrastructure.dto.gamedto import GameDTO
+
+MAX_BUCKETED_PLAYERS = 32
+
+
+class IdPool:
+    """A set of ids supporting constant-time insertion, removal and sampling."""
+
+    _ids: list[int]
+    _positions: dict[int, int]
+
+    def __init__(self) -> None:
+        """The initializer of the pool."""
+        self._ids = []
+        self._positions = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._positions
+
+    def add(self, item_id: int) -> None:
+        """The method adding an id to the pool.
+
+        Args:
+            item_id (int): The id to add.
+        """
+        if item_id not in self._positions:
+            self._positions[item_id] = len(self._ids)
+            self._ids.append(item_id)
+
+    def discard(self, item_id: int) -> None:
+        """The method removing an id by swapping it with the last one.
+
+        Args:
+            item_id (int): The id to remove.
+        """
+        position = self._positions.pop(item_id, None)
+        if position is None:
+            return
+
+        last = self._ids.pop()
+        if last != item_id:
+            self._ids[position] = last
+            self._positions[last] = position
+
+    def choice(
+        self,
+        exclude: Container[int] = (),
+        eligible: Callable[[int], bool] | None = None,
+        attempts: int = 8,
+    ) -> int | None:
+        """The method picking a random id which is not excluded.
+
+        Rejection sampling is tried first, so the cost does not depend on the
+        pool size unless most of the pool is excluded.
+
+        Args:
+            exclude (Container[int], optional): The ids which must not be picked.
+            eligible (Callable[[int], bool] | None, optional): The predicate
+                the picked id must satisfy, if any.
+            attempts (int, optional): The number of rejection sampling tries.
+
+        Returns:
+            int | None: The picked id or None if no id is eligible.
+        """
+        if not self._ids:
+            return None
+
+        def accepted(item_id: int) -> bool:
+            return item_id not in exclude and (eligible is None or eligible(item_id))
+
+        for _ in range(attempts):
+            item_id = random.choice(self._ids)
+            if accepted(item_id):
+                return item_id
+
+        candidates = [item_id for item_id in self._ids if accepted(item_id)]
+        return random.choice(candidates) if candidates else None
+
+
+class GameSampler:
+    """A sampler of games bucketed by the supported player counts.
+
+    The games are kept whole, so a pick needs no lookup. Player counts up
+    to `MAX_BUCKETED_PLAYERS` have a bucket each; games supporting more
+    players are also kept in one pool whose ranges are checked at draw
+    time, so a game costs at most that many bucket entries however wide
+    its range is.
+    """
+
+    _all: IdPool
+    _by_players: dict[int, IdPool]
+    _large: IdPool
+    _games: dict[int, GameDTO]
+
+    def __init__(self) -> None:
+        """The initializer of the sampler."""
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def clear(self) -> None:
+        """The method removing all games from the sampler."""
+        self._all = IdPool()
+        self._by_players = {}
+        self._large = IdPool()
+        self._games = {}
+
+    @staticmethod
+    def _buckets(game: GameDTO) -> range:
+        return range(max(game.min_players, 1), min(game.max_players, MAX_BUCKETED_PLAYERS) + 1)
+
+    def add(self, game: GameDTO) -> None:
+        """The method adding or replacing a game.
+
+        Args:
+            game (GameDTO): The game.
+        """
+        self.discard(game.id)
+        self._all.add(game.id)
+        self._games[game.id] = game
+        for players in self._buckets(game):
+            self._by_players.setdefault(players, IdPool()).add(game.id)
+        if game.max_players > MAX_BUCKETED_PLAYERS:
+            self._large.add(game.id)
+
+    def discard(self, game_id: int) -> None:
+        """The method removing a game.
+
+        Args:
+            game_id (int): The game id.
+        """
+        game = self._games.pop(game_id, None)
+        if game is None:
+            return
+
+        self._all.discard(game_id)
+        self._large.discard(game_id)
+        for players in self._buckets(game):
+            pool = self._by_players.get(players)
+            if pool is not None:
+                pool.discard(game_id)
+                if not pool:
+                    del self._by_players[players]
+
+    def choice(
+        self,
+        players: int | None = None,
+        exclude: Container[int] = (),
+    ) -> GameDTO | None:
+        """The method picking a random game.
+
+        Args:
+            players (int | None, optional): The number of players the game must support.
+            exclude (Container[int], optional): The game ids which must not be picked.
+
+        Returns:
+            GameDTO | None: The picked game or None if no game is eligible.
+        """
+        if players is None:
+            game_id = self._all.choice(exclude)
+        elif players <= MAX_BUCKETED_PLAYERS:
+            pool = self._by_players.get(players)
+            game_id = pool.choice(exclude) if pool else None
+        else:
+            def supports(game_id: int) -> bool:
+                game = self._games[game_id]
+                return game.min_players <= players <= game.max_players
+
+            game_id = self._large.choice(exclude, supports)
+        return self._games[game_id] if game_id is not None else None
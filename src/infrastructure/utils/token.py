@@ -1,16 +1,74 @@
 """A module containing helper functions for token generation."""
 
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from jose import jwt
-from pydantic import UUID1
 
-from src.infrastructure.utils.consts import (EXPIRATION_MINUTES, ALGORITHM, SECRET_KEY)
+from src.infrastructure.utils.consts import (
+    EXPIRATION_MINUTES,
+    REFRESH_EXPIRATION_DAYS,
+    ALGORITHM,
+    SECRET_KEY,
+)
 
 
-def generate_user_token(user_uuid: UUID1) -> dict:
-    """A function returning JWT token for user."""
+def generate_user_token(user: Any) -> dict:
+    """A function returning JWT token for user.
+
+    The token carries the claims needed to authorize requests (nick,
+    e-mail, admin flag and token version), so no user lookup is needed
+    when it is presented.
+
+    Args:
+        user (Any): The user record or DTO-like mapping.
+
+    Returns:
+        dict: The token details.
+    """
     expire = datetime.now(timezone.utc) + timedelta(minutes=EXPIRATION_MINUTES)
-    jwt_data = {"sub": str(user_uuid), "exp": expire, "type": "access"}
+    jwt_data = {
+        "sub": str(user["id"]),
+        "email": user["email"],
+        "nick": user["nick"],
+        "is_admin": bool(user["is_admin"]),
+        "registration_date": user["registration_date"].isoformat(),
+        "ver": user["token_version"],
+        "exp": expire,
+        "type": "access",
+    }
     encoded_jwt = jwt.encode(jwt_data, key=SECRET_KEY, algorithm=ALGORITHM)
-    return {"access_token": encoded_jwt, "expires": expire}
\ No newline at end of file
+    return {"access_token": encoded_jwt, "expires": expire}
+
+
+def hash_refresh_token(token: str) -> str:
+    """A function computing the keyed hash under which a refresh token is stored.
+
+    Refresh tokens are long random strings, so a keyed HMAC is sufficient
+    and costs microseconds, unlike a password hash.
+
+    Args:
+        token (str): The raw refresh token.
+
+    Returns:
+        str: The hex digest of the token.
+    """
+    return hmac.new(SECRET_KEY.encode(), token.encode(), hashlib.sha256).hexdigest()
+
+
+def generate_refresh_token() -> dict:
+    """A function returning a new random refresh token.
+
+    Returns:
+        dict: The raw token, its hash and its (naive UTC) expiration date.
+    """
+    token = secrets.token_urlsafe(32)
+    expire = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=REFRESH_EXPIRATION_DAYS)
+    return {
+        "refresh_token": token,
+        "token_hash": hash_refresh_token(token),
+        "expires_at": expire,
+    }
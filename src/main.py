@@ -1,9 +1,8 @@
 """Main module for the application."""
 
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 
 from src.api.routers.games import router as game_router
 from src.api.routers.session import router as session_router
@@ -11,117 +10,33 @@ from src.api.routers.rankings import router as ranking_router
 from src.api.routers.comments import router as comment_router
 from src.api.routers.auth import router as auth_router
 from src.api.routers.user import router as user_router
+from src.api.routers.metrics import router as metrics_router
+from src.api.routers.health import router as health_router
+from src.api.middleware import QueryTimingMiddleware, RequestMetricsMiddleware
+from src.config import config
 from src.container import Container
-from src.db import init_db, database
-from src.core.domain.user import UserIn
-from src.core.domain.game import GameIn
-from src.core.domain.session import SessionBroker
-from src.core.domain.comment import CommentBroker
-
-async def seed_data(container: Container):
-    """Creates initial data"""
-    print("Seeding initial data")
-    user_service = container.user_service()
-    game_service = container.game_service()
-    session_service = container.session_service()
-    comment_service = container.comment_service()
-    admin_email = "admin@test.com"
-    admin = await user_service.get_by_email(admin_email)
-    if not admin:
-        print(f"admin: {admin_email}")
-        admin = await user_service.register_user(UserIn(
-            email=admin_email,
-            password="admin",
-            nick="SuperAdmin",
-            is_admin=True
-        ))
-    marek_email = "marek@test.com"
-    marek = await user_service.get_by_email(marek_email)
-    if not marek:
-        print(f"Creating user: {marek_email}")
-        marek = await user_service.register_user(UserIn(
-            email=marek_email,
-            password="user1",
-            nick="Marek",
-            is_admin=False
-        ))
-    jarek_email = "jarek@test.com"
-    jarek = await user_service.get_by_email(jarek_email)
-    if not jarek:
-        print(f"Creating user: {jarek_email}")
-        jarek = await user_service.register_user(UserIn(
-            email=jarek_email,
-            password="user2",
-            nick="Jarek",
-            is_admin=False
-        ))
-    all_games = await game_service.get_all()
-    catan = next((g for g in all_games if g.title == "Catan"), None)
-
-    if not catan and admin:
-        print("Creating game: Catan")
-        catan = await game_service.create_game(GameIn(
-            title="Catan",
-            description="Osadnicy z Catanu",
-            min_players=3,
-            max_players=4,
-            rules_url="http://catan.com"
-        ), admin.id)
-    elif catan:
-        print(f"   Game found: Catan (ID: {catan.id})")
-
-    carcassonne = next((g for g in all_games if g.title == "Nemesis"), None)
-    if not carcassonne and admin:
-        print("Creating game: Nemesis")
-        await game_service.create_game(GameIn(
-            title="Nemesis",
-            description="kooperacyjna gra o kosmitach",
-            min_players=2,
-            max_players=5,
-            rules_url="http://nemesis.com"
-        ), admin.id)
-    seed_session = None
-    if catan and marek and jarek:
-        seed_note = "SEED_SESSION_DEMO"
-        all_sessions = await session_service.get_all()
-        seed_session = next((s for s in all_sessions if s.note == seed_note), None)
-        if not seed_session:
-            print(f"Creating seed session for Game ID {catan.id}...")
-            session_data = SessionBroker(
-                game_id=catan.id,
-                date=datetime(2026, 1, 8, 12, 0, 0, tzinfo=None),
-                note=seed_note,
-                participants=[marek.id, jarek.id],
-                winner_id=marek.id,
-                scores={marek.id: 10, jarek.id: 8},
-                user_id=admin.id,
-                date_added=datetime.now(timezone.utc).replace(tzinfo=None)
-            )
-            seed_session = await session_service.add_session(session_data)
-
-    if seed_session and marek and jarek:
-        existing_comments = await comment_service.get_by_session(seed_session.id)
-        if not existing_comments:
-            print(f"Adding comments to session {seed_session.id}...")
-            await comment_service.add_comment(CommentBroker(
-                session_id=seed_session.id,
-                user_id=marek.id,
-                content="komentarz 1"
-            ))
-            await comment_service.add_comment(CommentBroker(
-                session_id=seed_session.id,
-                user_id=jarek.id,
-                content="komentarz 2"
-            ))
+from src.cli import seed_data
+from src.db import PoolTimeoutError, connect_db, database
+from src.infrastructure.utils.password import PasswordQueueFullError, shutdown_password_pool
+from src.migrations import migrate
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Context manager for application lifespan."""
-    await init_db()
-    await database.connect()
+    """Context manager for application lifespan.
+
+    The startup only connects: pending migrations are applied when
+    `DB_MIGRATE` is set and the data is seeded by `python -m src.cli seed`.
+    The in-memory backend starts empty in every process, so it is seeded here.
+    """
+    uses_database = config.REPOSITORY_BACKEND == "postgres"
+    if uses_database:
+        await connect_db()
+        if config.DB_MIGRATE:
+            await migrate()
 
     container = Container()
+    app.state.container = container
     container.wire(modules=[
         "src.api.routers.games",
         "src.api.routers.session",
@@ -129,22 +44,65 @@ async def lifespan(app: FastAPI):
         "src.api.routers.comments",
         "src.api.routers.auth",
         "src.api.routers.user",
+        "src.api.routers.metrics",
         "src.api.dependencies",
     ])
 
-    await seed_data(container)
+    bus = container.invalidation_bus()
+    bus.subscribe("game", lambda key: container.game_service().evict(key))
+    bus.subscribe("game", container.game_repository().expire_sampler)
+    bus.subscribe("user", lambda key: container.user_service().evict_token_version(key))
+    if uses_database:
+        await bus.start()
+    else:
+        versions = container.resource_versions()
+        bus.subscribe("game", versions.invalidator("games"), own=True)
+        bus.subscribe("game", versions.invalidator("ranking:{key}"), own=True)
+        bus.subscribe("ranking", versions.invalidator("ranking:{key}"), own=True)
+        bus.subscribe("comment", versions.invalidator("comments:{key}"), own=True)
+    loop_lag = container.loop_lag_monitor()
+    loop_lag.start()
+
+    if not uses_database:
+        await seed_data(container)
 
     yield
 
+    loop_lag.stop()
+    await bus.stop()
     await database.disconnect()
+    shutdown_password_pool()
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(QueryTimingMiddleware)
+app.add_middleware(RequestMetricsMiddleware)
 container = Container()
 
+
+@app.exception_handler(PasswordQueueFullError)
+async def password_queue_full_handler(request: Request, exc: PasswordQueueFullError) -> JSONResponse:
+    """Reject password operations while the hashing pool is saturated."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication is temporarily overloaded, retry later"},
+        headers={"Retry-After": "1"},
+    )
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError) -> JSONResponse:
+    """Reject requests which could not get a database connection in time."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database is temporarily overloaded, retry later"},
+        headers={"Retry-After": "1"},
+    )
+
 app.include_router(game_router, prefix="/games", tags=["Games"])
 app.include_router(session_router, prefix="/sessions", tags=["Sessions"])
 app.include_router(ranking_router, prefix="/rankings", tags=["Rankings"])
 app.include_router(comment_router, prefix="/comments", tags=["Comments"])
 app.include_router(auth_router, prefix="/auth", tags=["Auth"])
-app.include_router(user_router, prefix="/users", tags=["Users"])
\ No newline at end of file
+app.include_router(user_router, prefix="/users", tags=["Users"])
+app.include_router(metrics_router)
+app.include_router(health_router)
\ No newline at end of file
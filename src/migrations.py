@@ -0,0 +1,287 @@
+"""A module containing the versioned schema migrations of BoardGame API.
+
+Migrations are applied in the order of their versions and recorded in the
+`schema_migrations` table. Their statements are built from the metadata
+in `src.db`, so a column or an index is declared once. A change to the
+metadata is released with a new migration, never by editing an applied one.
+
+Indexes are built with `CREATE INDEX CONCURRENTLY`, which does not block
+writes to the table but cannot run in a transaction. Migrations building
+them are therefore not transactional, and every step is idempotent, so an
+interrupted migration is completed by running it again.
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+
+import sqlalchemy
+from databases.core import Connection
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateColumn, CreateIndex, CreateTable
+
+from src.db import (
+    comment_table,
+    database,
+    game_table,
+    migration_table,
+    ranking_table,
+    refresh_token_table,
+    resource_version_table,
+    session_score_table,
+    session_table,
+    user_table,
+)
+
+MIGRATION_LOCK_ID = 0x626761
+MIGRATION_LOCK_POLL = 0.5
+
+Step = Callable[[Connection], Awaitable[None]]
+
+
+def create_table(table: sqlalchemy.Table) -> Step:
+    """The function building a step creating a table without its indexes.
+
+    Args:
+        table (sqlalchemy.Table): The table declared in the metadata.
+
+    Returns:
+        Step: The step creating the table unless it exists.
+    """
+    async def step(connection: Connection) -> None:
+        await connection.execute(CreateTable(table, if_not_exists=True))
+
+    return step
+
+
+def add_column(column: sqlalchemy.Column) -> Step:
+    """The function building a step adding a column to an existing table.
+
+    Args:
+        column (sqlalchemy.Column): The column declared in the metadata.
+
+    Returns:
+        Step: The step adding the column unless it exists.
+    """
+    definition = CreateColumn(column).compile(dialect=postgresql.dialect())
+    statement = f"ALTER TABLE {column.table.name} ADD COLUMN IF NOT EXISTS {definition}"
+
+    async def step(connection: Connection) -> None:
+        await connection.execute(sqlalchemy.text(statement))
+
+    return step
+
+
+def create_index(table: sqlalchemy.Table, name: str) -> Step:
+    """The function building a step creating an index without blocking writes.
+
+    A concurrent build which failed leaves an invalid index behind, which
+    is dropped and built again.
+
+    Args:
+        table (sqlalchemy.Table): The table declared in the metadata.
+        name (str): The name of the index declared on the table.
+
+    Raises:
+        ValueError: If the table declares no index of that name.
+
+    Returns:
+        Step: The step creating the index unless a valid one exists.
+    """
+    index = next((index for index in table.indexes if index.name == name), None)
+    if index is None:
+        raise ValueError(f"Table {table.name} declares no index {name}")
+    if not index.dialect_options["postgresql"]["concurrently"]:
+        raise ValueError(f"Index {name} is not built concurrently")
+
+    async def step(connection: Connection) -> None:
+        invalid = await connection.fetch_val(
+            "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)",
+            {"name": name},
+        )
+        if invalid:
+            await connection.execute(sqlalchemy.text(f"DROP INDEX CONCURRENTLY {name}"))
+        await connection.execute(CreateIndex(index, if_not_exists=True))
+
+    return step
+
+
+def drop_index(name: str) -> Step:
+    """The function building a step dropping an index without blocking writes.
+
+    Args:
+        name (str): The name of the index no longer declared.
+
+    Returns:
+        Step: The step dropping the index if it exists.
+    """
+    async def step(connection: Connection) -> None:
+        await connection.execute(sqlalchemy.text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+    return step
+
+
+def execute(statement: sqlalchemy.Executable) -> Step:
+    """The function building a step executing a statement.
+
+    Args:
+        statement (sqlalchemy.Executable): The idempotent statement.
+
+    Returns:
+        Step: The step executing the statement.
+    """
+    async def step(connection: Connection) -> None:
+        await connection.execute(statement)
+
+    return step
+
+
+class Migration:
+    """A class representing a version of the schema."""
+
+    version: int
+    description: str
+    steps: list[Step]
+    transactional: bool
+
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        steps: list[Step],
+        transactional: bool = True,
+    ) -> None:
+        """The initializer of the migration.
+
+        Args:
+            version (int): The version the migration brings the schema to.
+            description (str): The description recorded with the version.
+            steps (list[Step]): The steps applied in order.
+            transactional (bool, optional): Whether the steps and the record
+                are applied in one transaction. Defaults to True.
+        """
+        self.version = version
+        self.description = description
+        self.steps = steps
+        self.transactional = transactional
+
+    async def apply(self, connection: Connection) -> None:
+        """The method applying the steps and recording the version.
+
+        Args:
+            connection (Connection): The connection holding the migration lock.
+        """
+        for step in self.steps:
+            await step(connection)
+        await connection.execute(
+            migration_table.insert().values(version=self.version, description=self.description)
+        )
+
+
+MIGRATIONS = [
+    Migration(1, "Create the initial tables", [
+        create_table(user_table),
+        create_table(game_table),
+        create_table(session_table),
+        create_table(session_score_table),
+        create_table(ranking_table),
+        create_table(comment_table),
+    ]),
+    Migration(2, "Add token versions and refresh tokens", [
+        add_column(user_table.c.token_version),
+        create_table(refresh_token_table),
+    ]),
+    Migration(3, "Add the total score of rankings", [
+        add_column(ranking_table.c.total_score),
+        execute(
+            ranking_table.update()
+            .where(ranking_table.c.total_score == 0, ranking_table.c.games_played > 0)
+            .values(total_score=sqlalchemy.func.round(
+                ranking_table.c.average_score * ranking_table.c.games_played
+            ))
+        ),
+    ]),
+    Migration(4, "Add the lookup and keyset pagination indexes", [
+        # ix_users_nick_id was built here, migration 6 drops it.
+        create_index(refresh_token_table, "ix_refresh_tokens_user_id"),
+        create_index(game_table, "ix_games_title_id"),
+        create_index(game_table, "ix_games_admin_id"),
+        create_index(session_table, "ix_sessions_date_id"),
+        create_index(session_table, "ix_sessions_created_by_date"),
+        create_index(session_table, "ix_sessions_game_id"),
+        create_index(session_score_table, "ix_session_scores_session_id"),
+        create_index(session_score_table, "ix_session_scores_user_id"),
+        create_index(ranking_table, "ix_rankings_game_wins_id"),
+        create_index(ranking_table, "ix_rankings_wins_id"),
+        create_index(comment_table, "ix_comments_session_created_id"),
+        create_index(comment_table, "ix_comments_user_id"),
+    ], transactional=False),
+    Migration(5, "Add the shared versions of cacheable resources", [
+        create_table(resource_version_table),
+    ]),
+    Migration(6, "Index the session winners and drop the duplicate index of nicks", [
+        create_index(session_table, "ix_sessions_winner_id"),
+        drop_index("ix_users_nick_id"),
+    ], transactional=False),
+]
+
+
+async def migrate(target: int | None = None) -> list[int]:
+    """Function applying the pending migrations.
+
+    Workers migrating together serialize on an advisory lock held by one
+    connection for the whole run, so each version is applied only once
+    and the others find it recorded. The lock is polled rather than waited
+    for: a concurrent index build waits for every running statement, the
+    waiting one included, which would deadlock.
+
+    Args:
+        target (int | None, optional): The last version to apply.
+            Defaults to the latest one.
+
+    Returns:
+        list[int]: The versions applied by this call.
+    """
+    applied = []
+    async with database.connection() as connection:
+        lock = sqlalchemy.select(sqlalchemy.func.pg_try_advisory_lock(MIGRATION_LOCK_ID))
+        while not await connection.fetch_val(lock):
+            await asyncio.sleep(MIGRATION_LOCK_POLL)
+        try:
+            await connection.execute(CreateTable(migration_table, if_not_exists=True))
+            rows = await connection.fetch_all(sqlalchemy.select(migration_table.c.version))
+            recorded = {row["version"] for row in rows}
+            for migration in MIGRATIONS:
+                if migration.version in recorded:
+                    continue
+                if target is not None and migration.version > target:
+                    break
+
+                print(f"Applying migration {migration.version}: {migration.description}")
+                if migration.transactional:
+                    async with connection.transaction():
+                        await migration.apply(connection)
+                else:
+                    await migration.apply(connection)
+                applied.append(migration.version)
+        finally:
+            await connection.execute(
+                sqlalchemy.select(sqlalchemy.func.pg_advisory_unlock(MIGRATION_LOCK_ID))
+            )
+
+    return applied
+
+
+async def pending_migrations() -> list[Migration]:
+    """Function listing the migrations not applied yet.
+
+    Returns:
+        list[Migration]: The pending migrations in the order of their versions.
+    """
+    if not await database.fetch_val(sqlalchemy.select(
+        sqlalchemy.func.to_regclass(migration_table.name).is_not(None)
+    )):
+        return list(MIGRATIONS)
+
+    rows = await database.fetch_all(sqlalchemy.select(migration_table.c.version))
+    recorded = {row["version"] for row in rows}
+    return [migration for migration in MIGRATIONS if migration.version not in recorded]
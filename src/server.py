@@ -0,0 +1,103 @@
+"""Module containing the production entrypoint of the application.
+
+Serves the app with uvicorn in `SERVER_WORKERS` processes (one per CPU
+when 0), on the uvloop event loop and the httptools parser when they are
+installed. The keep-alive outlives the idle timeout of common load
+balancers, so they do not reuse a connection the worker is closing.
+
+Pending migrations are applied once, by the supervisor before the
+workers start, when `DB_MIGRATE` is set; workers then only connect. On
+SIGTERM every worker stops accepting connections and serves the requests
+in flight for up to `SERVER_GRACEFUL_TIMEOUT` seconds, so the container
+stop timeout should be longer.
+
+Every worker has its own connection pool, so the database must accept
+`SERVER_WORKERS * DB_POOL_MAX_SIZE` connections.
+
+Usage:
+    python -m src.server
+
+For development, `uvicorn src.main:app --reload` runs a single process
+restarted on code changes.
+"""
+
+import asyncio
+import os
+from importlib.util import find_spec
+
+import uvicorn
+
+from src.config import config
+from src.db import connect_db, database
+from src.migrations import migrate
+
+
+def event_loop() -> str:
+    """Return the fastest event loop available.
+
+    Returns:
+        str: The uvicorn name of the event loop implementation.
+    """
+    return "uvloop" if find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    """Return the fastest HTTP parser available.
+
+    Returns:
+        str: The uvicorn name of the HTTP implementation.
+    """
+    return "httptools" if find_spec("httptools") else "h11"
+
+
+def worker_count() -> int:
+    """Return the number of worker processes to run.
+
+    Raises:
+        ValueError: If several workers would not share the in-memory backend.
+
+    Returns:
+        int: The configured count, or the number of CPUs if it is 0.
+    """
+    workers = config.SERVER_WORKERS or os.cpu_count() or 1
+    if config.REPOSITORY_BACKEND == "memory" and workers > 1:
+        raise ValueError("The memory backend is process-local, set SERVER_WORKERS=1")
+    return workers
+
+
+async def prepare() -> None:
+    """Apply the pending migrations before the workers start."""
+    await connect_db()
+    try:
+        await migrate()
+    finally:
+        await database.disconnect()
+
+
+def main() -> None:
+    """Prepare the database and serve the app until terminated."""
+    workers = worker_count()
+    if config.REPOSITORY_BACKEND == "postgres" and config.DB_MIGRATE:
+        asyncio.run(prepare())
+        os.environ["DB_MIGRATE"] = "false"
+
+    uvicorn.run(
+        "src.main:app",
+        host=config.SERVER_HOST,
+        port=config.SERVER_PORT,
+        workers=workers,
+        loop=event_loop(),
+        http=http_protocol(),
+        backlog=config.SERVER_BACKLOG,
+        timeout_keep_alive=config.SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=config.SERVER_GRACEFUL_TIMEOUT,
+        limit_concurrency=config.SERVER_LIMIT_CONCURRENCY,
+        access_log=config.SERVER_ACCESS_LOG,
+        proxy_headers=True,
+        forwarded_allow_ips=config.SERVER_FORWARDED_ALLOW_IPS,
+        lifespan="on",
+    )
+
+
+if __name__ == "__main__":
+    main()